@@ -0,0 +1,22 @@
+"""add resume derived data
+
+Revision ID: 003
+Revises: 002
+Create Date: 2026-10-17 10:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = '003'
+down_revision = '002'
+branch_labels = None
+depends_on = None
+
+def upgrade() -> None:
+    # Per-section content hashes and derived artifacts of each resume
+    op.add_column('resume', sa.Column('derived', sa.JSON(), nullable=True))
+
+def downgrade() -> None:
+    op.drop_column('resume', 'derived')
@@ -6,7 +6,6 @@ from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, B
 from fastapi.responses import FileResponse
 from sqlalchemy.orm import Session
 import tempfile
-import os
 import json
 
 from app.api import deps
@@ -15,9 +14,20 @@ from app.models.resume import Resume
 from app.models.job_description import JobDescription
 from app.models.cover_letter import CoverLetter
 from app.models.skills_gap_analysis import SkillsGapAnalysis
+from app.services.openai.client import OpenAIRateLimitError
 from app.services.openai.cover_letter_generator import generate_cover_letter_with_openai, CoverLetterGenerationError
 from app.services.openai.skills_gap_analyzer import analyze_skills_gap_with_openai, incorporate_user_skills_with_openai, SkillsGapAnalysisError
-from app.services.resume_parser import parse_resume
+from app.services.resume_parser import (
+    parse_resume_upload,
+    ResumeParseError,
+    ParseLimitError,
+    ParseQueueFullError,
+    ParseServiceUnavailableError,
+    ParseTimeoutError,
+    UnsupportedFormatError,
+    refresh_derived,
+)
+from app.services.upload_ingest import ingest_upload
 from app.services.document_generator import generate_document_pdf, generate_document_docx
 
 router = APIRouter()
@@ -92,24 +102,31 @@ async def generate_cover_letter_upload(
     Generate a cover letter based on an uploaded resume and job description text.
     """
     try:
-        # Parse resume
-        resume_content = await resume_file.read()
-        file_extension = os.path.splitext(resume_file.filename)[1].lower()
-        
-        with tempfile.NamedTemporaryFile(delete=False, suffix=file_extension) as temp_file:
-            temp_file.write(resume_content)
-            temp_path = temp_file.name
-        
+        # Stream the upload in and parse it in the parse executor
         try:
-            resume_data = parse_resume(temp_path)
-        finally:
-            os.unlink(temp_path)
+            with await ingest_upload(resume_file) as upload:
+                resume_data = await parse_resume_upload(upload)
+        except ParseLimitError as e:
+            raise HTTPException(status_code=413, detail=str(e))
+        except UnsupportedFormatError as e:
+            raise HTTPException(status_code=415, detail=str(e))
+        except ParseQueueFullError as e:
+            raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+        except ParseTimeoutError as e:
+            raise HTTPException(status_code=504, detail=e.to_dict())
+        except ParseServiceUnavailableError as e:
+            raise HTTPException(status_code=502, detail=str(e))
+        except ResumeParseError as e:
+            raise HTTPException(status_code=400, detail=str(e))
         
         # Save resume to database
+        content, derived = refresh_derived(resume_data)
         resume = Resume(
             user_id=current_user.id,
-            filename=resume_file.filename,
-            parsed_data=resume_data
+            title=resume_file.filename,
+            content=content,
+            derived=derived,
+            original_file_path=resume_file.filename
         )
         db.add(resume)
         db.commit()
@@ -150,6 +167,11 @@ async def generate_cover_letter_upload(
             "id": cover_letter.id,
             "cover_letter_data": cover_letter_data
         }
+    except HTTPException:
+        raise
+    except OpenAIRateLimitError:
+        # Handled by the API as 503 Service Unavailable
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
@@ -285,5 +307,8 @@ async def add_user_skills(
             "id": optimized_resume.id,
             "optimized_data": updated_resume_data
         }
+    except OpenAIRateLimitError:
+        # Handled by the API as 503 Service Unavailable
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
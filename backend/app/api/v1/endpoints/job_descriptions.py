@@ -5,7 +5,7 @@ from sqlalchemy.orm import Session
 from app import crud, schemas
 from app.api import deps
 from app.models.user import User
-from app.services.jd_analyzer import analyze_job_description
+from app.services.jd_analyzer import analyze_job_description, JDAnalysisError
 
 router = APIRouter()
 
@@ -71,8 +71,11 @@ async def analyze_jd(
             detail="Insufficient credits. Please purchase more credits to continue."
         )
     
-    # Analyze the job description
-    analysis_result = await analyze_job_description(jd_text)
+    # Analyze the job description; no credit is charged if it fails entirely
+    try:
+        analysis_result = await analyze_job_description(jd_text)
+    except JDAnalysisError as e:
+        raise HTTPException(status_code=502, detail=str(e))
     
     # Deduct credits
     current_user.credits -= 1
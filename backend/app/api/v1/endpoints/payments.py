@@ -1,6 +1,5 @@
 from fastapi import APIRouter, Depends, HTTPException, Request
 from sqlalchemy.orm import Session
-import stripe
 from typing import Dict, Any
 
 from app.core.config import settings
@@ -10,14 +9,21 @@ from app.schemas.payment import PaymentVerification
 
 router = APIRouter()
 
-# Initialize Stripe with your secret key
-stripe.api_key = settings.STRIPE_SECRET_KEY
+def get_stripe():
+    """
+    Import and configure Stripe on first use; the SDK is slow to import, so
+    it is kept off the API startup path.
+    """
+    import stripe
+    stripe.api_key = settings.STRIPE_SECRET_KEY
+    return stripe
 
 @router.post("/webhook")
 async def stripe_webhook(request: Request, db: Session = Depends(deps.get_db)):
     """
     Handle Stripe webhook events
     """
+    stripe = get_stripe()
     payload = await request.body()
     sig_header = request.headers.get("Stripe-Signature")
 
@@ -53,6 +59,7 @@ async def create_checkout_session(
     """
     Create a Stripe checkout session
     """
+    stripe = get_stripe()
     try:
         checkout_session = stripe.checkout.Session.create(
             payment_method_types=["card"],
@@ -88,6 +95,7 @@ async def verify_payment(
     """
     Verify a payment and add credits to user's account
     """
+    stripe = get_stripe()
     try:
         session = stripe.checkout.Session.retrieve(payment.session_id)
         if session.payment_status == "paid":
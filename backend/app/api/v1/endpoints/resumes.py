@@ -1,14 +1,34 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File
+from typing import Any, Dict, List
+from fastapi import APIRouter, Body, Depends, HTTPException, UploadFile, File
 from sqlalchemy.orm import Session
 
 from app import crud, schemas
 from app.api import deps
 from app.models.user import User
-from app.services.resume_parser import parse_resume_file
+from app.services.resume_parser import (
+    parse_resume_upload,
+    refresh_current_dates,
+    refresh_derived,
+    ResumeParseError,
+    ParseLimitError,
+    ParseQueueFullError,
+    ParseServiceUnavailableError,
+    ParseTimeoutError,
+    UnsupportedFormatError,
+)
+from app.services.upload_ingest import ingest_upload
+from cvparser.derived import match_keywords
 
 router = APIRouter()
 
+def _with_current_dates(db: Session, resume: Any) -> Any:
+    """Bring a stored resume's current-role durations up to this month, saving them if they changed."""
+    refreshed = refresh_current_dates(resume.content or {}, resume.derived)
+    if refreshed is None:
+        return resume
+    content, derived = refreshed
+    return crud.resume.update(db=db, db_obj=resume, obj_in={"content": content, "derived": derived})
+
 @router.get("/", response_model=List[schemas.Resume])
 def read_resumes(
     db: Session = Depends(deps.get_db),
@@ -22,7 +42,7 @@ def read_resumes(
     resumes = crud.resume.get_multi_by_user(
         db=db, user_id=current_user.id, skip=skip, limit=limit
     )
-    return resumes
+    return [_with_current_dates(db, resume) for resume in resumes]
 
 @router.post("/", response_model=schemas.Resume)
 def create_resume(
@@ -34,6 +54,8 @@ def create_resume(
     """
     Create new resume.
     """
+    content, derived = refresh_derived(resume_in.content)
+    resume_in = resume_in.model_copy(update={"content": content, "derived": derived})
     resume = crud.resume.create_with_user(
         db=db, obj_in=resume_in, user_id=current_user.id
     )
@@ -49,13 +71,21 @@ def update_resume(
 ) -> Any:
     """
     Update a resume.
+    
+    Derived data (entry dates, timeline, skills, keywords) is recomputed
+    only for the sections whose content changed.
     """
     resume = crud.resume.get(db=db, id=id)
     if not resume:
         raise HTTPException(status_code=404, detail="Resume not found")
     if not crud.user.is_superuser(current_user) and (resume.user_id != current_user.id):
         raise HTTPException(status_code=400, detail="Not enough permissions")
-    resume = crud.resume.update(db=db, db_obj=resume, obj_in=resume_in)
+    update_data = resume_in.model_dump(exclude_unset=True)
+    if "content" in update_data:
+        update_data["content"], update_data["derived"] = refresh_derived(
+            update_data["content"], resume.derived
+        )
+    resume = crud.resume.update(db=db, db_obj=resume, obj_in=update_data)
     return resume
 
 @router.get("/{id}", response_model=schemas.Resume)
@@ -73,7 +103,29 @@ def read_resume(
         raise HTTPException(status_code=404, detail="Resume not found")
     if not crud.user.is_superuser(current_user) and (resume.user_id != current_user.id):
         raise HTTPException(status_code=400, detail="Not enough permissions")
-    return resume
+    return _with_current_dates(db, resume)
+
+@router.post("/{id}/keyword-matches", response_model=Dict[str, List[str]])
+def match_resume_keywords(
+    *,
+    db: Session = Depends(deps.get_db),
+    id: int,
+    keywords: List[str] = Body(..., embed=True),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Find keywords, such as those of a job description, in each section of a resume.
+    """
+    resume = crud.resume.get(db=db, id=id)
+    if not resume:
+        raise HTTPException(status_code=404, detail="Resume not found")
+    if not crud.user.is_superuser(current_user) and (resume.user_id != current_user.id):
+        raise HTTPException(status_code=400, detail="Not enough permissions")
+    derived = resume.derived
+    if derived is None:
+        # Stored before derived data was kept
+        _, derived = refresh_derived(resume.content or {})
+    return match_keywords(derived or {}, keywords)
 
 @router.delete("/{id}", response_model=schemas.Resume)
 def delete_resume(
@@ -103,13 +155,29 @@ async def upload_resume(
     """
     Upload and parse a resume file.
     """
-    # Parse the resume file
-    resume_data = await parse_resume_file(file)
-    
+    # Stream the upload in and parse it
+    try:
+        with await ingest_upload(file) as upload:
+            resume_data = await parse_resume_upload(upload)
+    except ParseLimitError as e:
+        raise HTTPException(status_code=413, detail=str(e))
+    except UnsupportedFormatError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    except ParseQueueFullError as e:
+        raise HTTPException(status_code=503, detail=str(e), headers={"Retry-After": "5"})
+    except ParseTimeoutError as e:
+        raise HTTPException(status_code=504, detail=e.to_dict())
+    except ParseServiceUnavailableError as e:
+        raise HTTPException(status_code=502, detail=str(e))
+    except ResumeParseError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     # Create resume object
+    content, derived = refresh_derived(resume_data)
     resume_in = schemas.ResumeCreate(
         title=file.filename,
-        content=resume_data.get("content", ""),
+        content=content,
+        derived=derived,
         original_file_path=file.filename,
         user_id=current_user.id
     )
@@ -1,6 +1,7 @@
 import re
 from typing import List, Optional
 import os
+import tempfile
 from pydantic_settings import BaseSettings
 from pydantic import field_validator
 
@@ -73,11 +74,102 @@ class Settings(BaseSettings):
 
     # OpenAI
     OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "your-openai-api-key")
+    # The process-wide OpenAI client's connection pool: most connections
+    # open at once, idle connections kept alive and for how many seconds
+    OPENAI_MAX_CONNECTIONS: int = int(os.getenv("OPENAI_MAX_CONNECTIONS", "100"))
+    OPENAI_KEEPALIVE_CONNECTIONS: int = int(os.getenv("OPENAI_KEEPALIVE_CONNECTIONS", "20"))
+    OPENAI_KEEPALIVE_EXPIRY: float = float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", "60"))
+    # Seconds to wait for a response and for a connection to open
+    OPENAI_TIMEOUT: float = float(os.getenv("OPENAI_TIMEOUT", "120"))
+    OPENAI_CONNECT_TIMEOUT: float = float(os.getenv("OPENAI_CONNECT_TIMEOUT", "10"))
+    # Retries of throttled (429) and failed requests, with jittered backoff
+    # from LLM_BACKOFF_BASE_SECONDS up to LLM_BACKOFF_MAX_SECONDS
+    OPENAI_MAX_RETRIES: int = int(os.getenv("OPENAI_MAX_RETRIES", "3"))
+    LLM_BACKOFF_BASE_SECONDS: float = float(os.getenv("LLM_BACKOFF_BASE_SECONDS", "1"))
+    LLM_BACKOFF_MAX_SECONDS: float = float(os.getenv("LLM_BACKOFF_MAX_SECONDS", "30"))
+    # Per-model budgets of requests and tokens per minute, as
+    # model=requests:tokens pairs; other models get the defaults
+    LLM_RATE_LIMITS: str = os.getenv(
+        "LLM_RATE_LIMITS", "gpt-4=500:30000,gpt-3.5-turbo=3500:160000,text-embedding-ada-002=3000:1000000"
+    )
+    LLM_DEFAULT_RPM: int = int(os.getenv("LLM_DEFAULT_RPM", "500"))
+    LLM_DEFAULT_TPM: int = int(os.getenv("LLM_DEFAULT_TPM", "30000"))
+    # OpenAI requests in flight per process: starts at LLM_CONCURRENCY, rises
+    # by one per window of successes and halves on 429s, server errors and
+    # responses slower than LLM_LATENCY_TARGET_SECONDS, within the bounds
+    LLM_CONCURRENCY: int = int(os.getenv("LLM_CONCURRENCY", "8"))
+    LLM_CONCURRENCY_MIN: int = int(os.getenv("LLM_CONCURRENCY_MIN", "1"))
+    LLM_CONCURRENCY_MAX: int = int(os.getenv("LLM_CONCURRENCY_MAX", "64"))
+    LLM_LATENCY_TARGET_SECONDS: float = float(os.getenv("LLM_LATENCY_TARGET_SECONDS", "60"))
+    # Use HTTP/2 when the h2 package is installed
+    OPENAI_HTTP2: bool = os.getenv("OPENAI_HTTP2", "true").lower() == "true"
+    # Job description analysis: "parallel" runs one completion per field
+    # concurrently, "single" asks for every field in one completion; each
+    # completion is abandoned after JD_ANALYSIS_TIMEOUT seconds
+    JD_ANALYSIS_MODE: str = os.getenv("JD_ANALYSIS_MODE", "parallel")
+    JD_ANALYSIS_TIMEOUT: float = float(os.getenv("JD_ANALYSIS_TIMEOUT", "60"))
+    # Cache of chat completions keyed by model, messages, temperature and
+    # max_tokens; calls with a higher temperature than LLM_CACHE_MAX_TEMPERATURE
+    # are creative and never cached
+    LLM_CACHE_ENABLED: bool = os.getenv("LLM_CACHE_ENABLED", "true").lower() == "true"
+    LLM_CACHE_TTL_SECONDS: int = int(os.getenv("LLM_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+    LLM_CACHE_MAX_TEMPERATURE: float = float(os.getenv("LLM_CACHE_MAX_TEMPERATURE", "0.5"))
+    LLM_CACHE_MEMORY_ITEMS: int = int(os.getenv("LLM_CACHE_MEMORY_ITEMS", "1024"))
+    LLM_CACHE_MEMORY_CHARS: int = int(os.getenv("LLM_CACHE_MEMORY_CHARS", str(16 * 1024 * 1024)))
+    # SQLite file of the persistent tier; an empty path keeps the cache in memory only
+    LLM_CACHE_PATH: str = os.getenv("LLM_CACHE_PATH", os.path.join(tempfile.gettempdir(), "perfectcv-llm-cache.sqlite3"))
+    LLM_CACHE_DISK_BYTES: int = int(os.getenv("LLM_CACHE_DISK_BYTES", str(256 * 1024 * 1024)))
 
     # Stripe
     STRIPE_SECRET_KEY: str = os.getenv("STRIPE_SECRET_KEY", "your-stripe-secret-key")
     STRIPE_WEBHOOK_SECRET: str = os.getenv("STRIPE_WEBHOOK_SECRET", "your-stripe-webhook-secret")
 
+    # Resume parsing
+    PARSE_WORKERS: int = int(os.getenv("PARSE_WORKERS", "2"))
+    PARSE_QUEUE_DEPTH: int = int(os.getenv("PARSE_QUEUE_DEPTH", "16"))
+    PARSE_TIMEOUT_SECONDS: float = float(os.getenv("PARSE_TIMEOUT_SECONDS", "30"))
+    # Supervised workers are killed and replaced when a document runs past
+    # the timeout or the memory limit (MB, 0 disables); files that hit a limit
+    # PARSE_POISON_STRIKES times are refused when uploaded again (0 disables)
+    PARSE_SUPERVISED: bool = os.getenv("PARSE_SUPERVISED", "true").lower() == "true"
+    PARSE_WORKER_MEMORY_MB: int = int(os.getenv("PARSE_WORKER_MEMORY_MB", "1024"))
+    PARSE_WORKER_MAX_JOBS: int = int(os.getenv("PARSE_WORKER_MAX_JOBS", "500"))
+    PARSE_POISON_STRIKES: int = int(os.getenv("PARSE_POISON_STRIKES", "2"))
+    # URL of a standalone parse service (cv_parser_cli.py --serve) to parse
+    # uploads in instead of this node's workers; empty parses locally
+    PARSE_SERVICE_URL: str = os.getenv("PARSE_SERVICE_URL", "")
+    PARSE_SERVICE_CONNECTIONS: int = int(os.getenv("PARSE_SERVICE_CONNECTIONS", "8"))
+    PARSE_CACHE_ENABLED: bool = os.getenv("PARSE_CACHE_ENABLED", "true").lower() == "true"
+    PARSE_CACHE_MEMORY_ITEMS: int = int(os.getenv("PARSE_CACHE_MEMORY_ITEMS", "256"))
+    PARSE_CACHE_MEMORY_BYTES: int = int(os.getenv("PARSE_CACHE_MEMORY_BYTES", str(32 * 1024 * 1024)))
+    # Set to an empty string to keep the parse cache in memory only. Entries
+    # are loaded as stored, so the directory must be private to this user
+    PARSE_CACHE_DIR: str = os.getenv(
+        "PARSE_CACHE_DIR",
+        os.path.join(os.getenv("XDG_CACHE_HOME", os.path.expanduser("~/.cache")), "perfectcv", "parse-cache")
+    )
+    PARSE_CACHE_DISK_BYTES: int = int(os.getenv("PARSE_CACHE_DISK_BYTES", str(256 * 1024 * 1024)))
+    # PDFs with at least this many pages are extracted in parallel page ranges (0 disables)
+    PDF_SHARD_PAGE_THRESHOLD: int = int(os.getenv("PDF_SHARD_PAGE_THRESHOLD", "16"))
+    # Processes per long PDF, the parse worker included; each parse worker
+    # keeps a pool of PDF_SHARD_WORKERS - 1 once it has seen a long PDF
+    PDF_SHARD_WORKERS: int = int(os.getenv("PDF_SHARD_WORKERS", "4"))
+    # Upload ceilings; bigger files are rejected before any parsing work
+    PARSE_MAX_BYTES: int = int(os.getenv("PARSE_MAX_BYTES", str(10 * 1024 * 1024)))
+    PARSE_MAX_PAGES: int = int(os.getenv("PARSE_MAX_PAGES", "100"))
+    PARSE_MAX_TEXT_CHARS: int = int(os.getenv("PARSE_MAX_TEXT_CHARS", "200000"))
+    PARSE_MAX_UNCOMPRESSED_BYTES: int = int(os.getenv("PARSE_MAX_UNCOMPRESSED_BYTES", str(64 * 1024 * 1024)))
+    # Uploads larger than this are spooled to disk while they stream in and
+    # memory-mapped by the parse workers; an empty directory means the system default
+    UPLOAD_SPOOL_THRESHOLD_BYTES: int = int(os.getenv("UPLOAD_SPOOL_THRESHOLD_BYTES", str(256 * 1024)))
+    UPLOAD_SPOOL_DIR: str = os.getenv("UPLOAD_SPOOL_DIR", "")
+    # Per-process cache of individual pipeline stages (0 disables)
+    PARSE_STAGE_CACHE_ITEMS: int = int(os.getenv("PARSE_STAGE_CACHE_ITEMS", "32"))
+    PARSE_STAGE_CACHE_STAGES: str = os.getenv("PARSE_STAGE_CACHE_STAGES", "extract")
+    # Import lazily loaded dependencies and start the parse workers in the
+    # background once the app has started, instead of on first use
+    PREWARM_ON_STARTUP: bool = os.getenv("PREWARM_ON_STARTUP", "true").lower() == "true"
+
     # Server
     PORT: int = int(os.getenv("PORT", "8080"))  # Default to Railway's port
     HOST: str = os.getenv("HOST", "0.0.0.0")
@@ -96,7 +188,9 @@ if os.getenv("ENV_FILE") == "tests/.env.test":
         JWT_SECRET_KEY="test_secret_key_for_development_only",
         OPENAI_API_KEY="test_key",
         STRIPE_SECRET_KEY="test_key",
-        STRIPE_WEBHOOK_SECRET="test_key"
+        STRIPE_WEBHOOK_SECRET="test_key",
+        PREWARM_ON_STARTUP=False,
+        LLM_CACHE_PATH=""
     )
 else:
     settings = Settings() 
\ No newline at end of file
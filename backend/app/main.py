@@ -1,3 +1,5 @@
+import asyncio
+import math
 from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
@@ -8,6 +10,9 @@ from pydantic import ValidationError
 from app.core.config import settings
 from app.api.v1.api import api_router
 from app.core.logging import logger
+from app.services.resume_parser import shutdown_parse_executor
+from app.services.openai.client import close_openai_client, OpenAIRateLimitError
+from app.services.prewarm import prewarm
 
 app = FastAPI(
     title="PerfectCV API",
@@ -122,6 +127,19 @@ async def pydantic_exception_handler(request: Request, exc: ValidationError):
         }
     )
 
+# Handle OpenAI rate limits that outlasted every retry
+@app.exception_handler(OpenAIRateLimitError)
+async def openai_rate_limit_exception_handler(request: Request, exc: OpenAIRateLimitError):
+    logger.error(f"OpenAI rate limit: {str(exc)}")
+    headers = {"Retry-After": str(max(1, math.ceil(exc.retry_after)))} if exc.retry_after else None
+    return JSONResponse(
+        status_code=503,
+        content={
+            "detail": "The AI service is busy, please try again shortly"
+        },
+        headers=headers
+    )
+
 # Include API router
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
@@ -133,3 +151,19 @@ async def root():
 async def health_check():
     """Health check endpoint for monitoring."""
     return {"status": "healthy"}
+
+@app.on_event("startup")
+async def start_prewarm():
+    """Load lazily imported dependencies in the background after startup."""
+    if settings.PREWARM_ON_STARTUP:
+        app.state.prewarm_task = asyncio.create_task(prewarm())
+
+@app.on_event("shutdown")
+async def stop_parse_workers():
+    """Stop resume parse worker processes on shutdown."""
+    shutdown_parse_executor()
+
+@app.on_event("shutdown")
+async def close_openai_connections():
+    """Close the shared OpenAI client's pooled connections on shutdown."""
+    await close_openai_client()
@@ -9,6 +9,7 @@ class Resume(Base):
     user_id = Column(Integer, ForeignKey("user.id"), nullable=False)
     title = Column(String)
     content = Column(JSON)  # Structured resume data
+    derived = Column(JSON)  # Per-section hashes and derived artifacts
     original_file_path = Column(String)
     
     # Relationships
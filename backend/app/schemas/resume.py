@@ -9,6 +9,7 @@ class ResumeBase(BaseSchema):
 
 class ResumeCreate(ResumeBase):
     user_id: int
+    derived: Optional[Dict[str, Any]] = None
 
 class ResumeUpdate(ResumeBase):
     pass
@@ -16,6 +17,7 @@ class ResumeUpdate(ResumeBase):
 class Resume(ResumeBase, TimestampedSchema):
     id: int
     user_id: int
+    derived: Optional[Dict[str, Any]] = None
 
 class JobDescriptionBase(BaseSchema):
     title: str
@@ -1,13 +1,12 @@
 """
 Document generator module for PDF and DOCX file generation.
+
+pdfkit and python-docx are imported when a document is first generated
+rather than at import time, to keep API startup fast.
 """
 import os
 import tempfile
 from typing import Optional
-import pdfkit
-from docx import Document
-from docx.shared import Pt, Inches
-from docx.enum.text import WD_ALIGN_PARAGRAPH
 
 def generate_document_pdf(content: str, output_path: str, options: Optional[dict] = None) -> str:
     """
@@ -60,6 +59,8 @@ def generate_document_pdf(content: str, output_path: str, options: Optional[dict
     """
     html_content = html_template % content.replace('\n', '<br>')
     
+    import pdfkit
+    
     # Generate PDF
     try:
         pdfkit.from_string(html_content, output_path, options=default_options)
@@ -81,6 +82,10 @@ def generate_document_docx(content: str, output_path: str) -> str:
     Returns:
         Path to the generated DOCX file
     """
+    from docx import Document
+    from docx.shared import Pt, Inches
+    from docx.enum.text import WD_ALIGN_PARAGRAPH
+    
     # Create new Document
     doc = Document()
     
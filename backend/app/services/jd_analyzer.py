@@ -1,8 +1,17 @@
-from typing import Dict, Any, List
+import asyncio
+import json
+import logging
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 # import spacy - commented out for testing
 # Using a simplified implementation without spacy for testing
-from openai import OpenAI  # Using synchronous client instead of async for compatibility
 from app.core.config import settings
+from app.services.openai.client import OpenAIRateLimitError, create_chat_completion
+
+logger = logging.getLogger(__name__)
+
+# Extraction should be repeatable, and low temperature completions are cached
+EXTRACTION_TEMPERATURE = 0.2
 
 # Create a simplified mock for testing instead of using spaCy
 class MockNLP:
@@ -17,42 +26,33 @@ class MockDoc:
 # Initialize mock NLP
 nlp = MockNLP()
 
-# Initialize OpenAI client only if API key is available - without proxies
-client = None
-if settings.OPENAI_API_KEY:
-    try:
-        client = OpenAI(api_key=settings.OPENAI_API_KEY)
-    except TypeError:
-        # Handle the proxies argument issue by creating a simple mock client
-        class MockOpenAI:
-            def __init__(self):
-                self.chat = MockChat()
-                
-        class MockChat:
-            def __init__(self):
-                self.completions = MockCompletions()
-                
-        class MockCompletions:
-            def create(self, model, messages):
-                return MockResponse()
-                
-        class MockResponse:
-            def __init__(self):
-                self.choices = [MockChoice()]
-                
-        class MockChoice:
-            def __init__(self):
-                self.message = MockMessage()
-                
-        class MockMessage:
-            def __init__(self):
-                self.content = "Mock response for testing"
-                
-        client = MockOpenAI()
+class JDAnalysisError(Exception):
+    """Exception raised when no part of a job description analysis succeeds."""
+    pass
 
-async def analyze_job_description(jd_text: str) -> Dict[str, Any]:
+async def analyze_job_description(jd_text: str, mode: Optional[str] = None) -> Dict[str, Any]:
     """
     Analyze job description text using spaCy and OpenAI.
+    
+    In ``parallel`` mode the skills, summary, requirements and
+    responsibilities are extracted by four concurrent completions, each
+    with its own timeout; a field whose completion fails or times out is
+    left empty and named in ``errors``. In ``single`` mode one completion
+    returns all four fields, falling back to parallel mode if it fails for
+    any reason but OpenAI's rate limits.
+    
+    Args:
+        jd_text: Job description text
+        mode: ``parallel`` or ``single``; defaults to settings.JD_ANALYSIS_MODE
+        
+    Returns:
+        Dict with entities, summary, requirements, responsibilities and,
+        if some fields could not be extracted, errors
+        
+    Raises:
+        OpenAIRateLimitError: If OpenAI was still throttling a completion
+            after every retry
+        JDAnalysisError: If every field failed
     """
     if not settings.OPENAI_API_KEY:
         # Return basic analysis using spaCy only
@@ -86,19 +86,117 @@ async def analyze_job_description(jd_text: str) -> Dict[str, Any]:
     
     # No entities in mock implementation
     
-    # Extract skills using OpenAI
-    skills = await extract_skills(jd_text)
-    entities["skills"] = skills
-    
-    # Get job summary using OpenAI
-    summary = await generate_job_summary(jd_text)
+    fields, errors = None, {}
+    if (mode or settings.JD_ANALYSIS_MODE) == "single":
+        try:
+            fields = await asyncio.wait_for(analyze_in_one_call(jd_text), settings.JD_ANALYSIS_TIMEOUT)
+        except OpenAIRateLimitError:
+            # Four more completions would only be throttled too
+            raise
+        except Exception as e:
+            logger.warning(f"Single-call job description analysis failed, extracting fields separately: {str(e)}")
+    if fields is None:
+        fields, errors = await run_analysis_tasks(jd_text, settings.JD_ANALYSIS_TIMEOUT)
+        if len(errors) == len(ANALYSIS_TASKS):
+            raise JDAnalysisError(f"Job description analysis failed: {'; '.join(errors.values())}")
     
-    return {
+    entities["skills"] = fields["skills"]
+    result = {
         "entities": entities,
-        "summary": summary,
-        "requirements": await extract_requirements(jd_text),
-        "responsibilities": await extract_responsibilities(jd_text)
+        "summary": fields["summary"],
+        "requirements": fields["requirements"],
+        "responsibilities": fields["responsibilities"]
     }
+    if errors:
+        result["errors"] = errors
+    return result
+
+async def run_analysis_tasks(jd_text: str, timeout: float) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    Run the field extractions of ANALYSIS_TASKS concurrently.
+    
+    Args:
+        jd_text: Job description text
+        timeout: Seconds each extraction may take
+        
+    Returns:
+        The value of every field, empty for those that failed, and an error
+        message for each field that failed
+        
+    Raises:
+        OpenAIRateLimitError: If a field failed because OpenAI was still
+            throttling its completion after every retry
+    """
+    results = await asyncio.gather(
+        *(asyncio.wait_for(task(jd_text), timeout) for task, _ in ANALYSIS_TASKS.values()),
+        return_exceptions=True
+    )
+    throttled = [result for result in results if isinstance(result, OpenAIRateLimitError)]
+    if throttled:
+        # Rather than a partial result, ask to try again; the fields that
+        # succeeded are cached by then
+        waits = [error.retry_after for error in throttled if error.retry_after is not None]
+        raise OpenAIRateLimitError(
+            f"Job description analysis was rate limited: {str(throttled[0])}",
+            retry_after=max(waits) if waits else None
+        )
+    fields: Dict[str, Any] = {}
+    errors: Dict[str, str] = {}
+    for (name, (_, empty)), result in zip(ANALYSIS_TASKS.items(), results):
+        if isinstance(result, asyncio.TimeoutError):
+            errors[name] = f"Timed out after {timeout:g}s"
+        elif isinstance(result, Exception):
+            errors[name] = str(result) or type(result).__name__
+        else:
+            fields[name] = result
+            continue
+        logger.warning(f"Job description {name} extraction failed: {errors[name]}")
+        fields[name] = empty()
+    return fields, errors
+
+async def analyze_in_one_call(jd_text: str) -> Dict[str, Any]:
+    """
+    Extract skills, summary, requirements and responsibilities with a
+    single structured completion.
+    
+    Raises:
+        ValueError: If the response is not the expected JSON object
+    """
+    prompt = f"""
+    Analyze this job description. Respond with a JSON object only, with these keys:
+    "skills": technical and soft skills, as a list of strings
+    "summary": a concise summary focusing on the key role and requirements, as a string
+    "requirements": the key requirements, as a list of strings
+    "responsibilities": the key responsibilities, as a list of strings
+    
+    Job Description:
+    {jd_text}
+    """
+    
+    response_text = await create_chat_completion(
+        prompt=prompt,
+        system_message="You are a job description analyzer. Always respond with valid JSON.",
+        model="gpt-4",
+        temperature=EXTRACTION_TEMPERATURE,
+        max_tokens=2000,
+        validate=_parse_analysis
+    )
+    return _parse_analysis(response_text)
+
+def _parse_analysis(response_text: str) -> Dict[str, Any]:
+    content = response_text.strip()
+    # Models sometimes wrap JSON in a markdown code block
+    content = re.sub(r"^```(?:json)?\s*|\s*```$", "", content)
+    data = json.loads(content)
+    if not isinstance(data, dict) or not isinstance(data.get("summary"), str):
+        raise ValueError("Response is not a job description analysis")
+    fields = {"summary": data["summary"].strip()}
+    for name in ("skills", "requirements", "responsibilities"):
+        values = data.get(name)
+        if not isinstance(values, list):
+            raise ValueError(f"Response has no {name} list")
+        fields[name] = [str(value).strip() for value in values if str(value).strip()]
+    return fields
 
 async def extract_skills(jd_text: str) -> List[str]:
     """
@@ -114,16 +212,14 @@ async def extract_skills(jd_text: str) -> List[str]:
     {jd_text}
     """
     
-    # Using synchronous client instead of async
-    response = client.chat.completions.create(
+    response_text = await create_chat_completion(
+        prompt=prompt,
+        system_message="You are a job description analyzer. Extract skills from job descriptions.",
         model="gpt-4",
-        messages=[
-            {"role": "system", "content": "You are a job description analyzer. Extract skills from job descriptions."},
-            {"role": "user", "content": prompt}
-        ]
+        temperature=EXTRACTION_TEMPERATURE
     )
     
-    skills_text = response.choices[0].message.content
+    skills_text = response_text
     return [skill.strip() for skill in skills_text.split(",")]
 
 async def generate_job_summary(jd_text: str) -> str:
@@ -140,16 +236,14 @@ async def generate_job_summary(jd_text: str) -> str:
     {jd_text}
     """
     
-    # Using synchronous client instead of async
-    response = client.chat.completions.create(
+    response_text = await create_chat_completion(
+        prompt=prompt,
+        system_message="You are a job description analyzer. Generate concise summaries.",
         model="gpt-4",
-        messages=[
-            {"role": "system", "content": "You are a job description analyzer. Generate concise summaries."},
-            {"role": "user", "content": prompt}
-        ]
+        temperature=EXTRACTION_TEMPERATURE
     )
     
-    return response.choices[0].message.content
+    return response_text
 
 async def extract_requirements(jd_text: str) -> List[str]:
     """
@@ -165,16 +259,14 @@ async def extract_requirements(jd_text: str) -> List[str]:
     {jd_text}
     """
     
-    # Using synchronous client instead of async
-    response = client.chat.completions.create(
+    response_text = await create_chat_completion(
+        prompt=prompt,
+        system_message="You are a job description analyzer. Extract requirements from job descriptions.",
         model="gpt-4",
-        messages=[
-            {"role": "system", "content": "You are a job description analyzer. Extract requirements from job descriptions."},
-            {"role": "user", "content": prompt}
-        ]
+        temperature=EXTRACTION_TEMPERATURE
     )
     
-    requirements_text = response.choices[0].message.content
+    requirements_text = response_text
     return [req.strip() for req in requirements_text.split("\n") if req.strip()]
 
 async def extract_responsibilities(jd_text: str) -> List[str]:
@@ -191,14 +283,21 @@ async def extract_responsibilities(jd_text: str) -> List[str]:
     {jd_text}
     """
     
-    # Using synchronous client instead of async
-    response = client.chat.completions.create(
+    response_text = await create_chat_completion(
+        prompt=prompt,
+        system_message="You are a job description analyzer. Extract responsibilities from job descriptions.",
         model="gpt-4",
-        messages=[
-            {"role": "system", "content": "You are a job description analyzer. Extract responsibilities from job descriptions."},
-            {"role": "user", "content": prompt}
-        ]
+        temperature=EXTRACTION_TEMPERATURE
     )
     
-    responsibilities_text = response.choices[0].message.content
-    return [resp.strip() for resp in responsibilities_text.split("\n") if resp.strip()]
\ No newline at end of file
+    responsibilities_text = response_text
+    return [resp.strip() for resp in responsibilities_text.split("\n") if resp.strip()]
+
+# Fields of a parallel analysis: the task extracting each, and the factory
+# of its value when that task fails
+ANALYSIS_TASKS: Dict[str, Tuple[Callable[[str], Awaitable[Any]], Callable[[], Any]]] = {
+    "skills": (extract_skills, list),
+    "summary": (generate_job_summary, str),
+    "requirements": (extract_requirements, list),
+    "responsibilities": (extract_responsibilities, list),
+}
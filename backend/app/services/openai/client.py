@@ -1,13 +1,29 @@
 """
 OpenAI client utility for API interactions.
+
+Every service shares one AsyncOpenAI client per process. Its HTTP connection
+pool is kept alive between calls, so a call does not pay for a new pool and
+TLS handshake, and calls are awaited rather than blocking the event loop, so
+one worker can hold many of them in flight at once.
 """
+import asyncio
+import hashlib
+import importlib.util
 import json
 import logging
-import os
-from typing import Dict, Any, List, Optional
+import re
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional
 
-import openai
-from openai import OpenAI
+from app.core.config import settings
+from app.services.openai.response_cache import ResponseCache, completion_key
+from app.services.openai.singleflight import SingleFlight
+from app.services.openai.traffic import (
+    RateLimitExceeded,
+    TrafficController,
+    estimate_tokens,
+    parse_rate_limits,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -15,39 +31,211 @@ class OpenAIError(Exception):
     """Exception raised for errors in OpenAI API interactions."""
     pass
 
+class OpenAIRateLimitError(OpenAIError):
+    """Exception raised when OpenAI still throttles a request after every retry."""
+    
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+_client = None
+_response_cache: Optional[ResponseCache] = None
+# Chat completions in flight, by completion key
+_in_flight = SingleFlight()
+_traffic: Optional[TrafficController] = None
+# Event loop the client's connections were opened on
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+def _create_client():
+    # Imported here so that importing this module does not load openai
+    import httpx
+    from openai import AsyncOpenAI
+    
+    timeout = httpx.Timeout(settings.OPENAI_TIMEOUT, connect=settings.OPENAI_CONNECT_TIMEOUT)
+    http_client = httpx.AsyncClient(
+        http2=settings.OPENAI_HTTP2 and importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(
+            max_connections=settings.OPENAI_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.OPENAI_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.OPENAI_KEEPALIVE_EXPIRY,
+        ),
+        timeout=timeout,
+        follow_redirects=True,
+    )
+    return AsyncOpenAI(
+        api_key=settings.OPENAI_API_KEY or "dummy_key_for_development",
+        timeout=timeout,
+        # Retries are made by the traffic controller
+        max_retries=0,
+        http_client=http_client,
+    )
+
 def get_openai_client():
     """
-    Get an initialized OpenAI client.
+    Get the process-wide AsyncOpenAI client, creating it on first use.
+    
+    Pooled connections belong to the event loop they were opened on, so a
+    call from a different running loop than the last one gets a new client,
+    and the old one is closed, see _discard_client.
     
     Returns:
-        OpenAI client instance
+        AsyncOpenAI client instance
     """
-    api_key = os.environ.get("OPENAI_API_KEY", "dummy_key_for_development")
-    return OpenAI(api_key=api_key)
+    global _client, _client_loop
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        loop = None
+    if _client is not None and loop is not None and _client_loop not in (None, loop):
+        _discard_client(_client, _client_loop)
+        _client = None
+    if _client is None:
+        _client = _create_client()
+    if loop is not None:
+        _client_loop = loop
+    return _client
+
+def _discard_client(client: Any, loop: asyncio.AbstractEventLoop) -> None:
+    """
+    Close a client replaced on another event loop.
+    
+    Its connections can only be closed on the loop they were opened on, so
+    if that loop is still open the client is closed there, as soon as the
+    loop runs. A closed loop can no longer run anything; the client is then
+    just dropped, and httpx releases its connections when it is collected.
+    """
+    if not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(client.close(), loop)
+
+async def close_openai_client() -> None:
+    """Close the shared client's connections, if it was created."""
+    global _client, _client_loop
+    client, _client, _client_loop = _client, None, None
+    if client is not None:
+        await client.close()
+
+def get_traffic_controller() -> TrafficController:
+    """
+    Get the process-wide controller of OpenAI request rates and
+    concurrency, creating it on first use.
+    """
+    global _traffic
+    if _traffic is None:
+        _traffic = TrafficController(
+            rate_limits=parse_rate_limits(settings.LLM_RATE_LIMITS),
+            default_limits=(settings.LLM_DEFAULT_RPM, settings.LLM_DEFAULT_TPM),
+            concurrency=settings.LLM_CONCURRENCY,
+            min_concurrency=settings.LLM_CONCURRENCY_MIN,
+            max_concurrency=settings.LLM_CONCURRENCY_MAX,
+            latency_target=settings.LLM_LATENCY_TARGET_SECONDS,
+            max_retries=settings.OPENAI_MAX_RETRIES,
+            backoff_base=settings.LLM_BACKOFF_BASE_SECONDS,
+            backoff_max=settings.LLM_BACKOFF_MAX_SECONDS
+        )
+    return _traffic
+
+def get_traffic_stats() -> Optional[Dict[str, Any]]:
+    """Request, retry and budget counters and the current concurrency limit."""
+    return _traffic.stats() if _traffic is not None else None
+
+def get_response_cache() -> Optional[ResponseCache]:
+    """
+    Get the process-wide completion response cache, creating it on first use.
+    
+    Returns:
+        ResponseCache configured from settings, or None if caching is disabled
+    """
+    global _response_cache
+    if _response_cache is None and settings.LLM_CACHE_ENABLED:
+        _response_cache = ResponseCache(
+            ttl=settings.LLM_CACHE_TTL_SECONDS,
+            max_items=settings.LLM_CACHE_MEMORY_ITEMS,
+            max_memory_chars=settings.LLM_CACHE_MEMORY_CHARS,
+            path=settings.LLM_CACHE_PATH or None,
+            max_disk_bytes=settings.LLM_CACHE_DISK_BYTES
+        )
+    return _response_cache
+
+def get_response_cache_stats() -> Optional[Dict[str, Any]]:
+    """Hit rate and per-tier counters of the response cache, if it was created."""
+    return _response_cache.stats() if _response_cache is not None else None
+
+def get_coalescing_stats() -> Dict[str, int]:
+    """Chat completions started, in flight, and callers that joined one in flight."""
+    return _in_flight.stats()
 
 async def create_chat_completion(
     prompt: str,
     system_message: str = "You are a helpful assistant.",
     model: str = "gpt-3.5-turbo",
     temperature: float = 0.5,
-    max_tokens: int = 1000
+    max_tokens: int = 1000,
+    cache: bool = True,
+    validate: Optional[Callable[[str], Any]] = None
 ) -> str:
     """
     Create a chat completion using OpenAI's API.
     
+    Responses are served from and stored in the response cache, unless
+    ``cache`` is False or the temperature is above
+    settings.LLM_CACHE_MAX_TEMPERATURE. Responses cut off at ``max_tokens``,
+    and responses ``validate`` raises on, are returned but not stored.
+    Concurrent identical calls share one request to OpenAI, which is sent
+    through the traffic controller.
+    
     Args:
         prompt: User prompt
         system_message: System message to set the context
         model: OpenAI model to use
         temperature: Temperature parameter for response randomness
         max_tokens: Maximum tokens in the response
+        cache: Whether the response may come from or go to the cache
+        validate: Checks a response before it is cached or served from the
+            cache, raising if the caller could not use it
         
     Returns:
         Response text
         
     Raises:
+        OpenAIRateLimitError: If OpenAI throttled the call on every retry
         OpenAIError: If API call fails
     """
+    key = completion_key(model, system_message, prompt, temperature, max_tokens)
+    response_cache = get_response_cache() if cache else None
+    if response_cache is not None:
+        if temperature > settings.LLM_CACHE_MAX_TEMPERATURE:
+            response_cache.record_bypass()
+            response_cache = None
+        else:
+            cached = await response_cache.get(key)
+            if cached is not None and _valid(cached, validate):
+                return cached
+    
+    # An identical call already in flight is awaited instead of sent again
+    return await _in_flight.do(
+        key,
+        partial(_complete, prompt, system_message, model, temperature, max_tokens, key, response_cache, validate)
+    )
+
+def _valid(content: str, validate: Optional[Callable[[str], Any]]) -> bool:
+    if validate is None:
+        return True
+    try:
+        validate(content)
+    except Exception:
+        return False
+    return True
+
+async def _complete(
+    prompt: str,
+    system_message: str,
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    key: str,
+    response_cache: Optional[ResponseCache],
+    validate: Optional[Callable[[str], Any]]
+) -> str:
     try:
         client = get_openai_client()
         
@@ -56,24 +244,63 @@ async def create_chat_completion(
             {"role": "user", "content": prompt}
         ]
         
-        response = client.chat.completions.create(
-            model=model,
-            messages=messages,
-            temperature=temperature,
-            max_tokens=max_tokens
+        response = await get_traffic_controller().run(
+            model,
+            estimate_tokens(system_message, prompt, completion_tokens=max_tokens),
+            partial(
+                client.chat.completions.create,
+                model=model,
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens
+            )
         )
         
-        return response.choices[0].message.content
+        choice = response.choices[0]
+        content = choice.message.content
+    except RateLimitExceeded as e:
+        logger.error(f"OpenAI rate limit: {str(e)}")
+        raise OpenAIRateLimitError(f"OpenAI is busy, try again later: {str(e)}", retry_after=e.retry_after)
     except Exception as e:
         logger.error(f"OpenAI API error: {str(e)}")
         raise OpenAIError(f"Failed to create chat completion: {str(e)}")
+    
+    if response_cache is None or not content:
+        return content
+    if getattr(choice, "finish_reason", None) == "length":
+        logger.warning(f"OpenAI response cut off at {max_tokens} tokens, not caching it")
+    elif not _valid(content, validate):
+        logger.warning("OpenAI response failed validation, not caching it")
+    else:
+        await response_cache.put(key, model, content)
+    return content
+
+def _extract_json(text: str) -> str:
+    """
+    The JSON in a response, which may be wrapped in a markdown code block.
+    
+    Raises:
+        json.JSONDecodeError: If the response holds no valid JSON
+    """
+    try:
+        json.loads(text)
+        return text
+    except json.JSONDecodeError:
+        # Sometimes the model includes markdown code blocks or explanatory text
+        json_match = re.search(r'```json\n(.*?)\n```', text, re.DOTALL)
+        if not json_match:
+            raise
+        json_str = json_match.group(1)
+        json.loads(json_str)
+        return json_str
 
 async def create_json_chat_completion(
     prompt: str,
     system_message: str = "You are a helpful assistant. Always respond with valid JSON.",
     model: str = "gpt-3.5-turbo",
     temperature: float = 0.2,
-    max_tokens: int = 2000
+    max_tokens: int = 2000,
+    cache: bool = True
 ) -> str:
     """
     Create a chat completion that returns valid JSON.
@@ -84,6 +311,7 @@ async def create_json_chat_completion(
         model: OpenAI model to use
         temperature: Temperature parameter for response randomness
         max_tokens: Maximum tokens in the response
+        cache: Whether responses may come from or go to the cache
         
     Returns:
         JSON response as a string
@@ -100,24 +328,14 @@ async def create_json_chat_completion(
             system_message=system_message,
             model=model,
             temperature=temperature,
-            max_tokens=max_tokens
+            max_tokens=max_tokens,
+            cache=cache,
+            validate=_extract_json
         )
         
-        # Try to parse JSON to validate it
         try:
-            json.loads(response_text)
-            return response_text
+            return _extract_json(response_text)
         except json.JSONDecodeError:
-            # If the response isn't valid JSON, try to extract JSON from it
-            # Sometimes the model includes markdown code blocks or explanatory text
-            import re
-            json_match = re.search(r'```json\n(.*?)\n```', response_text, re.DOTALL)
-            if json_match:
-                json_str = json_match.group(1)
-                # Validate the extracted JSON
-                json.loads(json_str)
-                return json_str
-            
             # If we can't extract valid JSON, try one more time with a more explicit prompt
             retry_prompt = f"""
             Your previous response was not valid JSON. Please provide a response in valid JSON format only.
@@ -132,7 +350,9 @@ async def create_json_chat_completion(
                 system_message=system_message,
                 model=model,
                 temperature=temperature,
-                max_tokens=max_tokens
+                max_tokens=max_tokens,
+                cache=cache,
+                validate=json.loads
             )
             
             # Try to parse the retry response
@@ -162,17 +382,28 @@ async def create_embedding(text: str) -> List[float]:
         Embedding vector
         
     Raises:
+        OpenAIRateLimitError: If OpenAI throttled the call on every retry
         OpenAIError: If API call fails
     """
+    model = "text-embedding-ada-002"
+    key = "embedding:" + hashlib.sha256(f"{model}\0{text}".encode("utf-8")).hexdigest()
+    # Callers sharing a call get their own copy of the vector
+    return list(await _in_flight.do(key, partial(_embed, model, text)))
+
+async def _embed(model: str, text: str) -> List[float]:
     try:
         client = get_openai_client()
         
-        response = client.embeddings.create(
-            model="text-embedding-ada-002",
-            input=text
+        response = await get_traffic_controller().run(
+            model,
+            estimate_tokens(text),
+            partial(client.embeddings.create, model=model, input=text)
         )
         
         return response.data[0].embedding
+    except RateLimitExceeded as e:
+        logger.error(f"OpenAI rate limit: {str(e)}")
+        raise OpenAIRateLimitError(f"OpenAI is busy, try again later: {str(e)}", retry_after=e.retry_after)
     except Exception as e:
         logger.error(f"OpenAI API error in create_embedding: {str(e)}")
         raise OpenAIError(f"Failed to create embedding: {str(e)}")
@@ -5,7 +5,9 @@ import json
 import logging
 from typing import Dict, Any, List, Optional
 
-from app.services.openai.client import create_json_chat_completion, create_chat_completion, OpenAIError
+from app.services.openai.client import create_json_chat_completion, create_chat_completion, OpenAIError, OpenAIRateLimitError
+from cvparser.model import ParsedResume
+from cvparser.timeline import refresh_timeline
 
 logger = logging.getLogger(__name__)
 
@@ -37,17 +39,20 @@ async def generate_cover_letter_with_openai(
         CoverLetterGenerationError: If generation fails
     """
     try:
+        resume = ParsedResume.from_dict(refresh_timeline(resume_data))
+        
         # Extract user information
-        user_name = resume_data.get("contact_info", {}).get("name", "")
-        user_email = resume_data.get("contact_info", {}).get("email", "")
-        user_phone = resume_data.get("contact_info", {}).get("phone", "")
-        user_location = resume_data.get("contact_info", {}).get("location", "")
+        user_name = resume.contact.get("name", "")
+        user_email = resume.contact.get("email", "")
+        user_phone = resume.contact.get("phone", "")
+        user_location = resume.contact.get("location", "")
         
-        # Extract experience
-        experience = resume_data.get("sections", {}).get("experience", [])
+        # Extract experience; the timeline is computed when the resume is parsed
+        timeline = resume.timeline or {}
+        most_recent = resume.most_recent
         
         # Extract skills
-        skills = resume_data.get("sections", {}).get("skills", [])
+        skills = resume.skills
         
         # Prepare prompt
         prompt = f"""
@@ -55,7 +60,8 @@ async def generate_cover_letter_with_openai(
         
         Resume Information:
         - Name: {user_name}
-        - Current/Recent Position: {experience[0].get('title', '') if experience else ''}
+        - Current/Recent Position: {most_recent.title if most_recent else ''}
+        - Years of Experience: {timeline.get('total_years', '')}
         - Key Skills: {', '.join(skills[:5]) if skills else ''}
         
         Job Description:
@@ -110,6 +116,9 @@ async def generate_cover_letter_with_openai(
             logger.error(f"Response text: {response_text}")
             raise CoverLetterGenerationError(f"Failed to generate cover letter: Invalid JSON response")
             
+    except OpenAIRateLimitError:
+        # Handled by the API as 503 Service Unavailable
+        raise
     except OpenAIError as e:
         logger.error(f"OpenAI error during cover letter generation: {str(e)}")
         raise CoverLetterGenerationError(f"Failed to generate cover letter with OpenAI: {str(e)}")
@@ -0,0 +1,264 @@
+"""
+Cache of OpenAI chat completion responses.
+
+Entries are keyed by a hash of everything that determines a completion:
+model, system message, prompt, temperature and max_tokens. They expire after
+a fixed time to live, so a model update on OpenAI's side is picked up
+eventually. There are two tiers: an in-process LRU, and a SQLite file shared
+by the worker processes of a node that survives restarts. Both are bounded
+by size, and the least recently used entries are evicted first.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Bump to invalidate every cached response, e.g. after changing how
+# responses are post-processed before they are stored
+CACHE_VERSION = "1"
+
+
+def completion_key(model: str, system_message: str, prompt: str, temperature: float, max_tokens: int) -> str:
+    """Canonical hash of the parameters of a chat completion."""
+    canonical = json.dumps(
+        [CACHE_VERSION, model, system_message, prompt, float(temperature), int(max_tokens)],
+        ensure_ascii=False, separators=(",", ":"),
+    )
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class MemoryTier:
+    """
+    In-process LRU tier bounded by entry count and total stored characters.
+    """
+
+    def __init__(self, max_items: int, max_chars: int):
+        self.max_items = max_items
+        self.max_chars = max_chars
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str, now: float) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] <= now:
+                del self._entries[key]
+                self._size -= len(entry[1])
+                self.expired += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def put(self, key: str, value: str, expires: float) -> None:
+        if len(value) > self.max_chars:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous[1])
+            self._entries[key] = (expires, value)
+            self._size += len(value)
+            while len(self._entries) > self.max_items or self._size > self.max_chars:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "items": len(self._entries),
+                "chars": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evictions": self.evictions,
+            }
+
+
+class SQLiteTier:
+    """
+    Persistent tier in a SQLite database file.
+
+    The table is bounded by the total size of the stored responses; when a
+    write pushes it over the limit, expired entries and then the least
+    recently used ones are deleted. Database errors are logged and treated
+    as misses.
+    """
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._db = sqlite3.connect(path, check_same_thread=False, isolation_level=None, timeout=5)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "key TEXT PRIMARY KEY, model TEXT, value TEXT NOT NULL, "
+            "expires REAL NOT NULL, accessed REAL NOT NULL)"
+        )
+        self._db.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed)")
+        self._size = self._stored_size()
+
+    def _stored_size(self) -> int:
+        return self._db.execute("SELECT COALESCE(SUM(LENGTH(CAST(value AS BLOB))), 0) FROM responses").fetchone()[0]
+
+    def get(self, key: str, now: float) -> Optional[Tuple[str, float]]:
+        with self._lock:
+            try:
+                row = self._db.execute("SELECT value, expires FROM responses WHERE key = ?", (key,)).fetchone()
+                if row is not None and row[1] <= now:
+                    self._db.execute("DELETE FROM responses WHERE key = ?", (key,))
+                    self.expired += 1
+                    row = None
+                elif row is not None:
+                    self._db.execute("UPDATE responses SET accessed = ? WHERE key = ?", (now, key))
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache read failed for {key}: {str(e)}")
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return row[0], row[1]
+
+    def put(self, key: str, model: str, value: str, expires: float, now: float) -> None:
+        size = len(value.encode("utf-8"))
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            try:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO responses (key, model, value, expires, accessed) VALUES (?, ?, ?, ?, ?)",
+                    (key, model, value, expires, now),
+                )
+            except sqlite3.Error as e:
+                logger.warning(f"LLM cache write failed for {key}: {str(e)}")
+                return
+            self._size += size
+            if self._size > self.max_bytes:
+                self._evict(now)
+
+    def _evict(self, now: float) -> None:
+        try:
+            self.expired += self._db.execute("DELETE FROM responses WHERE expires <= ?", (now,)).rowcount
+            # Other processes write to the same file, so recount rather than trust _size
+            self._size = self._stored_size()
+            excess = self._size - self.max_bytes
+            if excess <= 0:
+                return
+            keys = []
+            for key, size in self._db.execute(
+                "SELECT key, LENGTH(CAST(value AS BLOB)) FROM responses ORDER BY accessed"
+            ):
+                keys.append(key)
+                excess -= size
+                if excess <= 0:
+                    break
+            self._db.executemany("DELETE FROM responses WHERE key = ?", ((key,) for key in keys))
+            self.evictions += len(keys)
+            self._size = self._stored_size()
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache eviction failed: {str(e)}")
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "bytes": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "expired": self.expired,
+                "evictions": self.evictions,
+            }
+
+    def close(self) -> None:
+        with self._lock:
+            self._db.close()
+
+
+class ResponseCache:
+    """
+    Two-tier completion response cache: memory first, then SQLite.
+
+    Hits in the SQLite tier are promoted into the memory tier, keeping their
+    expiry. Pass ``path=None`` to keep the cache purely in memory.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        max_items: int,
+        max_memory_chars: int,
+        path: Optional[str] = None,
+        max_disk_bytes: int = 0,
+    ):
+        self.ttl = ttl
+        self.bypassed = 0
+        self.memory = MemoryTier(max_items, max_memory_chars)
+        self.disk: Optional[SQLiteTier] = None
+        if path:
+            try:
+                self.disk = SQLiteTier(path, max_disk_bytes)
+            except (OSError, sqlite3.Error) as e:
+                logger.warning(f"LLM cache database {path} unavailable, using memory only: {str(e)}")
+
+    async def get(self, key: str) -> Optional[str]:
+        now = time.time()
+        value = self.memory.get(key, now)
+        if value is None and self.disk is not None:
+            found = await asyncio.to_thread(self.disk.get, key, now)
+            if found is not None:
+                value, expires = found
+                self.memory.put(key, value, expires)
+        return value
+
+    async def put(self, key: str, model: str, value: str) -> None:
+        now = time.time()
+        self.memory.put(key, value, now + self.ttl)
+        if self.disk is not None:
+            await asyncio.to_thread(self.disk.put, key, model, value, now + self.ttl, now)
+
+    def record_bypass(self) -> None:
+        """Count a call that was not cached because of its temperature."""
+        self.bypassed += 1
+
+    def stats(self) -> Dict[str, Any]:
+        memory = self.memory.stats()
+        disk = self.disk.stats() if self.disk is not None else None
+        lookups = memory["hits"] + memory["misses"]
+        hits = memory["hits"] + (disk["hits"] if disk else 0)
+        return {
+            "lookups": lookups,
+            "hits": hits,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "bypassed": self.bypassed,
+            "memory": memory,
+            "disk": disk,
+        }
+
+    def close(self) -> None:
+        if self.disk is not None:
+            self.disk.close()
@@ -0,0 +1,94 @@
+"""
+Coalescing of identical concurrent calls.
+
+When many users submit the same job description at once, each request would
+otherwise send the same OpenAI calls. SingleFlight runs one call per key:
+callers arriving while it is in flight await the same result (or exception)
+instead of starting their own.
+
+The shared call runs as its own task, so a caller that is cancelled, e.g.
+because its client disconnected, does not cancel it for the others; the call
+is only cancelled once every caller waiting on it has gone.
+"""
+import asyncio
+from functools import partial
+from typing import Awaitable, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class _Call:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Run at most one call per key at a time and share its outcome.
+
+    Counters: ``calls`` started, ``coalesced`` callers that joined a call in
+    flight instead, and ``abandoned`` calls cancelled because all of their
+    callers were cancelled.
+    """
+
+    def __init__(self):
+        self.calls = 0
+        self.coalesced = 0
+        self.abandoned = 0
+        self._in_flight: Dict[str, _Call] = {}
+
+    def _forget(self, key: str, call: _Call, task: asyncio.Task) -> None:
+        if self._in_flight.get(key) is call:
+            del self._in_flight[key]
+        if not task.cancelled():
+            # Mark the exception retrieved, even if every caller was cancelled
+            task.exception()
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """
+        Await ``fn()``, or the call already in flight for ``key``.
+
+        Args:
+            key: Canonical key of the call; equal keys must mean equal calls
+            fn: Starts the call; only invoked if none is in flight
+
+        Returns:
+            The result of the shared call
+
+        Raises:
+            Whatever the shared call raised
+        """
+        loop = asyncio.get_running_loop()
+        call: Optional[_Call] = self._in_flight.get(key)
+        if call is not None and call.task.get_loop() is not loop:
+            # Left over from another event loop; it cannot be awaited here
+            call = None
+        if call is None:
+            call = _Call(loop.create_task(fn()))
+            call.task.add_done_callback(partial(self._forget, key, call))
+            self._in_flight[key] = call
+            self.calls += 1
+        else:
+            self.coalesced += 1
+
+        call.waiters += 1
+        try:
+            return await asyncio.shield(call.task)
+        except asyncio.CancelledError:
+            if call.waiters == 1 and not call.task.done():
+                call.task.cancel()
+                self.abandoned += 1
+            raise
+        finally:
+            call.waiters -= 1
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "in_flight": len(self._in_flight),
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "abandoned": self.abandoned,
+        }
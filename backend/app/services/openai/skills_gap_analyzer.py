@@ -5,7 +5,9 @@ import json
 import logging
 from typing import Dict, Any, List, Optional
 
-from app.services.openai.client import create_json_chat_completion, OpenAIError
+from app.services.openai.client import create_json_chat_completion, OpenAIError, OpenAIRateLimitError
+from cvparser.model import ParsedResume
+from cvparser.timeline import refresh_timeline
 
 logger = logging.getLogger(__name__)
 
@@ -31,17 +33,18 @@ async def analyze_skills_gap_with_openai(
         SkillsGapAnalysisError: If analysis fails
     """
     try:
+        resume = ParsedResume.from_dict(refresh_timeline(resume_data))
+        
         # Extract skills from resume
-        resume_skills = resume_data.get("sections", {}).get("skills", [])
+        resume_skills = resume.skills
         
         # Extract experience
-        experience = resume_data.get("sections", {}).get("experience", [])
         experience_text = ""
-        for job in experience:
-            title = job.get("title", "")
-            company = job.get("company", "")
-            description = job.get("description", "")
-            experience_text += f"- {title} at {company}: {description}\n"
+        for job in resume.experience:
+            experience_text += f"- {job.title} at {job.company}: {job.description}\n"
+        timeline = resume.timeline or {}
+        if timeline.get("total_months"):
+            experience_text += f"Total experience: {timeline['total_years']} years\n"
         
         # Prepare prompt
         prompt = f"""
@@ -114,6 +117,9 @@ async def analyze_skills_gap_with_openai(
             logger.error(f"Response text: {response_text}")
             raise SkillsGapAnalysisError(f"Failed to analyze skills gap: Invalid JSON response")
             
+    except OpenAIRateLimitError:
+        # Handled by the API as 503 Service Unavailable
+        raise
     except OpenAIError as e:
         logger.error(f"OpenAI error during skills gap analysis: {str(e)}")
         raise SkillsGapAnalysisError(f"Failed to analyze skills gap with OpenAI: {str(e)}")
@@ -139,11 +145,11 @@ async def incorporate_user_skills_with_openai(
         SkillsGapAnalysisError: If incorporation fails
     """
     try:
-        # Create a copy of the resume data to avoid modifying the original
-        updated_resume = resume_data.copy()
+        # Read the resume through the typed model; the caller's dict is never modified
+        resume = ParsedResume.from_dict(refresh_timeline(resume_data))
         
         # Extract existing skills
-        existing_skills = updated_resume.get("sections", {}).get("skills", [])
+        existing_skills = resume.skills
         
         # Prepare prompt
         skills_text = ""
@@ -160,7 +166,7 @@ async def incorporate_user_skills_with_openai(
         {', '.join(existing_skills) if existing_skills else 'No skills explicitly listed'}
         
         Resume Experience:
-        {json.dumps(updated_resume.get("sections", {}).get("experience", []), indent=2)}
+        {json.dumps([job.to_dict() for job in resume.experience], indent=2)}
         
         Please:
         1. Add the new skills to the skills section
@@ -187,6 +193,9 @@ async def incorporate_user_skills_with_openai(
             logger.error(f"Response text: {response_text}")
             raise SkillsGapAnalysisError(f"Failed to incorporate user skills: Invalid JSON response")
             
+    except OpenAIRateLimitError:
+        # Handled by the API as 503 Service Unavailable
+        raise
     except OpenAIError as e:
         logger.error(f"OpenAI error during skills incorporation: {str(e)}")
         raise SkillsGapAnalysisError(f"Failed to incorporate user skills with OpenAI: {str(e)}")
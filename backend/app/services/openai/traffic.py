@@ -0,0 +1,365 @@
+"""
+Traffic control for OpenAI requests.
+
+Every request to the API goes through a TrafficController, which:
+
+- keeps each model within a budget of requests and tokens per minute, two
+  token buckets refilled continuously; a request's tokens are estimated from
+  the size of its prompt plus the completion it may return, and corrected
+  from the reported usage once it is done; a request waits for its budget
+  before it queues for a slot, so requests waiting on one model's budget do
+  not hold the slots of the others;
+- bounds the requests in flight with a limit adapted by AIMD: raised by one
+  after a window of successes, halved when a request is throttled (429),
+  fails on the server side or takes longer than the latency target;
+- queues requests waiting for a slot, first come first served;
+- retries throttled and failed requests with jittered exponential backoff,
+  waiting at least as long as the ``Retry-After`` of a 429, and holds back
+  the model's other requests for that long too.
+"""
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Deque, Dict, Optional, Tuple, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Rough characters per token of English text
+CHARS_PER_TOKEN = 4
+
+
+def estimate_tokens(*texts: str, completion_tokens: int = 0) -> int:
+    """Tokens a request may use: its prompt text plus the completion allowed."""
+    return sum(len(text) for text in texts) // CHARS_PER_TOKEN + 1 + completion_tokens
+
+
+def parse_rate_limits(spec: str) -> Dict[str, Tuple[int, int]]:
+    """
+    Parse ``model=requests:tokens`` pairs, separated by commas, into
+    per-minute budgets by model.
+    """
+    limits = {}
+    for item in spec.split(","):
+        model, _, budget = item.strip().partition("=")
+        if not model or not budget:
+            continue
+        requests, _, tokens = budget.partition(":")
+        limits[model.strip()] = (int(requests), int(tokens))
+    return limits
+
+
+class TokenBucket:
+    """
+    Budget of ``per_minute`` units refilled continuously, holding at most a
+    minute's worth.
+
+    take() reserves units immediately and returns how long to wait before
+    using them; the balance may go negative, which makes later callers wait
+    in turn instead of racing for the refill.
+    """
+
+    def __init__(self, per_minute: float):
+        self.rate = per_minute / 60.0
+        self.capacity = float(per_minute)
+        self.tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def _refill(self, now: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def take(self, amount: float, now: Optional[float] = None) -> float:
+        now = time.monotonic() if now is None else now
+        self._refill(now)
+        self.tokens -= amount
+        return -self.tokens / self.rate if self.tokens < 0 else 0.0
+
+    def give_back(self, amount: float) -> None:
+        self.tokens = min(self.capacity, self.tokens + amount)
+
+
+class ModelBudget:
+    """Requests-per-minute and tokens-per-minute budgets of one model."""
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests = TokenBucket(requests_per_minute)
+        self.tokens = TokenBucket(tokens_per_minute)
+        self.resume_at = 0.0
+
+    def reserve(self, tokens: int) -> float:
+        """Reserve one request and ``tokens``; returns the seconds to wait."""
+        now = time.monotonic()
+        wait = max(self.requests.take(1, now), self.tokens.take(tokens, now))
+        return max(wait, self.resume_at - now)
+
+    def hold(self, seconds: float) -> None:
+        """Send no requests for ``seconds``, as asked by a 429's Retry-After."""
+        self.resume_at = max(self.resume_at, time.monotonic() + seconds)
+
+
+class AIMDLimit:
+    """
+    Concurrency limit adapted by additive increase, multiplicative decrease.
+
+    Each success adds ``1 / limit``, so the limit grows by one per window of
+    ``limit`` successful requests. Congestion multiplies it by ``decrease``,
+    at most once per ``cooldown`` seconds so that a burst of failures from
+    one window only counts once.
+    """
+
+    def __init__(self, initial: int, minimum: int, maximum: int, decrease: float = 0.5, cooldown: float = 1.0):
+        self.minimum = minimum
+        self.maximum = maximum
+        self.decrease = decrease
+        self.cooldown = cooldown
+        self.limit = float(min(max(initial, minimum), maximum))
+        self._decreased = float("-inf")
+
+    @property
+    def value(self) -> int:
+        return int(self.limit)
+
+    def on_success(self) -> None:
+        self.limit = min(self.maximum, self.limit + 1 / self.limit)
+
+    def on_congestion(self) -> None:
+        now = time.monotonic()
+        if now - self._decreased >= self.cooldown:
+            self.limit = max(self.minimum, self.limit * self.decrease)
+            self._decreased = now
+
+
+class ConcurrencyGate:
+    """
+    Admits at most ``limit.value`` holders at a time; waiters are admitted
+    in order of arrival.
+    """
+
+    def __init__(self, limit: AIMDLimit):
+        self.limit = limit
+        self.active = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+
+    @property
+    def waiting(self) -> int:
+        return sum(1 for future in self._waiters if not future.done())
+
+    async def acquire(self) -> None:
+        if self.active < self.limit.value and not self.waiting:
+            self.active += 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        self._waiters.append(future)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Admitted just as the waiter was cancelled; pass the slot on
+                self.release()
+            raise
+
+    def release(self) -> None:
+        self.active -= 1
+        self.wake()
+
+    def wake(self) -> None:
+        """Admit waiters while there are free slots, e.g. after the limit rose."""
+        while self._waiters and self.active < self.limit.value:
+            future = self._waiters.popleft()
+            if future.done() or future.get_loop().is_closed():
+                # Cancelled, or left over from an event loop that has gone
+                continue
+            self.active += 1
+            future.set_result(None)
+
+
+class RateLimitExceeded(Exception):
+    """Raised when a request is still throttled after every retry."""
+
+    def __init__(self, message: str, retry_after: Optional[float] = None):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+def _status(error: BaseException) -> Optional[int]:
+    return getattr(error, "status_code", None)
+
+
+def retry_after(error: BaseException) -> Optional[float]:
+    """Seconds to wait given by the ``Retry-After`` headers of an error response."""
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return float(value) / 1000
+        except ValueError:
+            pass
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_transient(error: BaseException) -> bool:
+    status = _status(error)
+    if status is not None:
+        return status == 429 or status >= 500
+    if isinstance(error, asyncio.TimeoutError):
+        return True
+    # Connection errors and timeouts of the OpenAI client
+    return type(error).__name__ in ("APIConnectionError", "APITimeoutError")
+
+
+class TrafficController:
+    """
+    Budgets, adaptive concurrency, queueing and retries for the
+    requests of one process to one API.
+    """
+
+    def __init__(
+        self,
+        rate_limits: Dict[str, Tuple[int, int]],
+        default_limits: Tuple[int, int],
+        concurrency: int,
+        min_concurrency: int,
+        max_concurrency: int,
+        latency_target: float,
+        max_retries: int,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+    ):
+        self.rate_limits = rate_limits
+        self.default_limits = default_limits
+        self.latency_target = latency_target
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.limit = AIMDLimit(concurrency, min_concurrency, max_concurrency)
+        self.gate = ConcurrencyGate(self.limit)
+        self._budgets: Dict[str, ModelBudget] = {}
+        self._counters = {
+            "requests": 0,
+            "succeeded": 0,
+            "throttled": 0,
+            "failed": 0,
+            "retries": 0,
+            "slow": 0,
+            "budget_waits": 0,
+        }
+        self._budget_wait_seconds = 0.0
+
+    def budget(self, model: str) -> ModelBudget:
+        budget = self._budgets.get(model)
+        if budget is None:
+            budget = self._budgets[model] = ModelBudget(*self.rate_limits.get(model, self.default_limits))
+        return budget
+
+    def backoff(self, attempt: int, error: BaseException) -> float:
+        """Jittered exponential backoff, at least the error's Retry-After."""
+        delay = random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** attempt))
+        after = retry_after(error)
+        return max(delay, after) if after is not None else delay
+
+    async def run(
+        self,
+        model: str,
+        tokens: int,
+        call: Callable[[], Awaitable[T]],
+    ) -> T:
+        """
+        Send a request within the model's budget and the concurrency limit.
+
+        Args:
+            model: Model the request is for, which selects its budget
+            tokens: Estimated tokens of the request, see estimate_tokens
+            call: Sends the request; called again for each retry
+
+        Returns:
+            The result of ``call``
+
+        Raises:
+            RateLimitExceeded: If the request was still throttled after
+                ``max_retries`` retries
+            Whatever ``call`` raised, for other errors and for transient
+                ones after the last retry
+        """
+        budget = self.budget(model)
+        self._counters["requests"] += 1
+        attempt = 0
+        while True:
+            try:
+                wait = budget.reserve(tokens)
+                if wait > 0:
+                    self._counters["budget_waits"] += 1
+                    self._budget_wait_seconds += wait
+                    await asyncio.sleep(wait)
+                await self.gate.acquire()
+            except asyncio.CancelledError:
+                budget.tokens.give_back(tokens)
+                raise
+            try:
+                started = time.monotonic()
+                try:
+                    result = await call()
+                except Exception as e:
+                    # The request did not use its tokens, or was refused
+                    budget.tokens.give_back(tokens)
+                    if not _is_transient(e):
+                        self._counters["failed"] += 1
+                        raise
+                    throttled = _status(e) == 429
+                    self._counters["throttled" if throttled else "failed"] += 1
+                    self.limit.on_congestion()
+                    delay = self.backoff(attempt, e)
+                    if throttled:
+                        budget.hold(delay)
+                    if attempt == self.max_retries:
+                        if throttled:
+                            raise RateLimitExceeded(f"{model} is rate limited: {str(e)}", delay)
+                        raise
+                    logger.warning(f"OpenAI request to {model} failed ({str(e)}), retrying in {delay:.1f}s")
+                else:
+                    self._record_success(budget, tokens, result, time.monotonic() - started)
+                    return result
+            finally:
+                self.gate.release()
+            self._counters["retries"] += 1
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def _record_success(self, budget: ModelBudget, tokens: int, result: Any, latency: float) -> None:
+        self._counters["succeeded"] += 1
+        if latency > self.latency_target:
+            self._counters["slow"] += 1
+            self.limit.on_congestion()
+        else:
+            self.limit.on_success()
+            self.gate.wake()
+        used = getattr(getattr(result, "usage", None), "total_tokens", None)
+        if isinstance(used, int):
+            # Correct the estimate with the tokens actually used
+            budget.tokens.give_back(tokens - used)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self._counters,
+            "budget_wait_seconds": round(self._budget_wait_seconds, 3),
+            "concurrency_limit": self.limit.value,
+            "in_flight": self.gate.active,
+            "queued": self.gate.waiting,
+        }
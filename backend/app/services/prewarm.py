@@ -0,0 +1,89 @@
+"""
+Optional pre-warming of lazily imported dependencies.
+
+The API imports pdfplumber, python-docx, pdfkit, Stripe and OpenAI only when
+they are first used, so the app starts quickly. Pre-warming pays that cost
+just after startup instead of on the first requests that need each one:
+the API process imports its heavy modules and creates the shared OpenAI
+client in a thread, and the parse workers are started and import the extractors.
+"""
+import asyncio
+import importlib
+import logging
+import time
+from typing import Dict, Iterable
+
+logger = logging.getLogger(__name__)
+
+# Imported by each parse worker process
+PARSER_MODULES = (
+    'cvparser.pdf',
+    'pdfplumber',
+    'cvparser.ooxml',
+    'cvparser.rtf',
+)
+
+# Imported by the API process
+API_MODULES = (
+    'openai',
+    'stripe',
+    'pdfkit',
+    'docx',
+)
+
+
+def import_modules(modules: Iterable[str]) -> Dict[str, float]:
+    """
+    Import modules, skipping any that fail.
+    
+    Returns:
+        Seconds spent importing each module that was imported
+    """
+    timings = {}
+    for module in modules:
+        started = time.perf_counter()
+        try:
+            importlib.import_module(module)
+        except Exception as e:
+            logger.warning(f"Could not pre-import {module}: {str(e)}")
+            continue
+        timings[module] = time.perf_counter() - started
+    return timings
+
+
+def warm_parse_worker() -> Dict[str, float]:
+    """Import the extractors in a parse worker process."""
+    from app.services.resume_parser import get_parse_pipeline
+
+    timings = import_modules(PARSER_MODULES)
+    get_parse_pipeline()
+    return timings
+
+
+def warm_api() -> Dict[str, float]:
+    """Import the API process's heavy modules and create the shared OpenAI client."""
+    from app.services.openai.client import get_openai_client
+
+    timings = import_modules(API_MODULES)
+    get_openai_client()
+    return timings
+
+
+async def prewarm() -> None:
+    """
+    Warm the API process and the parse workers; failures are logged and
+    otherwise ignored, as everything is still loaded on first use.
+    """
+    from app.services.resume_parser import get_parse_executor, get_parse_service
+
+    started = time.perf_counter()
+    try:
+        timings = await asyncio.to_thread(warm_api)
+        # A remote parse service warms its own workers
+        if get_parse_service() is None:
+            await get_parse_executor().warm(warm_parse_worker)
+    except Exception as e:
+        logger.warning(f"Pre-warming failed: {str(e)}")
+        return
+    imports = ", ".join(f"{module} {seconds * 1000:.0f}ms" for module, seconds in timings.items())
+    logger.info(f"Pre-warmed in {time.perf_counter() - started:.2f}s ({imports})")
@@ -1,9 +1,12 @@
+import importlib.util
+import json
 import os
 import logging
 from typing import Dict, Any, List, Optional, Tuple
 # from sentence_transformers import SentenceTransformer - commented out for testing
 # from huggingface_hub import hf_hub_download - commented out for testing
 from app.core.config import settings
+from app.services.openai.client import create_chat_completion
 import re
 # import spacy - commented out for testing
 
@@ -25,47 +28,14 @@ class MockSentenceTransformer:
 # Initialize mock model
 model = MockSentenceTransformer("all-MiniLM-L6-v2")
 
-# Try to import OpenAI, but handle the case when it's not available
-try:
-    from openai import OpenAI
-    OPENAI_AVAILABLE = True
-    if settings.OPENAI_API_KEY:
-        try:
-            client = OpenAI(api_key=settings.OPENAI_API_KEY)
-        except TypeError:
-            # Handle the proxies argument issue by creating a simple mock client
-            class MockOpenAI:
-                def __init__(self):
-                    self.chat = MockChat()
-                    
-            class MockChat:
-                def __init__(self):
-                    self.completions = MockCompletions()
-                    
-            class MockCompletions:
-                def create(self, model, messages):
-                    return MockResponse()
-                    
-            class MockResponse:
-                def __init__(self):
-                    self.choices = [MockChoice()]
-                    
-            class MockChoice:
-                def __init__(self):
-                    self.message = MockMessage()
-                    
-            class MockMessage:
-                def __init__(self):
-                    self.content = "Mock response for testing"
-                    
-            client = MockOpenAI()
-            OPENAI_AVAILABLE = True
-    else:
-        OPENAI_AVAILABLE = False
-        logging.warning("OpenAI API key not configured. Using fallback optimization.")
-except ImportError:
-    OPENAI_AVAILABLE = False
+# OpenAI is only imported, and the shared client created, on first use so
+# that importing this module does not slow down API startup
+OPENAI_INSTALLED = importlib.util.find_spec("openai") is not None
+OPENAI_AVAILABLE = OPENAI_INSTALLED and bool(settings.OPENAI_API_KEY)
+if not OPENAI_INSTALLED:
     logging.warning("OpenAI not available. Using fallback optimization.")
+elif not settings.OPENAI_API_KEY:
+    logging.warning("OpenAI API key not configured. Using fallback optimization.")
 
 # Load spaCy model for fallback
 try:
@@ -149,15 +119,15 @@ async def _ai_optimization(resume_data: Dict[str, Any], job_description: str) ->
             Provide 2-3 specific suggestions to improve this summary.
             """
             
-            response = client.chat.completions.create(
+            response_text = await create_chat_completion(
+                prompt=summary_prompt,
                 model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": summary_prompt}],
                 max_tokens=150
             )
             
             suggestions.append({
                 "section": "Summary",
-                "suggestions": response.choices[0].message.content.strip().split("\n")
+                "suggestions": response_text.strip().split("\n")
             })
         
         # Analyze experience
@@ -175,15 +145,15 @@ async def _ai_optimization(resume_data: Dict[str, Any], job_description: str) ->
             Provide 2-3 specific suggestions to improve the experience descriptions.
             """
             
-            response = client.chat.completions.create(
+            response_text = await create_chat_completion(
+                prompt=experience_prompt,
                 model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": experience_prompt}],
                 max_tokens=150
             )
             
             suggestions.append({
                 "section": "Experience",
-                "suggestions": response.choices[0].message.content.strip().split("\n")
+                "suggestions": response_text.strip().split("\n")
             })
         
         # Analyze skills against job description
@@ -205,15 +175,15 @@ async def _ai_optimization(resume_data: Dict[str, Any], job_description: str) ->
             Provide 2-3 specific suggestions to better align the skills with the job requirements.
             """
             
-            response = client.chat.completions.create(
+            response_text = await create_chat_completion(
+                prompt=skills_prompt,
                 model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": skills_prompt}],
                 max_tokens=150
             )
             
             suggestions.append({
                 "section": "Skills",
-                "suggestions": response.choices[0].message.content.strip().split("\n")
+                "suggestions": response_text.strip().split("\n")
             })
         
         return {
@@ -249,19 +219,18 @@ async def _extract_job_requirements(job_description: str) -> Dict[str, List[str]
     }}
     """
     
-    response = client.chat.completions.create(
+    response_text = await create_chat_completion(
+        prompt=prompt,
+        system_message="You are a job description analyzer. Extract key requirements and skills from job descriptions.",
         model="gpt-3.5-turbo",
-        messages=[
-            {"role": "system", "content": "You are a job description analyzer. Extract key requirements and skills from job descriptions."},
-            {"role": "user", "content": prompt}
-        ],
-        max_tokens=500
+        temperature=0.2,
+        max_tokens=500,
+        validate=json.loads
     )
     
     try:
         # Parse the JSON response
-        import json
-        result = json.loads(response.choices[0].message.content)
+        result = json.loads(response_text)
         return result
     except:
         # Fallback if JSON parsing fails
@@ -456,15 +425,11 @@ async def optimize_summary(resume_summary: str, jd_summary: str) -> str:
     Make the summary more relevant to the job while maintaining truthfulness.
     """
     
-    response = await client.chat.completions.create(
-        model="gpt-4",
-        messages=[
-            {"role": "system", "content": "You are a resume optimization expert. Rewrite summaries to better match job descriptions."},
-            {"role": "user", "content": prompt}
-        ]
+    return await create_chat_completion(
+        prompt=prompt,
+        system_message="You are a resume optimization expert. Rewrite summaries to better match job descriptions.",
+        model="gpt-4"
     )
-    
-    return response.choices[0].message.content
 
 async def optimize_experience(
     experience: List[Dict[str, Any]],
@@ -1,24 +1,245 @@
-import io
-import re
 import os
-import tempfile
-from typing import Dict, Any, List, Optional
-import docx
-import pdfplumber
-import docx2txt
-from striprtf.striprtf import rtf_to_text
-from fastapi import UploadFile, HTTPException
-from datetime import datetime
-
-class ResumeParseError(Exception):
-    """Custom exception for resume parsing errors."""
-    pass
-
-# Add function alias for compatibility with career_tools.py
+import logging
+from typing import Dict, Any, Optional, Tuple, Union
+
+from app.core.config import settings
+from cvparser.errors import (
+    ResumeParseError,
+    ParseQueueFullError,
+    ParseServiceUnavailableError,
+    ParseTimeoutError,
+    ParseLimitError,
+    UnsupportedFormatError,
+)
+from cvparser.buffers import Buffer, FileSource, map_file
+from cvparser.executor import ParseExecutor
+from cvparser.supervisor import SupervisedExecutor
+from cvparser.cache import ParseCache
+from cvparser.client import ParserClient
+from cvparser.formats import ParseLimits, detect_format
+from cvparser.model import ParsedResume
+from cvparser.pipeline import ParsePipeline, PipelineResult, StageMetrics, default_extractors
+from cvparser.sections import split_sections
+from cvparser.contact import extract_contact
+from cvparser.fields import parse_experience, parse_education
+from cvparser.derived import DERIVED_VERSION, apply_derived, derive_sections
+from cvparser.timeline import is_stale, refresh_timeline
+from app.services.upload_ingest import IngestedUpload
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever a change alters parse output so cached results are not reused
+PARSER_VERSION = "11"
+
+_parse_executor: Optional[Union[ParseExecutor, SupervisedExecutor]] = None
+_parse_cache: Optional[ParseCache] = None
+_parse_pipeline: Optional[ParsePipeline] = None
+_parse_service: Optional[ParserClient] = None
+# Stage timings of every parse, including those run in worker processes
+_stage_metrics = StageMetrics()
+
+def get_parse_executor() -> Union[ParseExecutor, SupervisedExecutor]:
+    """
+    Get the process-wide parse executor, creating it on first use.
+    
+    Returns:
+        SupervisedExecutor, or a plain ParseExecutor when PARSE_SUPERVISED
+        is off, configured from settings
+    """
+    global _parse_executor
+    if _parse_executor is None:
+        if settings.PARSE_SUPERVISED:
+            _parse_executor = SupervisedExecutor(
+                max_workers=settings.PARSE_WORKERS,
+                max_pending=settings.PARSE_QUEUE_DEPTH,
+                timeout=settings.PARSE_TIMEOUT_SECONDS,
+                memory_limit_mb=settings.PARSE_WORKER_MEMORY_MB,
+                max_jobs_per_worker=settings.PARSE_WORKER_MAX_JOBS,
+                poison_strikes=settings.PARSE_POISON_STRIKES
+            )
+        else:
+            _parse_executor = ParseExecutor(
+                max_workers=settings.PARSE_WORKERS,
+                max_pending=settings.PARSE_QUEUE_DEPTH,
+                timeout=settings.PARSE_TIMEOUT_SECONDS
+            )
+    return _parse_executor
+
+def shutdown_parse_executor() -> None:
+    """Stop the parse worker processes, if any were started, and close the parse service connections."""
+    global _parse_executor, _parse_service
+    if _parse_executor is not None:
+        _parse_executor.shutdown()
+        _parse_executor = None
+    if _parse_service is not None:
+        _parse_service.close()
+        _parse_service = None
+
+def get_parse_service() -> Optional[ParserClient]:
+    """
+    Get the client of the remote parse service, creating it on first use.
+    
+    Returns:
+        ParserClient for PARSE_SERVICE_URL, or None to parse in this
+        node's own parse executor
+    """
+    global _parse_service
+    if _parse_service is None and settings.PARSE_SERVICE_URL:
+        _parse_service = ParserClient(
+            settings.PARSE_SERVICE_URL,
+            pool_size=settings.PARSE_SERVICE_CONNECTIONS,
+            # The service enforces the parse timeout itself
+            timeout=settings.PARSE_TIMEOUT_SECONDS + 10
+        )
+    return _parse_service
+
+def get_parse_cache() -> Optional[ParseCache]:
+    """
+    Get the process-wide parse result cache, creating it on first use.
+    
+    Returns:
+        ParseCache configured from settings, or None if caching is disabled
+    """
+    global _parse_cache
+    if _parse_cache is None and settings.PARSE_CACHE_ENABLED:
+        _parse_cache = ParseCache(
+            version=PARSER_VERSION,
+            max_items=settings.PARSE_CACHE_MEMORY_ITEMS,
+            max_memory_bytes=settings.PARSE_CACHE_MEMORY_BYTES,
+            directory=settings.PARSE_CACHE_DIR or None,
+            max_disk_bytes=settings.PARSE_CACHE_DISK_BYTES
+        )
+    return _parse_cache
+
+def get_parse_pipeline() -> ParsePipeline:
+    """
+    Get this process's parse pipeline, creating it on first use.
+    
+    Returns:
+        ParsePipeline with the built-in extractors configured from settings
+    """
+    global _parse_pipeline
+    if _parse_pipeline is None:
+        _parse_pipeline = ParsePipeline(
+            default_extractors(
+                pdf_shard_threshold=settings.PDF_SHARD_PAGE_THRESHOLD,
+                pdf_workers=min(settings.PDF_SHARD_WORKERS, os.cpu_count() or 1),
+                pdf_max_pages=settings.PARSE_MAX_PAGES
+            ),
+            cache_items=settings.PARSE_STAGE_CACHE_ITEMS,
+            cached_stages=[stage.strip() for stage in settings.PARSE_STAGE_CACHE_STAGES.split(',') if stage.strip()],
+            max_text_chars=settings.PARSE_MAX_TEXT_CHARS
+        )
+    return _parse_pipeline
+
+def get_parse_limits() -> ParseLimits:
+    """Upload ceilings configured in settings."""
+    return ParseLimits(
+        max_bytes=settings.PARSE_MAX_BYTES,
+        max_pages=settings.PARSE_MAX_PAGES,
+        max_text_chars=settings.PARSE_MAX_TEXT_CHARS,
+        max_uncompressed_bytes=settings.PARSE_MAX_UNCOMPRESSED_BYTES
+    )
+
+def check_upload(content: bytes, filename: Optional[str]) -> str:
+    """
+    Detect an upload's format from its content and enforce the configured
+    ceilings, without importing or running any extraction library.
+    
+    Args:
+        content: The file content in bytes
+        filename: The name of the file
+        
+    Returns:
+        Format to parse the content as: 'pdf', 'docx' or 'rtf'
+        
+    Raises:
+        ParseLimitError: If the upload exceeds a ceiling
+        UnsupportedFormatError: If the content is not a supported document
+    """
+    return detect_format(content, filename, get_parse_limits())
+
+def get_parse_stats() -> Dict[str, Any]:
+    """
+    Snapshot of parse executor, result cache and per-stage timing metrics,
+    and the documents that most recently hit a parse time or memory limit.
+    """
+    cache = get_parse_cache()
+    return {
+        "executor": _parse_executor.stats() if _parse_executor is not None else None,
+        "service": settings.PARSE_SERVICE_URL or None,
+        "incidents": _parse_executor.incidents() if _parse_executor is not None else [],
+        "cache": cache.stats() if cache is not None else None,
+        "stages": _stage_metrics.stats(),
+    }
+
+def _run_pipeline(
+    content: Union[Buffer, FileSource],
+    filename: Optional[str] = None,
+    file_format: Optional[str] = None,
+    content_digest: Optional[str] = None
+) -> PipelineResult:
+    """
+    Run the parse pipeline; this is the unit of work of the parse executor.
+    
+    Uploads spooled to disk arrive as a FileSource and are memory-mapped
+    here rather than pickled across the process boundary.
+    """
+    if isinstance(content, FileSource):
+        with map_file(content.path) as view:
+            return get_parse_pipeline().run(view, filename, file_format, content_digest)
+    return get_parse_pipeline().run(content, filename, file_format, content_digest)
+
+def _record_stages(result: PipelineResult) -> Dict[str, Any]:
+    _stage_metrics.record(result.timings, result.cache_hits)
+    logger.debug(
+        "Parsed %s resume: %s",
+        result.file_format,
+        ", ".join(f"{stage} {seconds * 1000:.1f}ms" for stage, seconds in result.timings.items())
+    )
+    return result.data
+
+def _cached_result(content: Optional[Buffer], file_format: str, digest: Optional[str] = None):
+    """
+    Look a file up in the parse cache.
+    
+    Args:
+        content: The file content; only hashed when ``digest`` is not given
+        file_format: The detected format of the file
+        digest: SHA-256 hex digest of the content, if already computed
+        
+    Returns:
+        Tuple of (cached result or None, cache key or None if caching is off)
+    """
+    cache = get_parse_cache()
+    if cache is None:
+        return None, None
+    cache_key = cache.key_for_digest(digest, file_format) if digest else cache.key_for(content, file_format)
+    cached = cache.get(cache_key)
+    # Entries do not expire, so bring current roles up to this month
+    return (refresh_timeline(cached) if cached is not None else None), cache_key
+
+async def _cached_result_async(content: Optional[Buffer], file_format: str, digest: Optional[str] = None):
+    """_cached_result for async callers; the disk tier is read in a thread."""
+    cache = get_parse_cache()
+    if cache is None:
+        return None, None
+    cache_key = cache.key_for_digest(digest, file_format) if digest else cache.key_for(content, file_format)
+    cached = await cache.aget(cache_key)
+    return (refresh_timeline(cached) if cached is not None else None), cache_key
+
+def _store_result(cache_key: Optional[str], result: Dict[str, Any]) -> None:
+    if cache_key is not None:
+        # Parser output always fits the model, which is stored more compactly
+        get_parse_cache().put(cache_key, ParsedResume.from_dict(result))
+
+async def _store_result_async(cache_key: Optional[str], result: Dict[str, Any]) -> None:
+    if cache_key is not None:
+        await get_parse_cache().aput(cache_key, ParsedResume.from_dict(result))
+
 def parse_resume(file_path: str) -> Dict[str, Any]:
     """
-    Alias for parse_resume_file to maintain compatibility with existing code.
-    Reads a file from disk and parses it.
+    Read a resume file from disk and parse it synchronously.
     
     Args:
         file_path: Path to the resume file
@@ -26,24 +247,18 @@ def parse_resume(file_path: str) -> Dict[str, Any]:
     Returns:
         Dict containing parsed resume data
     """
-    import asyncio
-    
     with open(file_path, 'rb') as f:
         content = f.read()
-    filename = os.path.basename(file_path)
-    
-    # Create a synchronous wrapper for the async function
-    loop = asyncio.new_event_loop()
-    asyncio.set_event_loop(loop)
-    try:
-        result = loop.run_until_complete(parse_resume_file(content, filename))
-        return result
-    finally:
-        loop.close()
+    return parse_resume_bytes(content, os.path.basename(file_path))
 
-async def parse_resume_file(content: bytes, filename: str) -> Dict[str, Any]:
+def parse_resume_bytes(content: bytes, filename: str) -> Dict[str, Any]:
     """
-    Parse resume file content based on file extension.
+    Parse resume file content synchronously in the calling thread.
+    
+    This is the entry point for synchronous callers (scripts, workers); it
+    shares the parse cache with parse_resume_file but never creates or uses
+    an event loop. Async code should await parse_resume_file instead so the
+    work is offloaded to the parse executor.
     
     Args:
         content: The file content in bytes
@@ -53,206 +268,221 @@ async def parse_resume_file(content: bytes, filename: str) -> Dict[str, Any]:
         Dict containing parsed resume data
         
     Raises:
+        ParseLimitError: If the upload exceeds a size, page or text ceiling
+        UnsupportedFormatError: If the content is not a supported document
         ResumeParseError: If parsing fails
-        ValueError: If file format is unsupported
     """
+    file_format = check_upload(content, filename)
+    cached, cache_key = _cached_result(content, file_format)
+    if cached is not None:
+        return cached
+    
     try:
-        file_extension = filename.split('.')[-1].lower()
-        
-        if file_extension == 'docx':
-            return await parse_docx(content)
-        elif file_extension == 'pdf':
-            return await parse_pdf(content)
-        elif file_extension == 'rtf':
-            return await parse_rtf(content)
-        elif file_extension == 'doc':
-            return await parse_doc(content)
-        else:
-            raise ValueError(f"Unsupported file format: {file_extension}")
+        result = _record_stages(_run_pipeline(content, filename, file_format))
+    except ParseLimitError:
+        raise
     except Exception as e:
         raise ResumeParseError(f"Failed to parse resume: {str(e)}")
+    
+    _store_result(cache_key, result)
+    return result
 
-def extract_sections(text: str) -> Dict[str, Any]:
+def parse_resume_content(content: bytes, filename: str) -> Dict[str, Any]:
     """
-    Extract sections from resume text using common section headers.
+    Parse resume file content in the current process, without the cache.
+    
+    The format is detected from the content by check_upload; the file
+    extension is never trusted.
     
     Args:
-        text: The raw text content of the resume
+        content: The file content in bytes
+        filename: The name of the file
         
     Returns:
-        Dict containing extracted sections
+        Dict containing parsed resume data
+        
+    Raises:
+        ParseLimitError: If the upload exceeds a size, page or text ceiling
+        UnsupportedFormatError: If the content is not a supported document
+        ResumeParseError: If parsing fails
     """
-    # Common section headers and their variations
-    section_patterns = {
-        'summary': r'(?:summary|profile|objective|about)',
-        'experience': r'(?:experience|work experience|employment|work history)',
-        'education': r'(?:education|academic|qualification)',
-        'skills': r'(?:skills|technical skills|core competencies)',
-        'projects': r'(?:projects|portfolio|work samples)',
-        'certifications': r'(?:certifications|certificates|qualifications)',
-        'languages': r'(?:languages|language proficiency)',
-        'references': r'(?:references|referees)'
-    }
-    
-    sections = {key: [] for key in section_patterns.keys()}
-    current_section = None
-    lines = text.split('\n')
-    
-    for line in lines:
-        line = line.strip()
-        if not line:
-            continue
-            
-        # Check if line is a section header
-        for section, pattern in section_patterns.items():
-            if re.search(pattern, line.lower()):
-                current_section = section
-                break
-                
-        if current_section and line:
-            sections[current_section].append(line)
-            
-    return sections
+    return _run_pipeline(content, filename, check_upload(content, filename)).data
 
-def extract_contact_info(text: str) -> Dict[str, str]:
+async def parse_resume_file(content: bytes, filename: str, digest: Optional[str] = None) -> Dict[str, Any]:
     """
-    Extract contact information from resume text.
+    Parse resume file content without blocking the event loop.
+    
+    The upload is checked by check_upload first, so bogus or oversized files
+    are rejected in milliseconds without reaching a worker. Results are then
+    looked up in the parse cache; on a miss the parse pipeline runs in the
+    parse executor's worker processes and the result is cached.
     
     Args:
-        text: The raw text content of the resume
+        content: The file content in bytes
+        filename: The name of the file
+        digest: SHA-256 hex digest of the content, if already computed
         
     Returns:
-        Dict containing contact information
+        Dict containing parsed resume data
+        
+    Raises:
+        ParseLimitError: If the upload exceeds a size, page or text ceiling,
+            or parsing exceeds the worker memory limit
+        UnsupportedFormatError: If the content is not a supported document
+        ParseQueueFullError: If the parse executor is at capacity
+        ParseTimeoutError: If parsing takes longer than the configured
+            timeout; its to_dict() gives the limit and the document
+        ResumeParseError: If parsing fails
     """
-    contact_info = {
-        'email': None,
-        'phone': None,
-        'location': None,
-        'linkedin': None,
-        'website': None
-    }
-    
-    # Email pattern
-    email_pattern = r'[\w\.-]+@[\w\.-]+\.\w+'
-    email_match = re.search(email_pattern, text)
-    if email_match:
-        contact_info['email'] = email_match.group()
-    
-    # Phone pattern (various formats)
-    phone_pattern = r'(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-    phone_match = re.search(phone_pattern, text)
-    if phone_match:
-        contact_info['phone'] = phone_match.group()
-    
-    # LinkedIn pattern
-    linkedin_pattern = r'(?:linkedin\.com/in/|linkedin:)\s*[\w-]+'
-    linkedin_match = re.search(linkedin_pattern, text.lower())
-    if linkedin_match:
-        contact_info['linkedin'] = linkedin_match.group()
+    file_format = check_upload(content, filename)
+    cached, cache_key = await _cached_result_async(content, file_format, digest)
+    if cached is not None:
+        return cached
+    return await _parse_in_executor(content, filename, file_format, digest, cache_key)
+
+async def parse_resume_upload(upload: IngestedUpload) -> Dict[str, Any]:
+    """
+    Parse an upload streamed in by app.services.upload_ingest.
     
-    # Website pattern
-    website_pattern = r'(?:https?://)?(?:www\.)?[\w-]+\.[a-zA-Z]{2,}(?:/[\w-]*)*'
-    website_match = re.search(website_pattern, text)
-    if website_match:
-        contact_info['website'] = website_match.group()
+    The digest computed while streaming is reused for the cache key, and an
+    upload spooled to disk is handed to the worker by path and memory-mapped
+    there, so its bytes are never copied into this process.
     
-    return contact_info
+    Args:
+        upload: The ingested upload; the caller closes it afterwards
+        
+    Returns:
+        Dict containing parsed resume data
+        
+    Raises:
+        See parse_resume_file
+    """
+    with upload.buffer() as view:
+        file_format = check_upload(view, upload.filename)
+    cached, cache_key = await _cached_result_async(None, file_format, upload.sha256)
+    if cached is not None:
+        return cached
+    return await _parse_in_executor(upload.source(), upload.filename, file_format, upload.sha256, cache_key)
 
-def parse_experience(experience_lines: List[str]) -> List[Dict[str, Any]]:
+def refresh_derived(
+    content: Dict[str, Any], previous: Optional[Dict[str, Any]] = None
+) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
     """
-    Parse experience section into structured data.
+    Recompute the derived data of new or edited resume content.
+    
+    Only sections whose content hash differs from ``previous`` are derived
+    again; the artifacts of the others are reused.
     
     Args:
-        experience_lines: List of lines from experience section
+        content: Resume content as uploaded or edited
+        previous: The derived data stored with the resume before the edit
         
     Returns:
-        List of parsed experience entries
+        The content with derived dates and timeline written in, and the
+        derived data to store; content without sections is returned as is
+        with no derived data
     """
-    experiences = []
-    current_experience = {}
+    sections = content.get("sections")
+    if not isinstance(sections, dict):
+        return content, None
+    derived, recomputed = derive_sections(sections, previous)
+    logger.debug(f"Derived resume sections recomputed: {', '.join(recomputed) or 'none'}")
+    return apply_derived(content, derived), derived
+
+def refresh_current_dates(
+    content: Dict[str, Any], derived: Optional[Dict[str, Any]]
+) -> Optional[Tuple[Dict[str, Any], Optional[Dict[str, Any]]]]:
+    """
+    Bring the durations of current roles in stored resume content up to this month.
     
-    for line in experience_lines:
-        # Look for date patterns
-        date_pattern = r'(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s*\d{4}\s*-\s*(?:Present|(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s*\d{4})'
-        date_match = re.search(date_pattern, line)
+    Args:
+        content: Resume content as stored
+        derived: The derived data stored with it
         
-        if date_match:
-            # If we have a previous experience, save it
-            if current_experience:
-                experiences.append(current_experience)
-            
-            # Start new experience
-            current_experience = {
-                'title': '',
-                'company': '',
-                'date_range': date_match.group(),
-                'description': []
-            }
-        elif current_experience:
-            # If line looks like a title/company
-            if not current_experience['title'] and ' - ' in line:
-                title_company = line.split(' - ')
-                current_experience['title'] = title_company[0].strip()
-                if len(title_company) > 1:
-                    current_experience['company'] = title_company[1].strip()
-            else:
-                current_experience['description'].append(line)
-    
-    # Add the last experience if exists
-    if current_experience:
-        experiences.append(current_experience)
+    Returns:
+        The updated content and derived data to store, or None if both are
+        up to date
+    """
+    sections = content.get("sections")
+    outdated = derived is not None and (is_stale(derived) or derived.get("version") != DERIVED_VERSION)
+    if outdated and isinstance(sections, dict):
+        derived, _ = derive_sections(sections, derived)
+        return apply_derived(content, derived), derived
+    refreshed = refresh_timeline(content)
+    return (refreshed, derived) if refreshed is not content else None
+
+async def _submit(
+    source: Union[Buffer, FileSource],
+    filename: str,
+    file_format: str,
+    digest: Optional[str] = None
+) -> Dict[str, Any]:
+    # Parse in the remote parse service if one is configured, else locally
+    service = get_parse_service()
+    if service is not None:
+        return await service.parse_async(source, filename)
+    job = {"filename": filename, "format": file_format, "sha256": digest}
+    return _record_stages(
+        await get_parse_executor().submit(_run_pipeline, source, filename, file_format, digest, job=job)
+    )
+
+async def _parse_in_executor(
+    source: Union[Buffer, FileSource],
+    filename: str,
+    file_format: str,
+    digest: Optional[str],
+    cache_key: Optional[str]
+) -> Dict[str, Any]:
+    try:
+        result = await _submit(source, filename, file_format, digest)
+    except (ParseQueueFullError, ParseServiceUnavailableError, ParseTimeoutError, ParseLimitError):
+        raise
+    except Exception as e:
+        raise ResumeParseError(f"Failed to parse resume: {str(e)}")
     
-    return experiences
+    await _store_result_async(cache_key, result)
+    return result
 
-def parse_education(education_lines: List[str]) -> List[Dict[str, Any]]:
+def extract_sections(text: str) -> Dict[str, Any]:
     """
-    Parse education section into structured data.
+    Extract sections from resume text using common section headers.
+    
+    Headers are recognised in a single pass by the compiled classifier in
+    cvparser.sections; see SECTION_ALIASES there for the table.
     
     Args:
-        education_lines: List of lines from education section
+        text: The raw text content of the resume
         
     Returns:
-        List of parsed education entries
+        Dict containing extracted sections
     """
-    education = []
-    current_education = {}
-    
-    for line in education_lines:
-        # Look for degree patterns
-        degree_pattern = r'(?:Bachelor|Master|PhD|B\.?S\.?|M\.?S\.?|B\.?A\.?|M\.?A\.?|B\.?E\.?|M\.?E\.?|B\.?Tech|M\.?Tech)'
-        degree_match = re.search(degree_pattern, line)
-        
-        if degree_match:
-            # If we have a previous education, save it
-            if current_education:
-                education.append(current_education)
-            
-            # Start new education
-            current_education = {
-                'degree': degree_match.group(),
-                'institution': '',
-                'date_range': '',
-                'details': []
-            }
-        elif current_education:
-            # If line looks like an institution
-            if not current_education['institution'] and ',' in line:
-                institution_date = line.split(',')
-                current_education['institution'] = institution_date[0].strip()
-                if len(institution_date) > 1:
-                    current_education['date_range'] = institution_date[1].strip()
-            else:
-                current_education['details'].append(line)
+    return split_sections(text)
+
+def extract_contact_info(text: str) -> Dict[str, str]:
+    """
+    Extract contact information from resume text.
     
-    # Add the last education if exists
-    if current_education:
-        education.append(current_education)
+    Fields are found in one scan of the header region by the precompiled
+    extractor in cvparser.contact; the rest of the text is only
+    scanned when the email, phone or LinkedIn profile is missing.
     
-    return education
+    Args:
+        text: The raw text content of the resume
+        
+    Returns:
+        Dict containing contact information
+    """
+    return extract_contact(text)
+
+async def _parse_as(content: bytes, file_format: str) -> Dict[str, Any]:
+    # Content that turns out to be another supported format is rerouted
+    filename = f"resume.{file_format}"
+    detected = check_upload(content, filename)
+    return await _submit(content, filename, detected)
 
 async def parse_docx(content: bytes) -> Dict[str, Any]:
     """
-    Parse DOCX file content.
+    Parse DOCX file content in the parse executor.
     
     Args:
         content: The file content in bytes
@@ -260,45 +490,11 @@ async def parse_docx(content: bytes) -> Dict[str, Any]:
     Returns:
         Dict containing parsed resume data
     """
-    try:
-        doc = docx.Document(io.BytesIO(content))
-        
-        # Extract text from paragraphs
-        text_content = []
-        for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                text_content.append(paragraph.text)
-        
-        raw_text = "\n".join(text_content)
-        
-        # Extract sections and contact info
-        sections = extract_sections(raw_text)
-        contact_info = extract_contact_info(raw_text)
-        
-        # Parse experience and education
-        experiences = parse_experience(sections['experience'])
-        education = parse_education(sections['education'])
-        
-        return {
-            "raw_text": raw_text,
-            "contact_info": contact_info,
-            "sections": {
-                "summary": sections['summary'][0] if sections['summary'] else "",
-                "experience": experiences,
-                "education": education,
-                "skills": sections['skills'],
-                "projects": sections['projects'],
-                "certifications": sections['certifications'],
-                "languages": sections['languages'],
-                "references": sections['references']
-            }
-        }
-    except Exception as e:
-        raise ResumeParseError(f"Failed to parse DOCX file: {str(e)}")
+    return await _parse_as(content, 'docx')
 
 async def parse_pdf(content: bytes) -> Dict[str, Any]:
     """
-    Parse PDF file content.
+    Parse PDF file content in the parse executor.
     
     Args:
         content: The file content in bytes
@@ -306,42 +502,11 @@ async def parse_pdf(content: bytes) -> Dict[str, Any]:
     Returns:
         Dict containing parsed resume data
     """
-    try:
-        with pdfplumber.open(io.BytesIO(content)) as pdf:
-            text_content = []
-            for page in pdf.pages:
-                text_content.append(page.extract_text())
-        
-        raw_text = "\n".join(text_content)
-        
-        # Extract sections and contact info
-        sections = extract_sections(raw_text)
-        contact_info = extract_contact_info(raw_text)
-        
-        # Parse experience and education
-        experiences = parse_experience(sections['experience'])
-        education = parse_education(sections['education'])
-        
-        return {
-            "raw_text": raw_text,
-            "contact_info": contact_info,
-            "sections": {
-                "summary": sections['summary'][0] if sections['summary'] else "",
-                "experience": experiences,
-                "education": education,
-                "skills": sections['skills'],
-                "projects": sections['projects'],
-                "certifications": sections['certifications'],
-                "languages": sections['languages'],
-                "references": sections['references']
-            }
-        }
-    except Exception as e:
-        raise ResumeParseError(f"Failed to parse PDF file: {str(e)}")
+    return await _parse_as(content, 'pdf')
 
 async def parse_rtf(content: bytes) -> Dict[str, Any]:
     """
-    Parse RTF file content.
+    Parse RTF file content in the parse executor.
     
     Args:
         content: The file content in bytes
@@ -349,39 +514,14 @@ async def parse_rtf(content: bytes) -> Dict[str, Any]:
     Returns:
         Dict containing parsed resume data
     """
-    try:
-        # Convert RTF to plain text using striprtf
-        rtf_text = content.decode('utf-8', errors='ignore')
-        raw_text = rtf_to_text(rtf_text)
-        
-        # Extract sections and contact info
-        sections = extract_sections(raw_text)
-        contact_info = extract_contact_info(raw_text)
-        
-        # Parse experience and education
-        experiences = parse_experience(sections['experience'])
-        education = parse_education(sections['education'])
-        
-        return {
-            "raw_text": raw_text,
-            "contact_info": contact_info,
-            "sections": {
-                "summary": sections['summary'][0] if sections['summary'] else "",
-                "experience": experiences,
-                "education": education,
-                "skills": sections['skills'],
-                "projects": sections['projects'],
-                "certifications": sections['certifications'],
-                "languages": sections['languages'],
-                "references": sections['references']
-            }
-        }
-    except Exception as e:
-        raise ResumeParseError(f"Failed to parse RTF file: {str(e)}")
+    return await _parse_as(content, 'rtf')
 
 async def parse_doc(content: bytes) -> Dict[str, Any]:
     """
-    Parse DOC file content using docx2txt.
+    Parse DOC file content in the parse executor.
+    
+    Word documents saved with a .doc name are usually OOXML archives and are
+    read by the DOCX extractor; legacy binary documents are rejected.
     
     Args:
         content: The file content in bytes
@@ -389,39 +529,4 @@ async def parse_doc(content: bytes) -> Dict[str, Any]:
     Returns:
         Dict containing parsed resume data
     """
-    try:
-        # Save content to a temporary file
-        with tempfile.NamedTemporaryFile(suffix='.doc', delete=False) as temp_file:
-            temp_file.write(content)
-            temp_file_path = temp_file.name
-        
-        # Use docx2txt to extract text from DOC file
-        raw_text = docx2txt.process(temp_file_path)
-        
-        # Clean up the temporary file
-        os.unlink(temp_file_path)
-        
-        # Extract sections and contact info
-        sections = extract_sections(raw_text)
-        contact_info = extract_contact_info(raw_text)
-        
-        # Parse experience and education
-        experiences = parse_experience(sections['experience'])
-        education = parse_education(sections['education'])
-        
-        return {
-            "raw_text": raw_text,
-            "contact_info": contact_info,
-            "sections": {
-                "summary": sections['summary'][0] if sections['summary'] else "",
-                "experience": experiences,
-                "education": education,
-                "skills": sections['skills'],
-                "projects": sections['projects'],
-                "certifications": sections['certifications'],
-                "languages": sections['languages'],
-                "references": sections['references']
-            }
-        }
-    except Exception as e:
-        raise ResumeParseError(f"Failed to parse DOC file: {str(e)}")
+    return await _parse_as(content, 'doc')
@@ -0,0 +1,193 @@
+"""
+Streaming ingestion of uploaded resume files.
+
+Uploads are read in fixed-size chunks instead of with a single ``read()``.
+The SHA-256 digest and size are computed as the chunks arrive, the byte
+ceiling is enforced before the rest of an oversized upload is read, and
+anything larger than the spool threshold is written to a temporary file
+rather than held in memory. The parser then gets one buffer: the in-memory
+bytes, or the spooled file, which parse workers memory-map by path.
+
+FastAPI's UploadFile has already been received into a SpooledTemporaryFile,
+which may be on disk and has no path the workers could map. It is read
+directly through its ``file`` in a worker thread, so neither the reads nor
+the spool writes block the event loop.
+"""
+import asyncio
+import hashlib
+import logging
+import os
+import tempfile
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Optional, Union
+
+from app.core.config import settings
+from cvparser.buffers import Buffer, FileSource, map_file
+from cvparser.errors import ParseLimitError
+
+logger = logging.getLogger(__name__)
+
+# Size of each read from the incoming upload
+CHUNK_SIZE = 64 * 1024
+
+
+class IngestedUpload:
+    """
+    An upload that has been fully received, in memory or spooled to disk.
+    
+    Use it as a context manager, or call close(), to remove the spool file.
+    """
+
+    def __init__(self, filename: str, size: int, sha256: str, data: Optional[bytearray] = None, path: Optional[str] = None):
+        self.filename = filename
+        self.size = size
+        self.sha256 = sha256
+        self.data = data
+        self.path = path
+
+    @property
+    def spooled(self) -> bool:
+        """Whether the content was written to a temporary file."""
+        return self.path is not None
+
+    def source(self) -> Union[bytearray, FileSource]:
+        """Content to hand to a parse worker: the bytes, or the spool file's path."""
+        if self.path is not None:
+            return FileSource(self.path)
+        return self.data
+
+    @contextmanager
+    def buffer(self) -> Iterator[Buffer]:
+        """Yield the content as a buffer, memory-mapping a spooled file."""
+        if self.path is not None:
+            with map_file(self.path) as view:
+                yield view
+        else:
+            yield self.data
+
+    def close(self) -> None:
+        """Remove the spool file, if any."""
+        if self.path is not None:
+            try:
+                os.unlink(self.path)
+            except FileNotFoundError:
+                pass
+            self.path = None
+
+    def __enter__(self) -> "IngestedUpload":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class _Receiver:
+    """Hash, size-check and, past the spool threshold, spool incoming chunks."""
+
+    def __init__(self, filename: str, max_bytes: int, spool_threshold: int, directory: Optional[str]):
+        self.filename = filename
+        self.max_bytes = max_bytes
+        self.spool_threshold = spool_threshold
+        self.directory = directory
+        self.digest = hashlib.sha256()
+        self.size = 0
+        self.data = bytearray()
+        self.spool = None
+
+    def writes_to_disk(self, length: int) -> bool:
+        """Whether adding ``length`` more bytes writes to the spool file."""
+        return self.spool is not None or self.size + length > self.spool_threshold
+
+    def add(self, chunk: bytes) -> None:
+        self.size += len(chunk)
+        if self.size > self.max_bytes:
+            raise ParseLimitError(f"File is larger than the {self.max_bytes} byte limit")
+        self.digest.update(chunk)
+        if self.spool is None and self.size > self.spool_threshold:
+            suffix = os.path.splitext(self.filename)[1]
+            self.spool = tempfile.NamedTemporaryFile(prefix="upload-", suffix=suffix, dir=self.directory, delete=False)
+            self.spool.write(self.data)
+            self.data = bytearray()
+        if self.spool is not None:
+            self.spool.write(chunk)
+        else:
+            self.data += chunk
+
+    def finish(self) -> IngestedUpload:
+        if self.spool is not None:
+            self.spool.close()
+            logger.debug(f"Spooled {self.size} byte upload {self.filename} to {self.spool.name}")
+            return IngestedUpload(self.filename, self.size, self.digest.hexdigest(), path=self.spool.name)
+        return IngestedUpload(self.filename, self.size, self.digest.hexdigest(), data=self.data)
+
+    def discard(self) -> None:
+        if self.spool is not None:
+            self.spool.close()
+            os.unlink(self.spool.name)
+            self.spool = None
+
+
+def _receive_file(file: BinaryIO, receiver: _Receiver, chunk_size: int) -> IngestedUpload:
+    """Read a local file object to the end; blocking, so run in a thread."""
+    while True:
+        chunk = file.read(chunk_size)
+        if not chunk:
+            return receiver.finish()
+        receiver.add(chunk)
+
+
+async def ingest_upload(
+    upload,
+    max_bytes: Optional[int] = None,
+    spool_threshold: Optional[int] = None,
+    directory: Optional[str] = None,
+    chunk_size: int = CHUNK_SIZE,
+) -> IngestedUpload:
+    """
+    Stream an upload in chunks, hashing it and spooling large files to disk.
+    
+    Args:
+        upload: FastAPI's UploadFile, or any object with an async
+            ``read(size)`` and a ``filename``
+        max_bytes: Largest accepted upload; defaults to PARSE_MAX_BYTES
+        spool_threshold: Uploads larger than this go to a temporary file;
+            defaults to UPLOAD_SPOOL_THRESHOLD_BYTES
+        directory: Directory for spool files; defaults to UPLOAD_SPOOL_DIR
+            or the system temporary directory
+        chunk_size: Bytes read per chunk
+    
+    Returns:
+        IngestedUpload with the content, its size and SHA-256 hex digest
+    
+    Raises:
+        ParseLimitError: If the upload is larger than ``max_bytes``; an
+            upload of known size is rejected before it is read, otherwise
+            reading stops at the first chunk past the limit
+    """
+    if max_bytes is None:
+        max_bytes = settings.PARSE_MAX_BYTES
+    if spool_threshold is None:
+        spool_threshold = settings.UPLOAD_SPOOL_THRESHOLD_BYTES
+    if directory is None:
+        directory = settings.UPLOAD_SPOOL_DIR or None
+
+    size = getattr(upload, "size", None)
+    if isinstance(size, int) and size > max_bytes:
+        raise ParseLimitError(f"File is larger than the {max_bytes} byte limit")
+
+    receiver = _Receiver(upload.filename or "", max_bytes, spool_threshold, directory)
+    try:
+        file = getattr(upload, "file", None)
+        if file is not None:
+            return await asyncio.to_thread(_receive_file, file, receiver, chunk_size)
+        while True:
+            chunk = await upload.read(chunk_size)
+            if not chunk:
+                return receiver.finish()
+            if receiver.writes_to_disk(len(chunk)):
+                await asyncio.to_thread(receiver.add, chunk)
+            else:
+                receiver.add(chunk)
+    except BaseException:
+        receiver.discard()
+        raise
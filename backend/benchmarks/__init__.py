@@ -0,0 +1,6 @@
+"""
+Performance benchmarks for the PerfectCV backend.
+
+Run individual benchmarks from the backend directory, e.g.
+``python -m benchmarks.bench_sections``.
+"""
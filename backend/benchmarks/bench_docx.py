@@ -0,0 +1,81 @@
+"""
+Benchmark: streaming OOXML extractor vs. python-docx.
+
+Reports extraction time and peak Python memory (tracemalloc) for synthetic
+documents of increasing size, then compares extracted lines on the DOCX files
+in ``standalone/test_files`` plus synthetic documents with header and table
+content: "recall" is the share of python-docx paragraphs the streaming
+extractor also returns, "extra" the lines only it finds.
+
+Usage:
+    python -m benchmarks.bench_docx [--corpus DIR]
+"""
+import argparse
+import glob
+import io
+import os
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+import docx
+
+from cvparser.ooxml import iter_paragraphs
+from benchmarks.corpus import make_resume_docx
+
+DEFAULT_CORPUS = os.path.join(os.path.dirname(__file__), "..", "..", "standalone", "test_files")
+
+
+def python_docx_lines(content: bytes) -> List[str]:
+    return [p.text for p in docx.Document(io.BytesIO(content)).paragraphs if p.text.strip()]
+
+
+def streaming_lines(content: bytes) -> List[str]:
+    return [text for text in iter_paragraphs(content) if text.strip()]
+
+
+def measure(fn: Callable[[bytes], List[str]], content: bytes, repeat: int) -> Tuple[float, int]:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn(content)
+        best = min(best, time.perf_counter() - started)
+    tracemalloc.start()
+    fn(content)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--corpus", default=DEFAULT_CORPUS, help="Directory of .docx files for the accuracy check")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best is reported)")
+    args = parser.parse_args()
+
+    print("Speed and memory")
+    print(f"{'jobs':>6} {'KiB':>6} {'python-docx ms':>15} {'streaming ms':>13} {'speedup':>8} {'python-docx MiB':>16} {'streaming MiB':>14}")
+    for jobs in (5, 50, 200, 800):
+        content = make_resume_docx(jobs=jobs, bullets_per_job=6, seed=jobs)
+        slow, slow_peak = measure(python_docx_lines, content, args.repeat)
+        fast, fast_peak = measure(streaming_lines, content, args.repeat)
+        print(
+            f"{jobs:>6} {len(content) // 1024:>6} {slow * 1000:>15.1f} {fast * 1000:>13.1f} {slow / fast:>7.1f}x "
+            f"{slow_peak / 2**20:>16.2f} {fast_peak / 2**20:>14.2f}"
+        )
+
+    documents = [(path, open(path, "rb").read()) for path in sorted(glob.glob(os.path.join(args.corpus, "*.docx")))]
+    documents += [(f"synthetic-layout-{seed}.docx", make_resume_docx(seed=seed)) for seed in range(3)]
+    print("\nAccuracy")
+    print(f"{'document':<40} {'python-docx':>12} {'streaming':>10} {'recall':>7} {'extra':>6}")
+    for name, content in documents:
+        expected = python_docx_lines(content)
+        actual = streaming_lines(content)
+        found = set(actual)
+        recall = sum(1 for line in expected if line in found) / len(expected) if expected else 1.0
+        extra = len(found - set(expected))
+        print(f"{os.path.basename(name):<40} {len(expected):>12} {len(actual):>10} {recall:>6.0%} {extra:>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark: job description analysis latency, sequential vs. parallel vs.
+single-call, against a local fake LLM.
+
+The fake stands in for the shared OpenAI client and answers every completion
+after a fixed delay (plus optional jitter), so the comparison shows how the
+analysis is scheduled rather than how fast the model is; the response cache
+is disabled. ``sequential`` is the previous behaviour: the four field
+extractions awaited one after another.
+
+Usage:
+    python -m benchmarks.bench_jd_analyzer [--delays 0.05,0.2,0.5] [--jitter 0.0] [--repeat 3]
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from types import SimpleNamespace
+from typing import Any, Dict, List, Optional
+from unittest import mock
+
+from app.core.config import settings
+from app.services import jd_analyzer
+from app.services.openai import client as openai_client
+
+JD_TEXT = (
+    "Senior Backend Engineer. You will design and run Python services on AWS, "
+    "mentor engineers and own our PostgreSQL data model. Requirements: 5+ years "
+    "of Python, experience with Kubernetes and strong communication skills."
+)
+
+MODES = ("sequential", "parallel", "single")
+
+
+class FakeLLM:
+    """
+    Stand-in for AsyncOpenAI answering chat completions after ``delay``
+    seconds. Prompts listed in ``fail`` (by a word of their system message)
+    raise, and those in ``slow`` take ``slow_delay`` seconds instead.
+    """
+
+    def __init__(
+        self,
+        delay: float,
+        jitter: float = 0.0,
+        fail: Optional[List[str]] = None,
+        slow: Optional[List[str]] = None,
+        slow_delay: float = 10.0,
+    ):
+        self.delay = delay
+        self.jitter = jitter
+        self.fail = fail or []
+        self.slow = slow or []
+        self.slow_delay = slow_delay
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, model: str, messages: List[Dict[str, str]], **kwargs: Any):
+        self.calls += 1
+        system = messages[0]["content"].lower()
+        delay = self.slow_delay if any(word in system for word in self.slow) else self.delay
+        await asyncio.sleep(delay + random.uniform(0, self.jitter))
+        if any(word in system for word in self.fail):
+            raise RuntimeError("fake LLM error")
+        if "json" in system:
+            content = json.dumps({
+                "skills": ["Python", "AWS", "Kubernetes"],
+                "summary": "Senior backend engineer on Python services.",
+                "requirements": ["5+ years of Python"],
+                "responsibilities": ["Design Python services"],
+            })
+        elif "skills" in system:
+            content = "Python, AWS, Kubernetes"
+        elif "summaries" in system:
+            content = "Senior backend engineer on Python services."
+        elif "requirements" in system:
+            content = "5+ years of Python\nKubernetes"
+        else:
+            content = "Design Python services\nMentor engineers"
+        return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=content))])
+
+
+async def analyze_sequentially(jd_text: str) -> Dict[str, Any]:
+    """The four extractions awaited one after another, as before."""
+    return {
+        "skills": await jd_analyzer.extract_skills(jd_text),
+        "summary": await jd_analyzer.generate_job_summary(jd_text),
+        "requirements": await jd_analyzer.extract_requirements(jd_text),
+        "responsibilities": await jd_analyzer.extract_responsibilities(jd_text),
+    }
+
+
+async def timed(mode: str, llm: FakeLLM) -> float:
+    """Seconds one analysis takes in ``mode`` with ``llm`` as the client, uncached."""
+    with mock.patch.object(openai_client, "get_openai_client", return_value=llm), \
+            mock.patch.object(settings, "LLM_CACHE_ENABLED", False), \
+            mock.patch.object(openai_client, "_response_cache", None):
+        started = time.perf_counter()
+        if mode == "sequential":
+            await analyze_sequentially(JD_TEXT)
+        else:
+            await jd_analyzer.analyze_job_description(JD_TEXT, mode=mode)
+        return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--delays', default='0.05,0.2,0.5', help='Comma-separated fake LLM delays in seconds')
+    parser.add_argument('--jitter', type=float, default=0.0, help='Extra random delay of up to this many seconds')
+    parser.add_argument('--repeat', type=int, default=3, help='Analyses per mode and delay (best is reported)')
+    args = parser.parse_args()
+
+    print(f"{'delay s':>8} " + " ".join(f"{mode + ' ms':>14}" for mode in MODES) + f" {'speedup':>8}")
+    for delay in (float(value) for value in args.delays.split(',')):
+        best = {
+            mode: min(asyncio.run(timed(mode, FakeLLM(delay, args.jitter))) for _ in range(args.repeat))
+            for mode in MODES
+        }
+        print(
+            f"{delay:>8.2f} " + " ".join(f"{best[mode] * 1000:>14.1f}" for mode in MODES)
+            + f" {best['sequential'] / best['parallel']:>7.1f}x"
+        )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,96 @@
+"""
+Benchmark: ParsedResume slots records vs. the nested dict form.
+
+For parsed synthetic resumes of increasing size, reports the memory held by
+one resume in each form (tracemalloc, freshly decoded so no strings are
+shared), the time to walk every experience entry, to deep-copy, and to
+serialize and load (JSON for dicts, to_bytes/from_bytes for the model) with
+the serialized size. ``--no-raw-text`` drops the raw text, which dominates
+memory and is the same string in both forms.
+
+Usage:
+    python -m benchmarks.bench_model [--repeat N] [--no-raw-text]
+"""
+import argparse
+import copy
+import json
+import timeit
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from cvparser.model import ParsedResume
+from app.services.resume_parser import parse_resume_content
+from benchmarks.corpus import make_resume_docx
+
+
+def held_bytes(build: Callable[[], Any]) -> int:
+    tracemalloc.start()
+    value = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del value
+    return size
+
+
+def walk_dict(data: Dict[str, Any]) -> int:
+    words = 0
+    for entry in data["sections"]["experience"]:
+        words += len(entry["title"].split()) + len(entry["company"].split())
+        for line in entry["description"]:
+            words += len(line.split())
+    return words
+
+
+def walk_model(resume: ParsedResume) -> int:
+    words = 0
+    for entry in resume.experience:
+        words += len(entry.title.split()) + len(entry.company.split())
+        for line in entry.description:
+            words += len(line.split())
+    return words
+
+
+def per_call_us(fn: Callable[[], Any], repeat: int) -> float:
+    timer = timeit.Timer(fn)
+    number, _ = timer.autorange()
+    return min(timer.repeat(repeat, number)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions (best is reported)")
+    parser.add_argument("--no-raw-text", action="store_true", help="Drop raw_text before measuring")
+    args = parser.parse_args()
+
+    print(
+        f"{'jobs':>5} {'dict KiB':>9} {'model KiB':>10} "
+        f"{'walk dict us':>13} {'walk model us':>14} "
+        f"{'deepcopy us':>12} {'model copy us':>14} "
+        f"{'json KiB':>9} {'bytes KiB':>10} {'json load us':>13} {'bytes load us':>14} {'json dump us':>13} {'bytes dump us':>14}"
+    )
+    for jobs in (3, 10, 40, 160):
+        data = parse_resume_content(make_resume_docx(jobs=jobs, bullets_per_job=6, seed=jobs), "resume.docx")
+        if args.no_raw_text:
+            data["raw_text"] = ""
+        resume = ParsedResume.from_dict(data)
+        blob = json.dumps(data, separators=(",", ":"))
+        packed = resume.to_bytes()
+
+        dict_bytes = held_bytes(lambda: json.loads(blob))
+        model_bytes = held_bytes(lambda: ParsedResume.from_bytes(packed))
+        print(
+            f"{jobs:>5} {dict_bytes / 1024:>9.1f} {model_bytes / 1024:>10.1f} "
+            f"{per_call_us(lambda: walk_dict(data), args.repeat):>13.1f} "
+            f"{per_call_us(lambda: walk_model(resume), args.repeat):>14.1f} "
+            f"{per_call_us(lambda: copy.deepcopy(data), args.repeat):>12.1f} "
+            f"{per_call_us(resume.copy, args.repeat):>14.1f} "
+            f"{len(blob) / 1024:>9.1f} {len(packed) / 1024:>10.1f} "
+            f"{per_call_us(lambda: json.loads(blob), args.repeat):>13.1f} "
+            f"{per_call_us(lambda: ParsedResume.from_bytes(packed), args.repeat):>14.1f} "
+            f"{per_call_us(lambda: json.dumps(data, separators=(',', ':')), args.repeat):>13.1f} "
+            f"{per_call_us(resume.to_bytes, args.repeat):>14.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
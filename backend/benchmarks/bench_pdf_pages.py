@@ -0,0 +1,47 @@
+"""
+Benchmark: serial vs. page-sharded PDF text extraction by page count.
+
+Every sharded result is checked against the serial output before timings are
+reported.
+
+Usage:
+    python -m benchmarks.bench_pdf_pages [--workers N] [--pages 1,10,20,40,60]
+"""
+import argparse
+import time
+
+from cvparser.pdf import extract_pdf_text
+from benchmarks.corpus import make_resume_pdf
+
+
+def best_of(repeat, fn, *args, **kwargs):
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        started = time.perf_counter()
+        result = fn(*args, **kwargs)
+        best = min(best, time.perf_counter() - started)
+    return best, result
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--workers", type=int, default=4, help="Processes per sharded document")
+    parser.add_argument("--pages", default="1,5,10,20,40,60", help="Comma-separated page counts")
+    parser.add_argument("--repeat", type=int, default=3, help="Timing repetitions (best is reported)")
+    args = parser.parse_args()
+
+    print(f"{'pages':>6} {'serial s':>9} {'sharded s':>10} {'speedup':>8}")
+    for pages in (int(value) for value in args.pages.split(",")):
+        content = make_resume_pdf(pages, seed=pages)
+        serial, serial_text = best_of(args.repeat, extract_pdf_text, content)
+        sharded, sharded_text = best_of(
+            args.repeat, extract_pdf_text, content, shard_threshold=1, max_workers=args.workers
+        )
+        if sharded_text != serial_text:
+            raise SystemExit(f"Sharded output differs from serial output for {pages} pages")
+        print(f"{pages:>6} {serial:>9.3f} {sharded:>10.3f} {serial / sharded:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Micro-benchmark: compiled single-pass section classifier vs. the previous
+per-pattern ``re.search`` loop in extract_sections.
+
+Usage:
+    python -m benchmarks.bench_sections [--repeat N]
+"""
+import argparse
+import re
+import timeit
+from typing import Any, Dict
+
+from cvparser.sections import split_sections
+from benchmarks.corpus import make_resume_text
+
+
+def legacy_extract_sections(text: str) -> Dict[str, Any]:
+    """The extract_sections implementation this benchmark replaces."""
+    section_patterns = {
+        'summary': r'(?:summary|profile|objective|about)',
+        'experience': r'(?:experience|work experience|employment|work history)',
+        'education': r'(?:education|academic|qualification)',
+        'skills': r'(?:skills|technical skills|core competencies)',
+        'projects': r'(?:projects|portfolio|work samples)',
+        'certifications': r'(?:certifications|certificates|qualifications)',
+        'languages': r'(?:languages|language proficiency)',
+        'references': r'(?:references|referees)'
+    }
+    sections = {key: [] for key in section_patterns.keys()}
+    current_section = None
+    for line in text.split('\n'):
+        line = line.strip()
+        if not line:
+            continue
+        for section, pattern in section_patterns.items():
+            if re.search(pattern, line.lower()):
+                current_section = section
+                break
+        if current_section and line:
+            sections[current_section].append(line)
+    return sections
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=5, help='Timing repetitions per size (best is reported)')
+    args = parser.parse_args()
+
+    print(f"{'jobs':>6} {'lines':>7} {'legacy ms':>10} {'compiled ms':>12} {'speedup':>8}")
+    for jobs in (5, 30, 150, 600):
+        text = make_resume_text(jobs=jobs, bullets_per_job=6, seed=jobs)
+        lines = text.count('\n') + 1
+        number = max(1, 3000 // lines)
+        legacy = min(timeit.repeat(lambda: legacy_extract_sections(text), number=number, repeat=args.repeat)) / number
+        compiled = min(timeit.repeat(lambda: split_sections(text), number=number, repeat=args.repeat)) / number
+        print(f"{jobs:>6} {lines:>7} {legacy * 1000:>10.3f} {compiled * 1000:>12.3f} {legacy / compiled:>7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
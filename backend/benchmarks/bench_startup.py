@@ -0,0 +1,157 @@
+"""
+Benchmark: API cold-start import cost.
+
+Imports the app in fresh interpreters under ``python -X importtime`` and
+reports the cumulative and self import time of the costliest modules, best
+of ``--repeat`` runs. Exits with status 1 if importing the app exceeds the
+time budget, a module exceeds its own budget, or any module that must stay
+lazily imported (LAZY_MODULES) is loaded at startup, so this can gate CI.
+
+Usage:
+    python -m benchmarks.bench_startup [--budget-ms 1500] [--module-budget app.api.v1.api=800]
+                                       [--repeat 5] [--top 20] [--json startup.json]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, NamedTuple, Sequence
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+
+# Heavy dependencies that the API must only import on first use
+LAZY_MODULES = (
+    "openai",
+    "stripe",
+    "pdfplumber",
+    "pdfminer",
+    "docx",
+    "docx2txt",
+    "striprtf",
+    "pdfkit",
+    "jinja2",
+)
+
+
+class ImportRecord(NamedTuple):
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+
+
+def parse_importtime(output: str) -> List[ImportRecord]:
+    """Parse the ``-X importtime`` lines of an interpreter's stderr."""
+    records = []
+    for line in output.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue
+        name = fields[2].rstrip()
+        module = name.lstrip()
+        records.append(ImportRecord(module, int(fields[0]), int(fields[1]), (len(name) - len(module) - 1) // 2))
+    return records
+
+
+def measure(target: str, repeat: int) -> Dict[str, ImportRecord]:
+    """
+    Import ``target`` in ``repeat`` fresh interpreters.
+
+    Returns:
+        Module name -> record of its fastest import
+    """
+    best: Dict[str, ImportRecord] = {}
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+            cwd=BACKEND_DIR,
+            capture_output=True,
+            text=True,
+        )
+        if completed.returncode != 0:
+            raise SystemExit(f"Importing {target} failed:\n{completed.stderr}")
+        for record in parse_importtime(completed.stderr):
+            if record.module not in best or record.cumulative_us < best[record.module].cumulative_us:
+                best[record.module] = record
+    return best
+
+
+def check_budgets(
+    records: Dict[str, ImportRecord],
+    target: str,
+    budget_ms: float,
+    module_budgets: Dict[str, float],
+    lazy_modules: Sequence[str],
+) -> List[str]:
+    """Return a description of every budget that was exceeded."""
+    failures = []
+    total_ms = records[target].cumulative_us / 1000
+    if budget_ms and total_ms > budget_ms:
+        failures.append(f"importing {target} took {total_ms:.0f}ms; the budget is {budget_ms:.0f}ms")
+    for module, limit in module_budgets.items():
+        if module in records and records[module].cumulative_us / 1000 > limit:
+            failures.append(
+                f"importing {module} took {records[module].cumulative_us / 1000:.0f}ms; the budget is {limit:.0f}ms"
+            )
+    for module in lazy_modules:
+        if module in records:
+            failures.append(f"{module} is imported at startup but should only be imported on first use")
+    return failures
+
+
+def parse_module_budget(value: str) -> tuple:
+    module, _, limit = value.partition("=")
+    if not module or not limit:
+        raise argparse.ArgumentTypeError(f"expected MODULE=MS, got {value!r}")
+    return module, float(limit)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--target", default="app.main", help="Module whose import is measured")
+    parser.add_argument("--budget-ms", type=float, default=1500, help="Import time budget for the target (0 disables)")
+    parser.add_argument(
+        "--module-budget", type=parse_module_budget, action="append", default=[], metavar="MODULE=MS",
+        help="Cumulative import time budget for one module; may be repeated",
+    )
+    parser.add_argument("--allow", action="append", default=[], help="Module allowed at startup despite LAZY_MODULES")
+    parser.add_argument("--repeat", type=int, default=5, help="Interpreter runs (best is reported)")
+    parser.add_argument("--top", type=int, default=20, help="Modules listed by cumulative and by self time")
+    parser.add_argument("--json", dest="json_path", help="Also write every module's timings to this file")
+    args = parser.parse_args()
+
+    records = measure(args.target, args.repeat)
+    ranked = sorted(records.values(), key=lambda record: record.cumulative_us, reverse=True)
+    print(f"{'cumulative ms':>13} {'self ms':>8}  module")
+    for record in ranked[:args.top]:
+        print(f"{record.cumulative_us / 1000:>13.1f} {record.self_us / 1000:>8.1f}  {'  ' * record.depth}{record.module}")
+    print(f"\n{'self ms':>8}  module")
+    for record in sorted(records.values(), key=lambda record: record.self_us, reverse=True)[:args.top]:
+        print(f"{record.self_us / 1000:>8.1f}  {record.module}")
+
+    lazy_modules = [module for module in LAZY_MODULES if module not in args.allow]
+    failures = check_budgets(records, args.target, args.budget_ms, dict(args.module_budget), lazy_modules)
+    if args.json_path:
+        with open(args.json_path, "w") as f:
+            json.dump(
+                {
+                    "target": args.target,
+                    "repeat": args.repeat,
+                    "modules": {record.module: record._asdict() for record in ranked},
+                    "failures": failures,
+                },
+                f,
+                indent=2,
+            )
+
+    print(f"\n{args.target}: {records[args.target].cumulative_us / 1000:.0f}ms")
+    for failure in failures:
+        print(f"OVER BUDGET: {failure}")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Compare two benchmarks.run result files and flag regressions.
+
+A case regresses when its p95 latency or peak RSS grew by more than the
+threshold. The exit status is 1 if any case regressed, so this can gate CI.
+
+Usage:
+    python -m benchmarks.compare base.json new.json [--threshold 10] [--rss-threshold 10]
+"""
+import argparse
+import json
+import sys
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+CaseKey = Tuple[str, str, int, int, int]
+
+
+def load_results(path: str) -> Dict[CaseKey, Dict[str, Any]]:
+    with open(path) as f:
+        report = json.load(f)
+    return {
+        (result["target"], result["format"], result["pages"], result["jobs"], result["sections"]): result
+        for result in report["results"]
+    }
+
+
+def change_pct(base: float, new: float) -> float:
+    return (new - base) / base * 100 if base else 0.0
+
+
+def compare(
+    base: Dict[CaseKey, Dict[str, Any]],
+    new: Dict[CaseKey, Dict[str, Any]],
+    threshold: float,
+    rss_threshold: float,
+) -> Tuple[List[str], int]:
+    """
+    Build a report line per case present in both runs.
+
+    Returns:
+        Tuple of (report lines, number of regressed cases)
+    """
+    lines = [
+        f"{'target':<21} {'format':<6} {'pages':>5} {'jobs':>4} {'sect':>4} "
+        f"{'p95 base':>10} {'p95 new':>10} {'change':>8} {'rss change':>10}"
+    ]
+    regressions = 0
+    for key in sorted(base.keys() & new.keys()):
+        p95 = change_pct(base[key]["latency_ms"]["p95"], new[key]["latency_ms"]["p95"])
+        rss = change_pct(base[key]["peak_rss_mb"], new[key]["peak_rss_mb"])
+        flags = []
+        if p95 > threshold:
+            flags.append("SLOWER")
+        if rss > rss_threshold:
+            flags.append("MORE MEMORY")
+        regressions += bool(flags)
+        target, file_format, pages, jobs, sections = key
+        lines.append(
+            f"{target:<21} {file_format:<6} {pages:>5} {jobs:>4} {sections:>4} "
+            f"{base[key]['latency_ms']['p95']:>10.2f} {new[key]['latency_ms']['p95']:>10.2f} "
+            f"{p95:>+7.1f}% {rss:>+9.1f}%  {' '.join(flags)}".rstrip()
+        )
+    for key in sorted(base.keys() - new.keys()):
+        lines.append(f"missing from new run: {' '.join(map(str, key))}")
+    for key in sorted(new.keys() - base.keys()):
+        lines.append(f"new case: {' '.join(map(str, key))}")
+    return lines, regressions
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("base", help="Results of the baseline commit")
+    parser.add_argument("new", help="Results of the commit under test")
+    parser.add_argument("--threshold", type=float, default=10.0, help="Allowed p95 increase in percent")
+    parser.add_argument("--rss-threshold", type=float, default=10.0, help="Allowed peak RSS increase in percent")
+    args = parser.parse_args(argv)
+
+    lines, regressions = compare(
+        load_results(args.base), load_results(args.new), args.threshold, args.rss_threshold
+    )
+    print("\n".join(lines))
+    if regressions:
+        print(f"\n{regressions} case(s) regressed", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,282 @@
+"""
+Synthetic resume generator for benchmarks.
+
+Documents are generated deterministically from a seed in every format the
+parser accepts, at controlled sizes: page count, number of positions in the
+experience section and number of other sections. Write a corpus to disk with
+
+    python -m benchmarks.corpus --out /tmp/corpus
+"""
+import argparse
+import io
+import itertools
+import os
+import random
+from typing import Iterator, List, NamedTuple, Optional, Sequence
+
+FIRST_NAMES = ["Jane", "John", "Amara", "Wei", "Priya", "Lukas", "Sofia", "Kwame"]
+LAST_NAMES = ["Doe", "Smith", "Okafor", "Chen", "Patel", "Muller", "Rossi", "Mensah"]
+TITLES = ["Software Engineer", "Data Analyst", "Product Manager", "Designer", "DevOps Engineer"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Ltd", "Stark Industries", "Wayne Enterprises"]
+MONTHS = ["Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec"]
+SKILLS = ["Python", "SQL", "AWS", "Docker", "React", "Kubernetes", "Terraform", "Go", "Spark"]
+BULLET_VERBS = ["Led", "Built", "Designed", "Improved", "Migrated", "Automated", "Launched"]
+BULLET_OBJECTS = [
+    "the billing platform", "a data pipeline processing 2M events a day",
+    "customer onboarding, cutting time to value by 30%", "our experience with cloud tooling",
+    "the on-call process", "an internal analytics dashboard", "the mobile release train",
+]
+
+
+# Sections after experience, in the order they are added
+OPTIONAL_SECTIONS = ["education", "skills", "projects", "certifications", "languages", "references"]
+
+
+def make_resume_lines(jobs: int = 5, bullets_per_job: int = 4, seed: int = 0, sections: int = 7) -> List[str]:
+    """
+    Build the lines of a plain-text resume with a realistic section layout.
+    
+    Args:
+        jobs: Number of positions in the experience section
+        bullets_per_job: Description lines per position
+        seed: Random seed, so runs are reproducible
+        sections: Number of sections besides experience (summary first,
+            then OPTIONAL_SECTIONS in order)
+        
+    Returns:
+        List of text lines
+    """
+    rng = random.Random(seed)
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    lines = [
+        name,
+        f"{name.lower().replace(' ', '.')}@example.com | (555) 010-{rng.randint(1000, 9999)}",
+        "linkedin.com/in/" + name.lower().replace(' ', ''),
+    ]
+    if sections > 0:
+        lines += [
+            "Summary",
+            "Engineer with a track record of shipping reliable products and mentoring teams.",
+        ]
+    lines.append("Experience")
+    year = 2024
+    for _ in range(jobs):
+        start = year - rng.randint(1, 3)
+        lines.append(f"{rng.choice(MONTHS)} {start} - {rng.choice(MONTHS)} {year}")
+        lines.append(f"{rng.choice(TITLES)} - {rng.choice(COMPANIES)}")
+        for _ in range(bullets_per_job):
+            lines.append(f"• {rng.choice(BULLET_VERBS)} {rng.choice(BULLET_OBJECTS)}")
+        year = start
+    optional = {
+        "education": ["Education", "BSc Computer Science", f"State University, {year - 4}"],
+        "skills": ["Skills", ", ".join(rng.sample(SKILLS, 5))],
+        "projects": ["Projects", "Open-source contributor to a static site generator"],
+        "certifications": ["Certifications", "AWS Certified Solutions Architect"],
+        "languages": ["Languages", "English, French"],
+        "references": ["References", "Available on request"],
+    }
+    for section in OPTIONAL_SECTIONS[:max(0, sections - 1)]:
+        lines += optional[section]
+    return lines
+
+
+def make_resume_text(jobs: int = 5, bullets_per_job: int = 4, seed: int = 0) -> str:
+    """Build a plain-text resume; see make_resume_lines."""
+    return "\n".join(make_resume_lines(jobs, bullets_per_job, seed))
+
+
+LINES_PER_PDF_PAGE = 55
+
+
+def _pdf_escape(line: str) -> str:
+    line = line.replace("•", "-").encode("latin-1", "replace").decode("latin-1")
+    return line.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(pages: List[List[str]]) -> bytes:
+    """
+    Write a minimal text-only PDF with one list of lines per page.
+    
+    Only the standard Helvetica font is used, so no external library is
+    needed to produce benchmark inputs.
+    """
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for lines in pages:
+        stream = "BT /F1 10 Tf 12 TL 50 780 Td\n" + "".join(f"({_pdf_escape(line)}) '\n" for line in lines) + "ET"
+        stream_bytes = stream.encode("latin-1")
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream_bytes), stream_bytes))
+        content_ref = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_ref
+        )
+        kids.append(b"%d 0 R" % len(objects))
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (b" ".join(kids), len(kids))
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(out)
+
+
+def paginate(lines: List[str], pages: int) -> List[List[str]]:
+    """
+    Repeat or truncate ``lines`` to fill exactly ``pages`` pages of
+    LINES_PER_PDF_PAGE lines each.
+    """
+    needed = pages * LINES_PER_PDF_PAGE
+    filled = list(itertools.islice(itertools.cycle(lines), needed))
+    return [filled[i:i + LINES_PER_PDF_PAGE] for i in range(0, needed, LINES_PER_PDF_PAGE)]
+
+
+def make_resume_pdf(pages: int, seed: int = 0, jobs: Optional[int] = None, sections: int = 7) -> bytes:
+    """
+    Build a PDF resume of exactly ``pages`` pages, repeating content until
+    every page is filled. ``jobs`` defaults to enough positions to fill the
+    pages without repetition.
+    """
+    if jobs is None:
+        jobs = max(1, pages * 8)
+    return make_pdf(paginate(make_resume_lines(jobs=jobs, bullets_per_job=5, seed=seed, sections=sections), pages))
+
+
+def _rtf_escape(line: str) -> str:
+    escaped = line.replace("\\", "\\\\").replace("{", "\\{").replace("}", "\\}")
+    return "".join(ch if ord(ch) < 128 else f"\\u{ord(ch)}?" for ch in escaped)
+
+
+def make_rtf(lines: Sequence[str]) -> bytes:
+    """Write a minimal RTF document with one paragraph per line."""
+    body = "".join(f"{_rtf_escape(line)}\\par\n" for line in lines)
+    return ("{\\rtf1\\ansi\\deff0{\\fonttbl{\\f0 Helvetica;}}\\f0\\fs20\n" + body + "}").encode("ascii")
+
+
+def make_resume_rtf(jobs: int = 5, bullets_per_job: int = 4, seed: int = 0, sections: int = 7) -> bytes:
+    """Build an RTF resume."""
+    return make_rtf(make_resume_lines(jobs, bullets_per_job, seed, sections))
+
+
+def make_docx(lines: Sequence[str], layout: bool = True) -> bytes:
+    """
+    Write ``lines`` to a DOCX document with python-docx.
+    
+    With ``layout`` the second line (contact details) goes in the page header
+    and a skills table is appended, as many CV templates do.
+    """
+    import docx
+
+    document = docx.Document()
+    body = list(lines)
+    if layout and len(body) > 1:
+        document.sections[0].header.paragraphs[0].text = body[1]
+        body = body[:1] + body[2:]
+    for line in body:
+        document.add_paragraph(line)
+    if layout:
+        table = document.add_table(rows=1, cols=3)
+        for cell, skill in zip(table.rows[0].cells, SKILLS):
+            cell.text = skill
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+def make_resume_docx(
+    jobs: int = 5, bullets_per_job: int = 4, seed: int = 0, layout: bool = True, sections: int = 7
+) -> bytes:
+    """
+    Build a DOCX resume with python-docx.
+    
+    With ``layout`` the contact line goes in the page header and the skills
+    in a table, as many CV templates do.
+    """
+    return make_docx(make_resume_lines(jobs, bullets_per_job, seed, sections), layout)
+
+
+class CorpusDocument(NamedTuple):
+    filename: str
+    content: bytes
+    file_format: str
+    pages: int
+    jobs: int
+    sections: int
+
+
+FORMATS = ["docx", "pdf", "rtf", "doc"]
+
+
+def make_document(file_format: str, pages: int = 1, jobs: int = 5, sections: int = 7, seed: int = 0) -> bytes:
+    """
+    Build one synthetic resume of roughly ``pages`` pages.
+    
+    Content beyond what ``jobs`` and ``sections`` produce is repeated to reach
+    the page count; PDFs have exactly that many pages, the flowing formats
+    the same number of lines.
+    
+    DOC files are OOXML packages with a .doc name: legacy binary Word files
+    cannot be produced without Word, and the parser reads .doc uploads as
+    OOXML anyway.
+    """
+    lines = make_resume_lines(jobs=jobs, bullets_per_job=5, seed=seed, sections=sections)
+    if file_format == "pdf":
+        return make_pdf(paginate(lines, pages))
+    flat = [line for page in paginate(lines, pages) for line in page]
+    if file_format == "rtf":
+        return make_rtf(flat)
+    if file_format in ("docx", "doc"):
+        return make_docx(flat)
+    raise ValueError(f"Unsupported format: {file_format}")
+
+
+def generate_corpus(
+    formats: Sequence[str] = FORMATS,
+    pages: Sequence[int] = (1, 2, 5, 10, 25, 50),
+    jobs: Sequence[int] = (0, 1, 5, 10, 30),
+    sections: Sequence[int] = (0, 3, 7),
+    seed: int = 0,
+) -> Iterator[CorpusDocument]:
+    """
+    Yield one document per combination of format, page count, job count and
+    section count.
+    """
+    for file_format, page_count, job_count, section_count in itertools.product(formats, pages, jobs, sections):
+        filename = f"resume-p{page_count:02d}-j{job_count:02d}-s{section_count}.{file_format}"
+        content = make_document(file_format, page_count, job_count, section_count, seed)
+        yield CorpusDocument(filename, content, file_format, page_count, job_count, section_count)
+
+
+def _int_list(value: str) -> List[int]:
+    return [int(item) for item in value.split(",") if item]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="Write a synthetic resume corpus to a directory")
+    parser.add_argument("--out", required=True, help="Output directory")
+    parser.add_argument("--formats", default=",".join(FORMATS), help="Comma-separated formats")
+    parser.add_argument("--pages", type=_int_list, default=[1, 2, 5, 10, 25, 50])
+    parser.add_argument("--jobs", type=_int_list, default=[0, 1, 5, 10, 30])
+    parser.add_argument("--sections", type=_int_list, default=[0, 3, 7])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.out, exist_ok=True)
+    count = total = 0
+    for document in generate_corpus(args.formats.split(","), args.pages, args.jobs, args.sections, args.seed):
+        with open(os.path.join(args.out, document.filename), "wb") as f:
+            f.write(document.content)
+        count += 1
+        total += len(document.content)
+    print(f"Wrote {count} documents ({total / 2**20:.1f} MiB) to {args.out}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
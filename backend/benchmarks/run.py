@@ -0,0 +1,246 @@
+"""
+Benchmark: resume parser throughput, latency percentiles and peak RSS.
+
+Synthetic resumes from benchmarks.corpus are parsed by every public entry
+point of app.services.resume_parser:
+
+- ``parse_resume_file`` (end to end through the parse executor)
+- ``parse_docx`` / ``parse_pdf`` / ``parse_rtf`` / ``parse_doc``
+- the text extractors ``extract_docx_text`` / ``extract_pdf_text``
+- ``extract_sections``, ``extract_contact_info``, ``parse_experience`` and
+  ``parse_education`` on the extracted text
+
+Each (target, document) case runs in a fresh interpreter so its peak RSS is
+not inflated by earlier cases; the parse cache is disabled. Results are
+written as JSON for benchmarks.compare.
+
+Usage:
+    python -m benchmarks.run [--pages 1,5,20,50] [--jobs 5] [--sections 7]
+                             [--formats docx,pdf,rtf,doc] [--targets ...]
+                             [--iterations 20] [--output results.json]
+"""
+import argparse
+import asyncio
+import json
+import math
+import os
+import platform
+import resource
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from multiprocessing import get_context
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from benchmarks.corpus import FORMATS, make_document
+
+# Targets fed with the file content, run once per format
+FILE_TARGETS = ["parse_resume_file", "parse_format", "extract_text"]
+# Targets fed with extracted text, run once per document size
+TEXT_TARGETS = ["extract_sections", "extract_contact_info", "parse_experience", "parse_education"]
+TARGETS = FILE_TARGETS + TEXT_TARGETS
+
+# Format whose extracted text feeds the text targets
+TEXT_SOURCE_FORMAT = "docx"
+
+
+def percentile(samples: Sequence[float], pct: float) -> float:
+    """Nearest-rank percentile of ``samples``."""
+    ordered = sorted(samples)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+def peak_rss_bytes() -> int:
+    """Peak resident set size of this process and its reaped children."""
+    peak = max(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss,
+    )
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    return peak if sys.platform == "darwin" else peak * 1024
+
+
+def _build_call(target: str, file_format: str, content: bytes) -> Callable[[], Any]:
+    """Import the parser and return a zero-argument callable for one case."""
+    from app.core.config import settings
+
+    # Every iteration must parse, not hit the cache
+    settings.PARSE_CACHE_ENABLED = False
+
+    from app.services import resume_parser
+    from cvparser.ooxml import extract_docx_text
+    from cvparser.pdf import extract_pdf_text
+
+    filename = f"resume.{file_format}"
+    if target == "parse_resume_file":
+        loop = asyncio.new_event_loop()
+        return lambda: loop.run_until_complete(resume_parser.parse_resume_file(content, filename))
+    if target == "parse_format":
+        loop = asyncio.new_event_loop()
+        adapter = getattr(resume_parser, f"parse_{file_format}")
+        return lambda: loop.run_until_complete(adapter(content))
+    if target == "extract_text":
+        if file_format == "pdf":
+            return lambda: extract_pdf_text(
+                content,
+                shard_threshold=settings.PDF_SHARD_PAGE_THRESHOLD,
+                max_workers=min(settings.PDF_SHARD_WORKERS, os.cpu_count() or 1),
+            )
+        if file_format in ("docx", "doc"):
+            return lambda: extract_docx_text(content)
+        from striprtf.striprtf import rtf_to_text
+        return lambda: rtf_to_text(content.decode("utf-8", errors="ignore"))
+
+    text = resume_parser.parse_resume_content(content, filename)["raw_text"]
+    if target == "extract_sections":
+        return lambda: resume_parser.extract_sections(text)
+    if target == "extract_contact_info":
+        return lambda: resume_parser.extract_contact_info(text)
+    sections = resume_parser.extract_sections(text)
+    if target == "parse_experience":
+        return lambda: resume_parser.parse_experience(sections["experience"])
+    if target == "parse_education":
+        return lambda: resume_parser.parse_education(sections["education"])
+    raise ValueError(f"Unknown target: {target}")
+
+
+def run_case(
+    target: str, file_format: str, content: bytes, iterations: int, warmup: int, max_seconds: float
+) -> Dict[str, Any]:
+    """
+    Time one target on one document. Runs in a fresh worker process.
+
+    Iterations stop early once ``max_seconds`` have been spent, but at least
+    three samples are always taken.
+    """
+    call = _build_call(target, file_format, content)
+    baseline_rss = peak_rss_bytes()
+    for _ in range(warmup):
+        call()
+
+    samples: List[float] = []
+    budget_started = time.perf_counter()
+    while len(samples) < iterations:
+        started = time.perf_counter()
+        call()
+        samples.append(time.perf_counter() - started)
+        if len(samples) >= 3 and time.perf_counter() - budget_started > max_seconds:
+            break
+
+    # Reap parse workers so their peak RSS is included
+    from app.services.resume_parser import shutdown_parse_executor
+    shutdown_parse_executor()
+
+    total = sum(samples)
+    return {
+        "samples": len(samples),
+        "throughput_per_s": len(samples) / total if total else 0.0,
+        "mb_per_s": len(content) * len(samples) / total / 2**20 if total else 0.0,
+        "latency_ms": {
+            "mean": total / len(samples) * 1000,
+            "min": min(samples) * 1000,
+            "p50": percentile(samples, 50) * 1000,
+            "p95": percentile(samples, 95) * 1000,
+            "p99": percentile(samples, 99) * 1000,
+            "max": max(samples) * 1000,
+        },
+        "baseline_rss_mb": baseline_rss / 2**20,
+        "peak_rss_mb": peak_rss_bytes() / 2**20,
+    }
+
+
+def _git_revision() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _list(value: str) -> List[str]:
+    return [item for item in value.split(",") if item]
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--formats", type=_list, default=FORMATS, help="Comma-separated formats")
+    parser.add_argument("--pages", type=_list, default=["1", "5", "20", "50"], help="Comma-separated page counts")
+    parser.add_argument("--jobs", type=_list, default=["5"], help="Comma-separated experience entry counts")
+    parser.add_argument("--sections", type=_list, default=["7"], help="Comma-separated section counts")
+    parser.add_argument("--targets", type=_list, default=TARGETS, help="Comma-separated targets")
+    parser.add_argument("--iterations", type=int, default=20, help="Timed iterations per case")
+    parser.add_argument("--warmup", type=int, default=2, help="Untimed iterations per case")
+    parser.add_argument("--max-seconds", type=float, default=10.0, help="Time budget per case")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--output", "-o", help="Write JSON results to this file (default: stdout)")
+    args = parser.parse_args(argv)
+
+    unknown = set(args.targets) - set(TARGETS)
+    if unknown:
+        parser.error(f"Unknown targets: {', '.join(sorted(unknown))}")
+
+    cases = []
+    for pages in map(int, args.pages):
+        for jobs in map(int, args.jobs):
+            for sections in map(int, args.sections):
+                for target in args.targets:
+                    formats = args.formats if target in FILE_TARGETS else [TEXT_SOURCE_FORMAT]
+                    for file_format in formats:
+                        cases.append((target, file_format, pages, jobs, sections))
+
+    results = []
+    documents: Dict[tuple, bytes] = {}
+    context = get_context("spawn")
+    for number, (target, file_format, pages, jobs, sections) in enumerate(cases, 1):
+        key = (file_format, pages, jobs, sections)
+        if key not in documents:
+            documents[key] = make_document(file_format, pages, jobs, sections, args.seed)
+        content = documents[key]
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            measured = pool.submit(
+                run_case, target, file_format, content, args.iterations, args.warmup, args.max_seconds
+            ).result()
+        result = {
+            "target": target,
+            "format": "text" if target in TEXT_TARGETS else file_format,
+            "pages": pages,
+            "jobs": jobs,
+            "sections": sections,
+            "bytes": len(content),
+            **measured,
+        }
+        results.append(result)
+        print(
+            f"[{number}/{len(cases)}] {target:<21} {result['format']:<5} p{pages:<3} j{jobs:<3} s{sections:<2} "
+            f"p50 {result['latency_ms']['p50']:9.2f} ms  p95 {result['latency_ms']['p95']:9.2f} ms  "
+            f"{result['throughput_per_s']:8.1f}/s  rss {result['peak_rss_mb']:7.1f} MiB",
+            file=sys.stderr,
+        )
+
+    report = {
+        "meta": {
+            "git_revision": _git_revision(),
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "iterations": args.iterations,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
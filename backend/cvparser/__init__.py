@@ -0,0 +1,51 @@
+"""
+Resume parsing library: format detection, text extraction, field parsing
+and supervised execution.
+
+The core has no dependencies. Formats that need a third-party library are
+optional extras (``pip install 'cvparser[pdf,rtf]'``); without one, files of
+that format are rejected with UnsupportedFormatError. Names below are
+imported on first access, so ``import cvparser`` loads nothing else.
+"""
+import importlib
+from typing import Any
+
+_EXPORTS = {
+    'ResumeParseError': 'cvparser.errors',
+    'ParseQueueFullError': 'cvparser.errors',
+    'ParseTimeoutError': 'cvparser.errors',
+    'ParseLimitError': 'cvparser.errors',
+    'ParseMemoryError': 'cvparser.errors',
+    'ParseServiceUnavailableError': 'cvparser.errors',
+    'UnsupportedFormatError': 'cvparser.errors',
+    'ParseExecutor': 'cvparser.executor',
+    'SupervisedExecutor': 'cvparser.supervisor',
+    'ParseLimits': 'cvparser.formats',
+    'detect_format': 'cvparser.formats',
+    'ContactInfo': 'cvparser.model',
+    'EducationEntry': 'cvparser.model',
+    'ExperienceEntry': 'cvparser.model',
+    'ParsedResume': 'cvparser.model',
+    'Extractor': 'cvparser.pipeline',
+    'ParsePipeline': 'cvparser.pipeline',
+    'PipelineResult': 'cvparser.pipeline',
+    'default_extractors': 'cvparser.pipeline',
+    'apply_derived': 'cvparser.derived',
+    'derive_sections': 'cvparser.derived',
+    'match_keywords': 'cvparser.derived',
+    'refresh_timeline': 'cvparser.timeline',
+    'build_pipeline': 'cvparser.api',
+    'parse_bytes': 'cvparser.api',
+    'parse_file': 'cvparser.api',
+    'supported_formats': 'cvparser.api',
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    if name not in _EXPORTS:
+        raise AttributeError(f"module 'cvparser' has no attribute {name!r}")
+    value = getattr(importlib.import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
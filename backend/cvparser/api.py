@@ -0,0 +1,146 @@
+"""
+Parse resumes in the calling process with the default pipeline.
+
+This is the entry point for tools that use the library on its own, such as
+the standalone CLI; the backend builds its own pipeline from its settings
+and runs it in the parse executor.
+"""
+import os
+from typing import Any, Dict, Optional
+
+from cvparser.buffers import Buffer, map_file
+from cvparser.errors import ParseLimitError, UnsupportedFormatError
+from cvparser.formats import ParseLimits, detect_format
+from cvparser.pipeline import ParsePipeline, PipelineResult, default_extractors
+
+# Formats detect_format knows; any other format comes from a plugin
+BUILTIN_FORMATS = ('pdf', 'docx', 'rtf')
+
+_pipeline: Optional[ParsePipeline] = None
+
+
+def build_pipeline(limits: ParseLimits = ParseLimits(), pdf_workers: Optional[int] = None) -> ParsePipeline:
+    """
+    Create a pipeline with the built-in and plugin extractors.
+
+    Args:
+        limits: Page and text ceilings for the extractors and the pipeline
+        pdf_workers: Processes used to extract a PDF of 16 pages or more in
+            parallel page ranges; defaults to up to four, and callers that
+            already parse several files at once should pass 1
+    """
+    if pdf_workers is None:
+        pdf_workers = min(4, os.cpu_count() or 1)
+    return ParsePipeline(
+        default_extractors(
+            pdf_shard_threshold=16 if pdf_workers > 1 else 0,
+            pdf_workers=pdf_workers,
+            pdf_max_pages=limits.max_pages,
+        ),
+        max_text_chars=limits.max_text_chars,
+    )
+
+
+def get_pipeline(limits: ParseLimits = ParseLimits()) -> ParsePipeline:
+    """
+    Get this process's default pipeline, creating it with build_pipeline
+    on first use; ``limits`` of the first call apply.
+    """
+    global _pipeline
+    if _pipeline is None:
+        _pipeline = build_pipeline(limits)
+    return _pipeline
+
+
+def supported_formats(pipeline: Optional[ParsePipeline] = None) -> Dict[str, bool]:
+    """Registered formats and whether their dependencies are installed."""
+    return {name: not missing for name, missing in (pipeline or get_pipeline()).formats().items()}
+
+
+def run_bytes(
+    content: Buffer,
+    filename: Optional[str] = None,
+    limits: ParseLimits = ParseLimits(),
+    pipeline: Optional[ParsePipeline] = None,
+) -> PipelineResult:
+    """
+    Parse resume file content and return the full pipeline result, with
+    the format the file was parsed as and the time spent in each stage.
+
+    The format is detected from the content; the file extension is only
+    used for formats added by plugins that have no signature.
+
+    Args:
+        content: The file content
+        filename: The name of the file
+        limits: Size, page and text ceilings to enforce
+        pipeline: Pipeline to run; defaults to get_pipeline()
+
+    Raises:
+        ParseLimitError: If the file exceeds a size, page or text ceiling
+        UnsupportedFormatError: If the content is not a supported document,
+            or its format needs an extra that is not installed
+        ResumeParseError: If parsing fails
+    """
+    pipeline = pipeline or get_pipeline(limits)
+    try:
+        file_format = detect_format(content, filename, limits)
+    except UnsupportedFormatError:
+        if not len(content):
+            raise
+        file_format = pipeline.resolve(content, filename).name
+        if file_format in BUILTIN_FORMATS:
+            raise
+    return pipeline.run(content, filename, file_format)
+
+
+def parse_bytes(
+    content: Buffer,
+    filename: Optional[str] = None,
+    limits: ParseLimits = ParseLimits(),
+    pipeline: Optional[ParsePipeline] = None,
+) -> Dict[str, Any]:
+    """
+    Parse resume file content.
+
+    Args:
+        content: The file content
+        filename: The name of the file
+        limits: Size, page and text ceilings to enforce
+        pipeline: Pipeline to run; defaults to get_pipeline()
+
+    Returns:
+        Dict containing parsed resume data
+
+    Raises:
+        See run_bytes
+    """
+    return run_bytes(content, filename, limits, pipeline).data
+
+
+def parse_file(path: str, limits: ParseLimits = ParseLimits(), pipeline: Optional[ParsePipeline] = None) -> Dict[str, Any]:
+    """
+    Parse a resume file from disk.
+
+    The size ceiling is checked before the file is opened, and the file is
+    memory-mapped rather than read into memory.
+
+    Args:
+        path: Path to the resume file
+        limits: Size, page and text ceilings to enforce
+        pipeline: Pipeline to run; defaults to get_pipeline()
+
+    Returns:
+        Dict containing parsed resume data
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        See run_bytes for the parse errors
+    """
+    size = os.path.getsize(path)
+    if size > limits.max_bytes:
+        raise ParseLimitError(f"File is larger than the {limits.max_bytes} byte limit")
+    if not size:
+        raise UnsupportedFormatError("File is empty")
+    with map_file(path) as view:
+        return parse_bytes(view, os.path.basename(path), limits, pipeline)
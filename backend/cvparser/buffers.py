@@ -0,0 +1,104 @@
+"""
+File-like access to in-memory buffers without copying them.
+"""
+import io
+import mmap
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, NamedTuple, Union
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class BufferReader(io.RawIOBase):
+    """
+    Read-only, seekable file object over any buffer-protocol object.
+
+    ``io.BytesIO`` copies anything that is not ``bytes``; this reader slices a
+    memoryview instead, so zip and PDF readers can work directly on an upload
+    buffer or memory-mapped file.
+    """
+
+    def __init__(self, buffer: Buffer):
+        self._view = memoryview(buffer).cast("B")
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._pos + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise ValueError(f"Invalid whence: {whence}")
+        if position < 0:
+            raise ValueError("Negative seek position")
+        self._pos = position
+        return position
+
+    def readinto(self, target) -> int:
+        chunk = self._view[self._pos:self._pos + len(target)]
+        size = len(chunk)
+        target[:size] = chunk
+        self._pos += size
+        return size
+
+
+def open_buffer(content: Buffer) -> BinaryIO:
+    """
+    Wrap ``content`` in a binary file object without copying it.
+    
+    Args:
+        content: bytes, bytearray, memoryview or any other buffer
+        
+    Returns:
+        Seekable, readable binary file object
+    """
+    if isinstance(content, bytes):
+        # BytesIO shares an immutable bytes object until it is written to
+        return io.BytesIO(content)
+    return io.BufferedReader(BufferReader(content))
+
+
+class FileSource(NamedTuple):
+    """
+    Content that lives in a file rather than in memory.
+
+    Passed to worker processes instead of the bytes themselves, so a large
+    upload spooled to disk is never pickled; the worker maps the file.
+    """
+    path: str
+
+
+@contextmanager
+def map_file(path: str) -> Iterator[memoryview]:
+    """
+    Map a file read-only and yield a memoryview over it.
+    
+    Args:
+        path: Path of a non-empty file
+        
+    Yields:
+        memoryview of the whole file
+    """
+    with open(path, 'rb') as f:
+        mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    view = memoryview(mapped)
+    try:
+        yield view
+    finally:
+        view.release()
+        try:
+            mapped.close()
+        except BufferError:
+            # A reader still holds a slice; the map is freed with it
+            pass
@@ -0,0 +1,289 @@
+"""
+Content-addressed cache for parsed resumes.
+
+Entries are keyed by the SHA-256 of the uploaded bytes together with the
+parser version, so re-uploading the same file skips parsing entirely while a
+parser change invalidates every stale entry. Values are stored in a compact
+binary form, so each hit hands back a fresh dict that callers may mutate
+freely: a ParsedResume in its serialized form, a dict marshalled as is.
+
+Entries are loaded as they are, so the disk tier only uses a directory
+private to this user; the async methods of ParseCache do its file I/O in a
+thread, keeping it off the event loop.
+"""
+import asyncio
+import hashlib
+import logging
+import marshal
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Union
+
+from cvparser.model import ParsedResume, is_serialized_resume
+
+logger = logging.getLogger(__name__)
+
+# Prefix of values stored as a marshalled dict
+_DICT_MAGIC = b'PCVD'
+
+
+def _encode(value: Union[ParsedResume, Dict[str, Any]]) -> bytes:
+    if isinstance(value, ParsedResume):
+        return value.to_bytes()
+    return _DICT_MAGIC + marshal.dumps(value, 4)
+
+
+def _decode(data: bytes) -> Dict[str, Any]:
+    if is_serialized_resume(data):
+        return ParsedResume.from_bytes(data).to_dict()
+    if data.startswith(_DICT_MAGIC):
+        try:
+            return marshal.loads(data[len(_DICT_MAGIC):])
+        except (EOFError, TypeError) as e:
+            raise ValueError(str(e))
+    raise ValueError("Unknown parse cache entry format")
+
+
+class MemoryTier:
+    """
+    In-process LRU tier bounded by entry count and total stored bytes.
+    """
+
+    def __init__(self, max_items: int, max_bytes: int):
+        self.max_items = max_items
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> Optional[bytes]:
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def put(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[key] = data
+            self._size += len(data)
+            while len(self._entries) > self.max_items or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "items": len(self._entries),
+                "bytes": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+def _check_private(directory: str) -> None:
+    if not hasattr(os, "getuid"):
+        return
+    info = os.stat(directory)
+    if info.st_uid != os.getuid() or info.st_mode & 0o022:
+        raise OSError(f"{directory} is not private to this user")
+
+
+class DiskTier:
+    """
+    Persistent tier storing one file per entry in a local directory.
+
+    The directory is bounded by total size; when a write pushes it over the
+    limit the least recently used files (by modification time, which is
+    refreshed on every hit) are removed until it is back under
+    LOW_WATER_MARK of the limit, so that the next writes do not have to
+    scan the directory again.
+
+    The directory is created with mode 0700, and one that other users own or
+    may write to is refused with an OSError, as they could plant entries.
+    """
+
+    SUFFIX = ".bin"
+    LOW_WATER_MARK = 0.9
+
+    def __init__(self, directory: str, max_bytes: int):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._lock = threading.Lock()
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        _check_private(directory)
+        self._size = sum(size for _, size, _ in self._scan())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key + self.SUFFIX)
+
+    def _scan(self):
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if entry.name.endswith(self.SUFFIX) and entry.is_file():
+                    stat = entry.stat()
+                    yield entry.path, stat.st_size, stat.st_mtime
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                data = f.read()
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        except OSError as e:
+            logger.warning(f"Parse cache read failed for {key}: {str(e)}")
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self.hits += 1
+        return data
+
+    def put(self, key: str, data: bytes) -> None:
+        if len(data) > self.max_bytes:
+            return
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        try:
+            try:
+                previous = os.path.getsize(path)
+            except OSError:
+                previous = 0
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning(f"Parse cache write failed for {key}: {str(e)}")
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            return
+        with self._lock:
+            self._size += len(data) - previous
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _evict(self) -> None:
+        files = sorted(self._scan(), key=lambda entry: entry[2])
+        self._size = sum(size for _, size, _ in files)
+        target = self.max_bytes * self.LOW_WATER_MARK
+        for path, size, _ in files:
+            if self._size <= target:
+                break
+            try:
+                os.unlink(path)
+            except OSError:
+                continue
+            self._size -= size
+            self.evictions += 1
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "bytes": self._size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class ParseCache:
+    """
+    Two-tier parse result cache: memory first, then disk.
+
+    Disk hits are promoted into the memory tier. The disk tier is optional;
+    pass ``directory=None`` to keep the cache purely in memory.
+    """
+
+    def __init__(
+        self,
+        version: str,
+        max_items: int,
+        max_memory_bytes: int,
+        directory: Optional[str] = None,
+        max_disk_bytes: int = 0,
+    ):
+        self.version = version
+        self.memory = MemoryTier(max_items, max_memory_bytes)
+        self.disk: Optional[DiskTier] = None
+        if directory:
+            try:
+                self.disk = DiskTier(directory, max_disk_bytes)
+            except OSError as e:
+                logger.warning(f"Parse cache directory {directory} unavailable, using memory only: {str(e)}")
+
+    def key_for(self, content: bytes, file_format: str) -> str:
+        """Build the cache key for a file's content and detected format."""
+        return self.key_for_digest(hashlib.sha256(content).hexdigest(), file_format)
+
+    def key_for_digest(self, digest: str, file_format: str) -> str:
+        """Build the cache key from an already computed SHA-256 hex digest."""
+        return f"v{self.version}-{file_format}-{digest}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        data = self.memory.get(key)
+        if data is None and self.disk is not None:
+            data = self.disk.get(key)
+            if data is not None:
+                self.memory.put(key, data)
+        return self._load(key, data)
+
+    async def aget(self, key: str) -> Optional[Dict[str, Any]]:
+        """get() for async callers, reading the disk tier in a thread."""
+        data = self.memory.get(key)
+        if data is None and self.disk is not None:
+            data = await asyncio.to_thread(self.disk.get, key)
+            if data is not None:
+                self.memory.put(key, data)
+        return self._load(key, data)
+
+    def _load(self, key: str, data: Optional[bytes]) -> Optional[Dict[str, Any]]:
+        if data is None:
+            return None
+        try:
+            return _decode(data)
+        except ValueError:
+            logger.warning(f"Discarding corrupt parse cache entry {key}")
+            return None
+
+    def put(self, key: str, value: Union[ParsedResume, Dict[str, Any]]) -> None:
+        data = _encode(value)
+        self.memory.put(key, data)
+        if self.disk is not None:
+            self.disk.put(key, data)
+
+    async def aput(self, key: str, value: Union[ParsedResume, Dict[str, Any]]) -> None:
+        """put() for async callers, writing the disk tier in a thread."""
+        data = _encode(value)
+        self.memory.put(key, data)
+        if self.disk is not None:
+            await asyncio.to_thread(self.disk.put, key, data)
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "memory": self.memory.stats(),
+            "disk": self.disk.stats() if self.disk is not None else None,
+        }
@@ -0,0 +1,173 @@
+"""
+Client for the HTTP parse service in cvparser.server.
+
+Keeps a pool of persistent connections, so a busy caller does not pay for a
+TCP handshake per file, and turns error responses back into the exceptions
+the in-process parser raises.
+"""
+import asyncio
+import http.client
+import json
+import os
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Optional, Union
+from urllib.parse import quote, urlsplit
+
+from cvparser.buffers import Buffer, FileSource
+from cvparser.errors import (
+    ParseLimitError,
+    ParseQueueFullError,
+    ParseServiceUnavailableError,
+    ParseTimeoutError,
+    ResumeParseError,
+    UnsupportedFormatError,
+)
+
+# Errors from a kept-alive connection the server has since closed
+_STALE_CONNECTION = (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError)
+
+
+def raise_for_response(status: int, body: Dict[str, Any]) -> None:
+    """Raise the parse error matching an error response of the service."""
+    message = body.get("message") or f"Parse service returned HTTP {status}"
+    if status == 504:
+        raise ParseTimeoutError(
+            message,
+            timeout=body.get("timeout"),
+            elapsed=body.get("elapsed"),
+            job={key: body.get(key) for key in ("filename", "format", "sha256") if key in body},
+        )
+    if status == 429:
+        raise ParseQueueFullError(message)
+    if status == 413:
+        raise ParseLimitError(message)
+    if status == 415:
+        raise UnsupportedFormatError(message)
+    if status in (502, 503):
+        raise ParseServiceUnavailableError(message)
+    raise ResumeParseError(message)
+
+
+class ParserClient:
+    """
+    Pooled HTTP client for a parse service.
+
+    At most ``pool_size`` requests are in flight at once; further calls wait
+    for a connection. ``timeout`` should be longer than the service's own
+    parse timeout, so that the service reports timeouts itself.
+    """
+
+    def __init__(self, base_url: str, pool_size: int = 8, timeout: float = 60):
+        url = urlsplit(base_url)
+        if url.scheme not in ("http", "https"):
+            raise ValueError(f"Unsupported parse service URL: {base_url}")
+        self.base_url = base_url
+        self.pool_size = pool_size
+        self.timeout = timeout
+        self._connection_class = http.client.HTTPSConnection if url.scheme == "https" else http.client.HTTPConnection
+        self._host = url.hostname
+        self._port = url.port
+        self._prefix = url.path.rstrip("/")
+        self._pool: "queue.LifoQueue[Optional[http.client.HTTPConnection]]" = queue.LifoQueue()
+        for _ in range(pool_size):
+            # Connections are opened when first used
+            self._pool.put(None)
+        self._threads: Optional[ThreadPoolExecutor] = None
+
+    def _request(self, method: str, path: str, body: Any = None, headers: Optional[Dict[str, str]] = None):
+        connection = self._pool.get()
+        try:
+            for attempt in range(2):
+                fresh = connection is None
+                if fresh:
+                    connection = self._connection_class(self._host, self._port, timeout=self.timeout)
+                try:
+                    if body is not None and hasattr(body, "seek"):
+                        body.seek(0)
+                    connection.request(method, self._prefix + path, body=body, headers=headers or {})
+                    response = connection.getresponse()
+                    data = response.read()
+                except _STALE_CONNECTION:
+                    connection.close()
+                    connection = None
+                    if fresh or attempt:
+                        raise
+                    continue
+                except Exception:
+                    connection.close()
+                    connection = None
+                    raise
+                if response.will_close:
+                    connection.close()
+                    connection = None
+                return response.status, response.headers, data
+        finally:
+            self._pool.put(connection)
+
+    def parse(self, content: Union[Buffer, FileSource], filename: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Parse a file with the service.
+
+        Args:
+            content: The file content, or a FileSource whose file is
+                streamed to the service
+            filename: The name of the file
+
+        Returns:
+            Dict containing parsed resume data
+
+        Raises:
+            ParseLimitError, UnsupportedFormatError, ParseQueueFullError,
+            ParseTimeoutError, ResumeParseError: As the in-process parser
+            ParseServiceUnavailableError: If the service cannot be reached,
+                or fails with a gateway error
+        """
+        path = "/parse" + (f"?filename={quote(filename)}" if filename else "")
+        headers = {"Content-Type": "application/octet-stream"}
+        try:
+            if isinstance(content, FileSource):
+                headers["Content-Length"] = str(os.path.getsize(content.path))
+                with open(content.path, "rb") as body:
+                    status, _, data = self._request("POST", path, body, headers)
+            else:
+                headers["Content-Length"] = str(len(content))
+                status, _, data = self._request("POST", path, bytes(content), headers)
+        except (OSError, http.client.HTTPException) as e:
+            raise ParseServiceUnavailableError(f"Parse service at {self.base_url} is unavailable: {str(e)}")
+        try:
+            body = json.loads(data) if data else {}
+        except ValueError:
+            body = {}
+        if status != 200:
+            raise_for_response(status, body)
+        return body
+
+    async def parse_async(self, content: Union[Buffer, FileSource], filename: Optional[str] = None) -> Dict[str, Any]:
+        """parse() for async callers; the request runs on one of ``pool_size`` threads."""
+        if self._threads is None:
+            self._threads = ThreadPoolExecutor(max_workers=self.pool_size, thread_name_prefix="parse-client")
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._threads, self.parse, content, filename)
+
+    def metrics(self) -> Dict[str, Any]:
+        """The service's /metrics snapshot."""
+        status, _, data = self._request("GET", "/metrics")
+        if status != 200:
+            raise ResumeParseError(f"Parse service returned HTTP {status}")
+        return json.loads(data)
+
+    def close(self) -> None:
+        """Close the pooled connections."""
+        while True:
+            try:
+                connection = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            if connection is not None:
+                connection.close()
+        for _ in range(self.pool_size):
+            self._pool.put(None)
+        if self._threads is not None:
+            self._threads.shutdown(wait=False)
+            self._threads = None
@@ -0,0 +1,204 @@
+"""
+Contact details extraction for resume text.
+
+All contact fields are recognised by one precompiled pattern with a named
+group per field, so the text is scanned once instead of once per field.
+Contact details almost always sit at the top of a resume, so only the first
+``header_lines`` lines are scanned at first; the rest of the document is
+scanned only when one of FALLBACK_FIELDS is still missing.
+
+Compared with the original per-field searches:
+
+- email domains are consumed by the email match and are never reported as
+  the website;
+- a website needs a scheme, ``www.`` or a common top-level domain, so
+  ``Node.js`` or ``e.g.`` are not websites;
+- phone numbers must have 10-15 digits (8-15 with a leading ``+``), which
+  rules out year ranges such as ``2019 - 2021``, and stay on one line;
+- a location is only reported when it is labelled (``Location: Leeds``) or
+  is its own segment of a contact line (``Leeds, UK | jane@example.com``).
+"""
+import re
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+CONTACT_FIELDS = ('email', 'phone', 'location', 'linkedin', 'website')
+
+# Missing any of these after the header scan triggers a scan of the rest
+FALLBACK_FIELDS = ('email', 'phone', 'linkedin')
+
+# Lines considered the header region of a resume
+HEADER_LINES = 12
+
+_TLDS = (
+    'com|org|net|io|dev|me|co|ai|app|info|tech|site|page|xyz|blog|'
+    'uk|us|ca|de|fr|eu|nl|au|nz|ie|in|za|ng|es|it|se|ch'
+)
+
+# Matches may only start at a token boundary; trying every alternative at
+# every position inside words is what makes an alternation like this slow.
+CONTACT_PATTERN = re.compile(
+    r'(?<![\w.+-])(?:'
+    r'(?P<email>[\w.+-]+@[\w-]+(?:\.[\w-]+)*\.[A-Za-z]{2,})'
+    r'|(?i:(?:https?://)?(?:[a-z]{2,3}\.)?)(?P<linkedin>(?i:linkedin\.com/in/'
+    r'|linkedin:\s*(?:(?:https?://)?(?:www\.)?linkedin\.com/in/)?)[\w-]+)'
+    r'|(?P<website>'
+    r'(?i:https?://|www\.)[^\s,;|<>()"\']*[^\s,;|<>()"\'.]'
+    rf'|(?<!@)(?:[A-Za-z0-9-]+\.)+(?i:{_TLDS})\b(?:/[^\s,;|<>()"\']*[^\s,;|<>()"\'.])?'
+    r')'
+    r'|(?i:location|address|based\s+in)\s*[:\-]\s*(?P<location>[^|•·\n]*[^|•·\s])'
+    r'|(?P<phone>\+?\(?\d[\d \t().-]{6,18}\d)(?!\w)'
+    r')'
+)
+
+# A "City, Region" segment of a contact line, e.g. "London, UK" or "Austin, TX"
+LOCATION_SEGMENT = re.compile(
+    r"[A-Z][A-Za-z.'-]+(?:[ -][A-Z][A-Za-z.'-]+){0,2},\s*[A-Z][A-Za-z]+(?:[ -][A-Z][A-Za-z]+){0,2}"
+)
+_SEGMENT_SEPARATOR = re.compile(r'\s*(?:[|•·\t]|\s{2,})\s*')
+
+
+class ContactCandidate(NamedTuple):
+    field: str
+    value: str
+    start: int
+    end: int
+
+
+class ContactScan(NamedTuple):
+    fields: Dict[str, Optional[str]]
+    candidates: List[ContactCandidate]
+    full_scan: bool
+
+
+def _valid_phone(value: str) -> bool:
+    digits = sum(ch.isdigit() for ch in value)
+    if value.startswith('+'):
+        return 8 <= digits <= 15
+    return 10 <= digits <= 15
+
+
+def _line_offset(text: str, lines: int) -> int:
+    """Offset just past the first ``lines`` lines of ``text``."""
+    offset = 0
+    for _ in range(lines):
+        offset = text.find('\n', offset)
+        if offset == -1:
+            return len(text)
+        offset += 1
+    return offset
+
+
+def _scan(text: str, start: int, end: int) -> List[ContactCandidate]:
+    candidates = []
+    for match in CONTACT_PATTERN.finditer(text, start, end):
+        field = match.lastgroup
+        value = match.group(field)
+        if field == 'phone' and not _valid_phone(value):
+            continue
+        if field == 'linkedin':
+            value = value.lower()
+            # "LinkedIn: linkedin.com/in/jane" is reported as the profile URL
+            url = value.find('linkedin.com/in/')
+            if url > 0:
+                value = value[url:]
+        candidates.append(ContactCandidate(field, value, match.start(field), match.end(field)))
+    return candidates
+
+
+def _location_segments(text: str, end: int, candidates: List[ContactCandidate]) -> List[ContactCandidate]:
+    """
+    Find unlabelled "City, Region" segments on header lines that also hold
+    another contact detail.
+    """
+    found = []
+    line_start = 0
+    while line_start < end:
+        line_end = text.find('\n', line_start, end)
+        if line_end == -1:
+            line_end = end
+        on_line = [c for c in candidates if line_start <= c.start < line_end]
+        if on_line and not any(c.field == 'location' for c in on_line):
+            position = line_start
+            for segment in _SEGMENT_SEPARATOR.split(text[line_start:line_end]):
+                position = text.find(segment, position, line_end) if segment else position
+                segment_end = position + len(segment)
+                if (
+                    segment
+                    and LOCATION_SEGMENT.fullmatch(segment)
+                    and not any(c.start < segment_end and position < c.end for c in on_line)
+                ):
+                    found.append(ContactCandidate('location', segment, position, segment_end))
+                position = segment_end
+        line_start = line_end + 1
+    return found
+
+
+class ContactExtractor:
+    """
+    Extract contact details with a header-first scan.
+    """
+
+    def __init__(self, header_lines: int = HEADER_LINES, fallback_fields: Tuple[str, ...] = FALLBACK_FIELDS):
+        self.header_lines = header_lines
+        self.fallback_fields = fallback_fields
+
+    def scan(self, text: str) -> ContactScan:
+        """
+        Find contact details, scanning the header region first.
+        
+        Args:
+            text: The raw text content of the resume
+            
+        Returns:
+            ContactScan with the first value found for each field, every
+            candidate seen in the scanned text and whether the rest of the
+            document had to be scanned
+        """
+        header_end = _line_offset(text, self.header_lines)
+        candidates = _scan(text, 0, header_end)
+        candidates += _location_segments(text, header_end, candidates)
+        candidates.sort(key=lambda candidate: candidate.start)
+        fields = self._first_values(candidates)
+
+        full_scan = header_end < len(text) and any(fields[field] is None for field in self.fallback_fields)
+        if full_scan:
+            rest = _scan(text, header_end, len(text))
+            candidates += rest
+            # Locations are only trusted in the header region
+            for field, value in self._first_values(rest).items():
+                if fields[field] is None and field != 'location':
+                    fields[field] = value
+        return ContactScan(fields, candidates, full_scan)
+
+    def candidates(self, text: str) -> List[ContactCandidate]:
+        """Every contact candidate in the whole of ``text``, in order."""
+        header_end = _line_offset(text, self.header_lines)
+        candidates = _scan(text, 0, len(text))
+        candidates += _location_segments(text, header_end, candidates)
+        candidates.sort(key=lambda candidate: candidate.start)
+        return candidates
+
+    def extract(self, text: str) -> Dict[str, Optional[str]]:
+        """Return the first value found for each contact field."""
+        return self.scan(text).fields
+
+    @staticmethod
+    def _first_values(candidates: List[ContactCandidate]) -> Dict[str, Optional[str]]:
+        fields: Dict[str, Optional[str]] = dict.fromkeys(CONTACT_FIELDS)
+        for candidate in candidates:
+            if fields[candidate.field] is None:
+                fields[candidate.field] = candidate.value
+        return fields
+
+
+default_extractor = ContactExtractor()
+
+
+def extract_contact(text: str) -> Dict[str, Optional[str]]:
+    """Extract contact details with the default extractor."""
+    return default_extractor.extract(text)
+
+
+def find_contact_candidates(text: str) -> List[ContactCandidate]:
+    """Every contact candidate in ``text`` with its position."""
+    return default_extractor.candidates(text)
@@ -0,0 +1,171 @@
+"""
+Date and date range recognition for resume lines.
+
+One precompiled pattern recognises every supported date format, with an
+optional second date or an open end ("Present") after a range separator:
+
+- month names, full or abbreviated: ``Mar 2019``, ``September, 2019``;
+- numeric months: ``03/2019``, ``3.2019`` and ISO ``2019-03``;
+- bare years: ``2019``;
+- open ends: ``Present``, ``Current``, ``Now``, ``To date``, ``Ongoing``;
+- separators: hyphens, en and em dashes, ``to``, ``until``, ``till``,
+  ``through``.
+
+Dates carry their precision, so ``2019`` is never mistaken for January 2019
+by code that compares or subtracts them.
+"""
+import re
+from typing import Any, Dict, Iterator, NamedTuple, Optional
+
+MONTHS = {
+    'jan': 1, 'feb': 2, 'mar': 3, 'apr': 4, 'may': 5, 'jun': 6,
+    'jul': 7, 'aug': 8, 'sep': 9, 'oct': 10, 'nov': 11, 'dec': 12,
+}
+
+_MONTH_NAME = (
+    r'(?:jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?'
+    r'|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?)'
+)
+_YEAR = r'(?:19|20)\d{2}'
+
+
+def _date(prefix: str) -> str:
+    return (
+        rf'(?:(?P<{prefix}_name>{_MONTH_NAME})\.?,?\s*(?P<{prefix}_name_year>{_YEAR})'
+        rf'|(?P<{prefix}_iso_year>{_YEAR})-(?P<{prefix}_iso_month>0[1-9]|1[0-2])(?![\d])'
+        rf'|(?P<{prefix}_month>0?[1-9]|1[0-2])\s*[/.]\s*(?P<{prefix}_month_year>{_YEAR})'
+        rf'|(?P<{prefix}_year>{_YEAR}))'
+    )
+
+
+DATE_PATTERN = re.compile(
+    rf'(?<![\w/.-]){_date("start")}'
+    r'(?:\s*(?:-|–|—|\bto\b|\buntil\b|\btill\b|\bthrough\b)\s*'
+    rf'(?:(?P<present>present|current(?:ly)?|now|today|to\s+date|ongoing)|{_date("end")}))?'
+    r'(?![\w/])',
+    re.IGNORECASE,
+)
+
+# Characters that may surround a date range at either end of a line
+_EDGE = ' \t()[]|,;:•·'
+
+
+class PartialDate(NamedTuple):
+    """A calendar month, or a whole year when ``month`` is None."""
+    year: int
+    month: Optional[int] = None
+
+    @property
+    def precision(self) -> str:
+        return 'year' if self.month is None else 'month'
+
+    def first_month(self) -> int:
+        """Months since year 0 of the first month this date covers."""
+        return self.year * 12 + (self.month or 1) - 1
+
+    def last_month(self) -> int:
+        """Months since year 0 of the last month this date covers."""
+        return self.year * 12 + (self.month or 12) - 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'year': self.year, 'month': self.month, 'precision': self.precision}
+
+    @classmethod
+    def from_dict(cls, value: Optional[Dict[str, Any]]) -> Optional['PartialDate']:
+        return cls(value['year'], value['month']) if value else None
+
+
+class DateMatch(NamedTuple):
+    """
+    A date or date range found in a line.
+    
+    ``end`` is None both for a single date and for an open range; ``current``
+    tells them apart.
+    """
+    start: PartialDate
+    end: Optional[PartialDate]
+    current: bool
+    text: str
+    anchored: bool
+
+    @property
+    def is_range(self) -> bool:
+        return self.current or self.end is not None
+
+    @property
+    def has_month(self) -> bool:
+        return self.start.month is not None or (self.end is not None and self.end.month is not None)
+
+
+def _partial(match: re.Match, prefix: str) -> Optional[PartialDate]:
+    name = match.group(f'{prefix}_name')
+    if name:
+        return PartialDate(int(match.group(f'{prefix}_name_year')), MONTHS[name[:3].lower()])
+    if match.group(f'{prefix}_iso_year'):
+        return PartialDate(int(match.group(f'{prefix}_iso_year')), int(match.group(f'{prefix}_iso_month')))
+    if match.group(f'{prefix}_month'):
+        return PartialDate(int(match.group(f'{prefix}_month_year')), int(match.group(f'{prefix}_month')))
+    if match.group(f'{prefix}_year'):
+        return PartialDate(int(match.group(f'{prefix}_year')))
+    return None
+
+
+def iter_dates(line: str) -> Iterator[DateMatch]:
+    """
+    Every date or date range in ``line``, in order.
+    
+    A match is ``anchored`` when only punctuation separates it from the
+    start or the end of the line, which is where role and study dates sit.
+    """
+    for match in DATE_PATTERN.finditer(line):
+        anchored = not line[:match.start()].strip(_EDGE) or not line[match.end():].strip(_EDGE)
+        yield DateMatch(
+            _partial(match, 'start'),
+            _partial(match, 'end'),
+            match.group('present') is not None,
+            match.group(),
+            anchored,
+        )
+
+
+def find_date_range(line: str) -> Optional[DateMatch]:
+    """
+    The first date range in ``line`` that marks a role or a course of
+    study: one with a month on either side, or one at an end of the line.
+    Year-only ranges inside a sentence ("grew sales 2019-2021") are skipped.
+    """
+    for date in iter_dates(line):
+        if date.is_range and (date.has_month or date.anchored):
+            return date
+    return None
+
+
+def find_date(line: str) -> Optional[DateMatch]:
+    """The first date range, or failing that the first single date, in ``line``."""
+    single = None
+    for date in iter_dates(line):
+        if date.is_range:
+            return date
+        if single is None:
+            single = date
+    return single
+
+
+def date_fields(date: Optional[DateMatch], single_is_end: bool = False) -> Dict[str, Any]:
+    """
+    The typed ``start``, ``end`` and ``current`` fields of a resume entry.
+
+    Args:
+        date: The entry's date or date range, if it has one
+        single_is_end: Whether a single date is when the entry ended, as for
+            a graduation year, rather than when it started
+    """
+    if date is None:
+        return {'start': None, 'end': None, 'current': False}
+    if not date.is_range and single_is_end:
+        return {'start': None, 'end': date.start.to_dict(), 'current': False}
+    return {
+        'start': date.start.to_dict(),
+        'end': date.end.to_dict() if date.end else None,
+        'current': date.current,
+    }
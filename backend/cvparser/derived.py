@@ -0,0 +1,293 @@
+"""
+Derived data of a resume, kept per section so an edit only redoes what changed.
+
+At upload the parser derives typed dates, the experience timeline and more
+from the file. When the user edits the resume afterwards, derive_sections()
+works these out again from the edited sections: every section is stored with
+a hash of its content and its artifacts, and when the previous result is
+passed in, the artifacts of each section whose hash is unchanged are reused
+rather than recomputed. Artifacts per section:
+
+- ``keywords``: the normalized terms of the section, for keyword matching
+  with match_keywords() without rescanning the text;
+- ``dates`` (experience and education): ``start``, ``end``, ``current`` and
+  ``duration_months`` of each entry, from its ``date_range``; an entry whose
+  ``date_range`` is unchanged since the last derivation keeps its own
+  ``start``/``end``/``current``, so dates the user set are not overwritten;
+- ``date_ranges`` (experience and education): the ``date_range`` texts the
+  dates were derived from;
+- ``timeline`` (experience): build_timeline() of the dated entries;
+- ``skills`` (skills): the individual skills listed on the section's lines.
+
+apply_derived() writes the dates and the timeline back into the content. A
+section's hash is taken with its dates written in, so writing them back does
+not look like an edit, while the user changing one does.
+
+Durations of current entries and the timeline depend on the month they were
+derived in, stored as ``as_of`` along with ``current``, whether any entry is
+current; cvparser.timeline.is_stale() tells when that data is out of date,
+as for a timeline. From the next month on, the sections with a current entry
+are derived again even if their content did not change.
+"""
+import hashlib
+import json
+import re
+from typing import Any, Callable, Collection, Dict, Iterator, List, Optional, Tuple
+
+from cvparser.dates import date_fields, find_date, find_date_range
+from cvparser.timeline import build_timeline, entry_months, month_of
+
+# Stored artifacts of another version are recomputed rather than reused
+DERIVED_VERSION = 3
+
+# Entry keys written by apply_derived
+DATE_KEYS = ('start', 'end', 'current', 'duration_months')
+
+# Computed from the other date keys; left out of section hashes
+COMPUTED_KEYS = ('duration_months',)
+
+TERM_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#]*(?:[./-][a-z0-9+#]+)*")
+SKILL_SEPARATORS = re.compile(r"\s*(?:[,;|•·]|\s/\s)\s*")
+
+STOPWORDS = frozenset((
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'in', 'into', 'is', 'it',
+    'of', 'on', 'or', 'our', 'the', 'to', 'was', 'were', 'with', 'within', 'while', 'i', 'my',
+    'we', 'this', 'that', 'these', 'those', 'using', 'via', 'per',
+))
+
+
+def _strip_computed(value: Any) -> Any:
+    if isinstance(value, list):
+        return [
+            {key: item for key, item in entry.items() if key not in COMPUTED_KEYS} if isinstance(entry, dict) else entry
+            for entry in value
+        ]
+    return value
+
+
+def section_hash(value: Any) -> str:
+    """Hash of a section's content, leaving out the COMPUTED_KEYS of entries."""
+    canonical = json.dumps(_strip_computed(value), sort_keys=True, separators=(',', ':'), ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+def _strings(value: Any) -> Iterator[str]:
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            if key not in DATE_KEYS:
+                yield from _strings(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _strings(item)
+
+
+def terms(text: str) -> List[str]:
+    """Normalized terms of a text: lowercased words, without stopwords."""
+    return [term for term in TERM_PATTERN.findall(text.lower()) if term not in STOPWORDS]
+
+
+def section_keywords(value: Any) -> List[str]:
+    """Sorted distinct terms of every string in a section."""
+    found = set()
+    for text in _strings(value):
+        found.update(terms(text))
+    return sorted(found)
+
+
+def extract_skills(lines: List[str]) -> List[str]:
+    """
+    Split skills section lines into individual skills.
+
+    Lines such as ``Languages: Python, Go`` lose their label, and skills
+    listed more than once are kept once, in order of first appearance.
+    """
+    skills: List[str] = []
+    seen = set()
+    for line in lines:
+        if not isinstance(line, str):
+            continue
+        label, colon, rest = line.partition(':')
+        if colon and len(label.split()) <= 3:
+            line = rest
+        for skill in SKILL_SEPARATORS.split(line):
+            skill = skill.strip(" \t-*–")
+            if skill and skill.lower() not in seen:
+                seen.add(skill.lower())
+                skills.append(skill)
+    return skills
+
+
+def _entry_dates(entry: Dict[str, Any], single_is_end: bool, derived_from: Collection[str] = ()) -> Dict[str, Any]:
+    text = entry.get('date_range') or ''
+    if text in derived_from and ('start' in entry or 'end' in entry):
+        # Dates already derived from this text, possibly edited since
+        dates = {key: entry.get(key) for key in ('start', 'end')}
+        dates['current'] = bool(entry.get('current'))
+        dates['duration_months'] = entry_months(dates)
+        return dates
+    match = find_date_range(text) or find_date(text)
+    if match is None and single_is_end:
+        # Education dates may be on a details line
+        for line in entry.get('details') or ():
+            match = find_date(line) if isinstance(line, str) else None
+            if match:
+                break
+    if match is None:
+        # Nothing to derive from; keep what the entry has
+        dates = {key: entry.get(key) for key in ('start', 'end')}
+        dates['current'] = bool(entry.get('current'))
+    else:
+        dates = date_fields(match, single_is_end=single_is_end)
+    dates['duration_months'] = entry_months(dates)
+    return dates
+
+
+def _entries(value: Any) -> List[Dict[str, Any]]:
+    return [entry for entry in value if isinstance(entry, dict)] if isinstance(value, list) else []
+
+
+def _derive_dates(value: Any, single_is_end: bool, before: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    entries = _entries(value)
+    derived_from = set((before or {}).get('date_ranges', ()))
+    return {
+        'dates': [_entry_dates(entry, single_is_end, derived_from) for entry in entries],
+        'date_ranges': [entry.get('date_range') or '' for entry in entries],
+    }
+
+
+def derive_experience(value: Any, before: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    derived = _derive_dates(value, False, before)
+    entries = _entries(value)
+    derived['timeline'] = build_timeline([{**entry, **dates} for entry, dates in zip(entries, derived['dates'])])
+    return derived
+
+
+def derive_education(value: Any, before: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    return _derive_dates(value, True, before)
+
+
+def derive_skills(value: Any, before: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    return {'skills': extract_skills(value if isinstance(value, list) else [value])}
+
+
+def _with_dates(value: Any, dates: List[Dict[str, Any]]) -> Any:
+    """A list section with each entry's derived dates written in."""
+    if not isinstance(value, list):
+        return value
+    dates = iter(dates)
+    return [{**entry, **next(dates)} if isinstance(entry, dict) else entry for entry in value]
+
+
+# Section -> function computing its artifacts besides keywords, given the
+# section's previous artifacts if any
+SECTION_DERIVERS: Dict[str, Callable[[Any, Optional[Dict[str, Any]]], Dict[str, Any]]] = {
+    'experience': derive_experience,
+    'education': derive_education,
+    'skills': derive_skills,
+}
+
+
+def derive_section(name: str, value: Any, before: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Hash and artifacts of one section.
+
+    The hash is of the section as apply_derived() leaves it, with the
+    derived dates written in.
+    """
+    derived = {'keywords': section_keywords(value)}
+    deriver = SECTION_DERIVERS.get(name)
+    if deriver is not None:
+        derived.update(deriver(value, before))
+    if 'dates' in derived:
+        value = _with_dates(value, derived['dates'])
+    derived['hash'] = section_hash(value)
+    return derived
+
+
+def _has_current(artifacts: Dict[str, Any]) -> bool:
+    return any(dates.get('current') for dates in artifacts.get('dates', ()))
+
+
+def derive_sections(
+    sections: Dict[str, Any], previous: Optional[Dict[str, Any]] = None
+) -> Tuple[Dict[str, Any], List[str]]:
+    """
+    Derive the artifacts of every section, reusing unchanged ones.
+
+    Args:
+        sections: The ``sections`` of a parsed or edited resume
+        previous: What this function returned for the resume before the
+            edit, if known
+
+    Returns:
+        The derived data to store with the resume, and the names of the
+        sections whose artifacts were recomputed
+    """
+    stored: Dict[str, Any] = {}
+    if previous and previous.get('version') == DERIVED_VERSION:
+        stored = previous.get('sections') or {}
+    as_of = month_of()
+    outdated = bool(previous) and previous.get('as_of') != as_of
+    derived: Dict[str, Any] = {}
+    recomputed: List[str] = []
+    for name, value in sections.items():
+        before = stored.get(name)
+        if (
+            before is not None
+            and before.get('hash') == section_hash(value)
+            and not (outdated and _has_current(before))
+        ):
+            derived[name] = before
+        else:
+            derived[name] = derive_section(name, value, before)
+            recomputed.append(name)
+    current = any(_has_current(artifacts) for artifacts in derived.values())
+    return {'version': DERIVED_VERSION, 'as_of': as_of, 'current': current, 'sections': derived}, recomputed
+
+
+def apply_derived(content: Dict[str, Any], derived: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Copy of resume content with the derived dates and timeline written in.
+
+    Args:
+        content: Resume content with ``sections``
+        derived: Result of derive_sections for those sections
+
+    Returns:
+        The content with each experience and education entry's dates and
+        the ``timeline`` replaced by the derived ones
+    """
+    sections = dict(content.get('sections') or {})
+    for name, artifacts in derived.get('sections', {}).items():
+        if 'dates' in artifacts:
+            sections[name] = _with_dates(sections.get(name), artifacts['dates'])
+    updated = {**content, 'sections': sections}
+    experience = derived.get('sections', {}).get('experience')
+    if experience is not None:
+        updated['timeline'] = experience['timeline']
+    return updated
+
+
+def match_keywords(derived: Dict[str, Any], keywords: List[str]) -> Dict[str, List[str]]:
+    """
+    Keywords found in each section, from the stored section terms.
+
+    A keyword of several words matches a section containing all of them.
+
+    Args:
+        derived: Result of derive_sections
+        keywords: Keywords to look for, such as those of a job description
+
+    Returns:
+        Section name -> the keywords it contains, for sections with any
+    """
+    wanted = [(keyword, set(terms(keyword))) for keyword in keywords]
+    matches: Dict[str, List[str]] = {}
+    for name, artifacts in derived.get('sections', {}).items():
+        present = set(artifacts.get('keywords', ()))
+        found = [keyword for keyword, needed in wanted if needed and needed <= present]
+        if found:
+            matches[name] = found
+    return matches
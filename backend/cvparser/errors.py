@@ -0,0 +1,66 @@
+"""
+Exceptions raised by the resume parsing services.
+"""
+from typing import Any, Dict, Optional
+
+
+class ResumeParseError(Exception):
+    """Custom exception for resume parsing errors."""
+    pass
+
+
+class ParseQueueFullError(ResumeParseError):
+    """Raised when the parse executor already holds its maximum number of jobs."""
+    pass
+
+
+class ParseTimeoutError(ResumeParseError):
+    """
+    Raised when a parse job does not finish within its time limit.
+
+    ``timeout`` is the limit in seconds, ``elapsed`` how long the job ran
+    before it was stopped and ``job`` the description the job was submitted
+    with (file name, format and digest), where known.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        timeout: Optional[float] = None,
+        elapsed: Optional[float] = None,
+        job: Optional[Dict[str, Any]] = None
+    ):
+        super().__init__(message)
+        self.timeout = timeout
+        self.elapsed = elapsed
+        self.job = job or {}
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Error details for API responses and logs."""
+        return {
+            "error": "parse_timeout",
+            "message": str(self),
+            "timeout": self.timeout,
+            "elapsed": self.elapsed,
+            **self.job,
+        }
+
+
+class ParseServiceUnavailableError(ResumeParseError):
+    """Raised when the remote parse service cannot be reached or fails itself."""
+    pass
+
+
+class UnsupportedFormatError(ResumeParseError):
+    """Raised when no extractor is registered for a file's format."""
+    pass
+
+
+class ParseLimitError(ResumeParseError):
+    """Raised when an upload exceeds a size, page, archive or text ceiling."""
+    pass
+
+
+class ParseMemoryError(ParseLimitError):
+    """Raised when a parse job exceeds the per-document memory limit."""
+    pass
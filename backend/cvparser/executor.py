@@ -0,0 +1,123 @@
+"""
+Bounded process pool for CPU-bound resume parsing.
+"""
+import asyncio
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional
+
+from cvparser.errors import ParseQueueFullError, ParseTimeoutError, ResumeParseError
+
+logger = logging.getLogger(__name__)
+
+
+class ParseExecutor:
+    """
+    Run parse jobs in a pool of worker processes so that pdfplumber and
+    python-docx never block the event loop.
+
+    At most ``max_workers`` jobs run at once and at most ``max_pending`` more
+    wait for a free worker; anything beyond that is rejected immediately with
+    ``ParseQueueFullError`` instead of queueing without bound.
+    """
+
+    def __init__(self, max_workers: int, max_pending: int, timeout: float):
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(0, max_pending)
+        self.timeout = timeout
+        self._pool: Optional[ProcessPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._in_flight = 0
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of jobs that can be running or queued."""
+        return self.max_workers + self.max_pending
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(max_workers=self.max_workers)
+            return self._pool
+
+    def _reset_pool(self) -> None:
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
+
+    async def submit(self, fn: Callable[..., Any], *args: Any, job: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Run ``fn(*args)`` in a worker process and wait for its result.
+
+        ``fn`` and its arguments must be picklable, so pass module-level
+        functions and plain data. ``job`` describes the document (filename,
+        format, sha256) for logs and timeout errors.
+
+        Raises:
+            ParseQueueFullError: If the executor is already at capacity
+            ParseTimeoutError: If the job runs longer than ``timeout`` seconds
+            ResumeParseError: If the worker process dies
+        """
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                raise ParseQueueFullError(
+                    f"Resume parser is busy ({self._in_flight} jobs queued), please retry shortly"
+                )
+            self._in_flight += 1
+
+        try:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._get_pool(), fn, *args)
+            try:
+                return await asyncio.wait_for(future, timeout=self.timeout)
+            except asyncio.TimeoutError:
+                # The worker cannot be interrupted; it keeps running until the
+                # job finishes, but the caller is released straight away.
+                logger.warning(
+                    f"Parse job {getattr(fn, '__name__', fn)} timed out after {self.timeout}s: "
+                    f"{(job or {}).get('filename', '?')}"
+                )
+                raise ParseTimeoutError(
+                    f"Resume parsing timed out after {self.timeout:g} seconds",
+                    timeout=self.timeout, elapsed=self.timeout, job=job,
+                )
+        except BrokenProcessPool:
+            logger.error("Parse worker process died, recreating pool")
+            self._reset_pool()
+            raise ResumeParseError("Resume parsing failed: worker process terminated unexpectedly")
+        finally:
+            with self._lock:
+                self._in_flight -= 1
+
+    async def warm(self, fn: Callable[[], Any]) -> None:
+        """
+        Start the worker processes by running ``fn`` once per worker.
+
+        The jobs are submitted together, so each one needs a worker of its
+        own and the pool spawns all of them; ``fn`` can import whatever the
+        workers will need so the first real parse jobs do not pay for it.
+        """
+        await asyncio.gather(*(self.submit(fn) for _ in range(self.max_workers)))
+
+    def incidents(self) -> List[Dict[str, Any]]:
+        """Limit hits are not tracked by the unsupervised pool."""
+        return []
+
+    def stats(self) -> Dict[str, int]:
+        """Return current load figures for logging and health checks."""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "capacity": self.capacity,
+                "in_flight": self._in_flight,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes."""
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,152 @@
+"""
+Field parsers that turn section lines into structured resume data.
+"""
+import re
+from typing import Any, Dict, List, Optional
+
+from cvparser.contact import extract_contact
+from cvparser.dates import date_fields, find_date, find_date_range
+from cvparser.timeline import build_timeline, entry_months
+
+DEGREE_PATTERN = re.compile(
+    r'(?:Bachelor|Master|PhD|B\.?S\.?|M\.?S\.?|B\.?A\.?|M\.?A\.?|B\.?E\.?|M\.?E\.?|B\.?Tech|M\.?Tech)'
+)
+
+
+def parse_experience(experience_lines: List[str]) -> List[Dict[str, Any]]:
+    """
+    Parse experience section into structured data.
+    
+    An entry starts at each line with a date range. Besides the range as
+    written (``date_range``), entries carry ``start`` and ``end`` dates as
+    ``{year, month, precision}`` dicts, ``current`` for open-ended roles and
+    ``duration_months``.
+    
+    Args:
+        experience_lines: List of lines from experience section
+    
+    Returns:
+        List of parsed experience entries
+    """
+    experiences = []
+    current_experience: Dict[str, Any] = {}
+
+    for line in experience_lines:
+        date_match = find_date_range(line)
+
+        if date_match:
+            # If we have a previous experience, save it
+            if current_experience:
+                experiences.append(current_experience)
+
+            # Start new experience
+            current_experience = {
+                'title': '',
+                'company': '',
+                'date_range': date_match.text,
+                **date_fields(date_match),
+                'description': []
+            }
+            current_experience['duration_months'] = entry_months(current_experience)
+        elif current_experience:
+            # If line looks like a title/company
+            if not current_experience['title'] and ' - ' in line:
+                title_company = line.split(' - ')
+                current_experience['title'] = title_company[0].strip()
+                if len(title_company) > 1:
+                    current_experience['company'] = title_company[1].strip()
+            else:
+                current_experience['description'].append(line)
+
+    # Add the last experience if exists
+    if current_experience:
+        experiences.append(current_experience)
+
+    return experiences
+
+
+def parse_education(education_lines: List[str]) -> List[Dict[str, Any]]:
+    """
+    Parse education section into structured data.
+    
+    The first date or date range in an entry's lines gives its ``start``
+    and ``end``; a single date is taken as the end (graduation) date.
+    
+    Args:
+        education_lines: List of lines from education section
+    
+    Returns:
+        List of parsed education entries
+    """
+    education = []
+    current_education: Dict[str, Any] = {}
+
+    for line in education_lines:
+        degree_match = DEGREE_PATTERN.search(line)
+
+        if degree_match:
+            # If we have a previous education, save it
+            if current_education:
+                education.append(current_education)
+
+            # Start new education
+            current_education = {
+                'degree': degree_match.group(),
+                'institution': '',
+                'date_range': '',
+                **date_fields(None),
+                'details': []
+            }
+        elif current_education:
+            # If line looks like an institution
+            if not current_education['institution'] and ',' in line:
+                institution_date = line.split(',')
+                current_education['institution'] = institution_date[0].strip()
+                if len(institution_date) > 1:
+                    current_education['date_range'] = institution_date[1].strip()
+            else:
+                current_education['details'].append(line)
+        if current_education and current_education['start'] is None and current_education['end'] is None:
+            current_education.update(date_fields(find_date(line), single_is_end=True))
+
+    # Add the last education if exists
+    if current_education:
+        education.append(current_education)
+
+    return education
+
+
+def parse_fields(
+    raw_text: str, lines: List[str], sections: Dict[str, List[str]], text: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Build the parsed resume dict from the outputs of the earlier stages.
+    
+    Args:
+        raw_text: Text as extracted from the file, returned unchanged
+        lines: Normalized non-empty lines of the resume
+        sections: Section key -> lines, as produced by segmentation
+        text: ``lines`` joined with newlines, if already available
+    
+    Returns:
+        Dict with raw_text, contact_info, sections and the experience
+        timeline
+    """
+    if text is None:
+        text = '\n'.join(lines)
+    experience = parse_experience(sections['experience'])
+    return {
+        "raw_text": raw_text,
+        "contact_info": extract_contact(text),
+        "sections": {
+            "summary": sections['summary'][0] if sections['summary'] else "",
+            "experience": experience,
+            "education": parse_education(sections['education']),
+            "skills": sections['skills'],
+            "projects": sections['projects'],
+            "certifications": sections['certifications'],
+            "languages": sections['languages'],
+            "references": sections['references']
+        },
+        "timeline": build_timeline(experience)
+    }
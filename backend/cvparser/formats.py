@@ -0,0 +1,184 @@
+"""
+Upload format detection with a fast-reject path.
+
+An upload is classified from its leading bytes, and for ZIP files from the
+central directory at the end of the archive, before any extraction library
+is imported or run. The file extension is never trusted: a PDF named
+``cv.docx`` is rerouted to the PDF extractor, and a JPEG named ``cv.pdf`` is
+rejected outright. Byte, page, archive and text ceilings turn resource
+exhaustion uploads into a cheap error:
+
+- the byte ceiling is checked before anything is read;
+- a ZIP must list ``word/document.xml`` and declare at most
+  ``max_uncompressed_bytes`` across at most ``max_archive_entries`` entries;
+- a PDF's page count is estimated from its linearization or page tree
+  dictionaries near either end of the file, and checked exactly again by
+  the extractor before any text is extracted;
+- extracted text longer than ``max_text_chars`` is rejected by the pipeline.
+"""
+import logging
+import re
+import struct
+from typing import NamedTuple, Optional
+
+from cvparser.buffers import Buffer
+from cvparser.errors import ParseLimitError, UnsupportedFormatError
+
+logger = logging.getLogger(__name__)
+
+# Bytes inspected at each end of the file
+HEAD_BYTES = 4096
+TAIL_BYTES = 64 * 1024
+
+# A PDF header may be preceded by up to this many bytes of junk
+PDF_HEADER_WINDOW = 1024
+
+ZIP_LOCAL_HEADER = b'PK\x03\x04'
+ZIP_END_RECORD = b'PK\x05\x06'
+ZIP_EOCD = struct.Struct('<4s4H2LH')
+ZIP_CENTRAL_HEADER = struct.Struct('<4s6H3L5H2L')
+DOCX_DOCUMENT_PART = b'word/document.xml'
+
+# Formats that are never resumes, named so the rejection can say what was sent
+FOREIGN_SIGNATURES = (
+    (b'\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1', 'legacy binary Word document (save it as .docx)'),
+    (b'\xff\xd8\xff', 'JPEG image'),
+    (b'\x89PNG\r\n\x1a\n', 'PNG image'),
+    (b'GIF87a', 'GIF image'),
+    (b'GIF89a', 'GIF image'),
+    (b'II*\x00', 'TIFF image'),
+    (b'MM\x00*', 'TIFF image'),
+    (b'RIFF', 'RIFF media file'),
+    (b'\x1f\x8b', 'gzip archive'),
+    (b'7z\xbc\xaf\x27\x1c', '7-Zip archive'),
+    (b'Rar!\x1a\x07', 'RAR archive'),
+    (b'\x7fELF', 'executable'),
+    (b'MZ', 'Windows executable'),
+)
+
+_PDF_LINEARIZED_PAGES = re.compile(rb'/Linearized\b[^>]*?/N\s+(\d+)')
+_PDF_TREE_PAGES = re.compile(rb'/Type\s*/Pages\b[^>]*?/Count\s+(\d+)|/Count\s+(\d+)[^>]*?/Type\s*/Pages\b')
+
+
+class ParseLimits(NamedTuple):
+    max_bytes: int = 10 * 1024 * 1024
+    max_pages: int = 100
+    max_text_chars: int = 200_000
+    max_uncompressed_bytes: int = 64 * 1024 * 1024
+    max_archive_entries: int = 2000
+
+
+def _extension(filename: Optional[str]) -> str:
+    return filename.rsplit('.', 1)[-1].lower() if filename and '.' in filename else ''
+
+
+def inspect_zip(content: Buffer, limits: ParseLimits) -> None:
+    """
+    Check that a ZIP file is a Word document within the archive ceilings,
+    reading only its central directory.
+    
+    Raises:
+        UnsupportedFormatError: If the archive is damaged or not a Word document
+        ParseLimitError: If it declares too many entries or too much data
+    """
+    size = len(content)
+    tail_start = max(0, size - TAIL_BYTES - ZIP_EOCD.size)
+    tail = bytes(content[tail_start:])
+    eocd = tail.rfind(ZIP_END_RECORD)
+    if eocd == -1 or len(tail) - eocd < ZIP_EOCD.size:
+        raise UnsupportedFormatError("File is a damaged ZIP archive, not a Word document")
+    _, _, _, _, entries, directory_size, directory_offset, _ = ZIP_EOCD.unpack_from(tail, eocd)
+    if entries == 0xFFFF or directory_offset == 0xFFFFFFFF:
+        raise ParseLimitError("ZIP64 archives are not accepted as resumes")
+    if entries > limits.max_archive_entries:
+        raise ParseLimitError(f"Archive has {entries} entries; the limit is {limits.max_archive_entries}")
+    if directory_offset + directory_size > size:
+        raise UnsupportedFormatError("File is a damaged ZIP archive, not a Word document")
+
+    directory = bytes(content[directory_offset:directory_offset + directory_size])
+    offset = 0
+    uncompressed = 0
+    has_document = False
+    for _ in range(entries):
+        if offset + ZIP_CENTRAL_HEADER.size > len(directory):
+            raise UnsupportedFormatError("File is a damaged ZIP archive, not a Word document")
+        fields = ZIP_CENTRAL_HEADER.unpack_from(directory, offset)
+        if fields[0] != b'PK\x01\x02':
+            raise UnsupportedFormatError("File is a damaged ZIP archive, not a Word document")
+        uncompressed += fields[9]
+        name_start = offset + ZIP_CENTRAL_HEADER.size
+        name_length, extra_length, comment_length = fields[10], fields[11], fields[12]
+        if directory[name_start:name_start + name_length] == DOCX_DOCUMENT_PART:
+            has_document = True
+        offset = name_start + name_length + extra_length + comment_length
+
+    if not has_document:
+        raise UnsupportedFormatError("File is a ZIP archive but not a Word document")
+    if uncompressed > limits.max_uncompressed_bytes:
+        raise ParseLimitError(
+            f"Word document expands to {uncompressed} bytes; the limit is {limits.max_uncompressed_bytes}"
+        )
+
+
+def estimate_pdf_pages(content: Buffer) -> Optional[int]:
+    """
+    Estimate a PDF's page count from the first and last few KB.
+    
+    Returns:
+        The largest page count declared by a linearization or page tree
+        dictionary in those windows, or None if none was found
+    """
+    windows = [bytes(content[:HEAD_BYTES]), bytes(content[-TAIL_BYTES:])]
+    counts = [int(match.group(1)) for match in _PDF_LINEARIZED_PAGES.finditer(windows[0])]
+    for window in windows:
+        counts += [int(match.group(1) or match.group(2)) for match in _PDF_TREE_PAGES.finditer(window)]
+    return max(counts) if counts else None
+
+
+def detect_format(content: Buffer, filename: Optional[str] = None, limits: ParseLimits = ParseLimits()) -> str:
+    """
+    Classify an upload and enforce the pre-extraction ceilings.
+    
+    Args:
+        content: The file content
+        filename: Name of the upload; only used to log format mismatches
+        limits: Ceilings to enforce
+    
+    Returns:
+        'pdf', 'docx' or 'rtf'
+    
+    Raises:
+        ParseLimitError: If the upload exceeds a ceiling
+        UnsupportedFormatError: If the content is not a supported document
+    """
+    if len(content) > limits.max_bytes:
+        raise ParseLimitError(f"File is larger than the {limits.max_bytes} byte limit")
+    if not len(content):
+        raise UnsupportedFormatError("File is empty")
+
+    head = bytes(content[:HEAD_BYTES])
+    if head.startswith(ZIP_LOCAL_HEADER) or head.startswith(ZIP_END_RECORD):
+        inspect_zip(content, limits)
+        file_format = 'docx'
+    elif b'%PDF-' in head[:PDF_HEADER_WINDOW]:
+        pages = estimate_pdf_pages(content)
+        if pages is not None and pages > limits.max_pages:
+            raise ParseLimitError(f"PDF has {pages} pages; the limit is {limits.max_pages}")
+        file_format = 'pdf'
+    elif head.lstrip(b'\xef\xbb\xbf \t\r\n').startswith(b'{\\rtf'):
+        file_format = 'rtf'
+    else:
+        for signature, description in FOREIGN_SIGNATURES:
+            if head.startswith(signature):
+                raise UnsupportedFormatError(
+                    f"File content is a {description}, not a PDF, DOCX, DOC or RTF document"
+                )
+        raise UnsupportedFormatError(
+            f"Unsupported file format: {_extension(filename) or 'unknown'} "
+            "(content is not a PDF, DOCX, DOC or RTF document)"
+        )
+
+    extension = _extension(filename)
+    if extension and extension != file_format and not (extension == 'doc' and file_format == 'docx'):
+        logger.info(f"Upload {filename} has {file_format.upper()} content; parsing it as {file_format}")
+    return file_format
@@ -0,0 +1,404 @@
+"""
+Typed, compact representation of a parsed resume.
+
+The parser's public result is a nested dict. ParsedResume holds the same data
+in ``__slots__`` records, which need less memory than the dicts and give
+services attribute access instead of chains of ``.get()`` calls.
+Dates are PartialDate tuples rather than dicts, and section names are only
+stored as the module's interned constants, not once per resume.
+
+``to_dict``/``from_dict`` convert to and from the dict form losslessly:
+keys the model does not know about, such as those in resumes rewritten by
+the skills incorporation prompt, are carried in ``extra``. ``to_bytes`` and
+``from_bytes`` give a compact binary form for caches: marshal over plain
+tuples, smaller than JSON and faster to write and load.
+"""
+import marshal
+import sys
+from typing import Any, Dict, List, Optional, Tuple
+
+from cvparser.contact import CONTACT_FIELDS
+from cvparser.dates import PartialDate
+
+# Lists of lines stored as they are, in result order after summary,
+# experience and education
+LINE_SECTIONS = tuple(sys.intern(key) for key in ('skills', 'projects', 'certifications', 'languages', 'references'))
+
+_TOP_LEVEL_KEYS = frozenset(('raw_text', 'contact_info', 'sections', 'timeline'))
+_SECTION_KEYS = frozenset(('summary', 'experience', 'education') + LINE_SECTIONS)
+_EXPERIENCE_KEYS = ('title', 'company', 'date_range', 'start', 'end', 'current', 'description', 'duration_months')
+_EDUCATION_KEYS = ('degree', 'institution', 'date_range', 'start', 'end', 'current', 'details')
+
+# Binary format: magic, format version, then a marshalled tuple
+_MAGIC = b'PCVR'
+_FORMAT = 1
+_MARSHAL_VERSION = 4
+
+
+def is_serialized_resume(data: bytes) -> bool:
+    """Whether ``data`` was written by ParsedResume.to_bytes."""
+    return data[:len(_MAGIC) + 1] == _MAGIC + bytes((_FORMAT,))
+
+
+def _date(value: Any) -> Optional[PartialDate]:
+    if not value:
+        return None
+    if isinstance(value, dict):
+        return PartialDate(value['year'], value.get('month'))
+    return PartialDate(*value)
+
+
+def _date_dict(value: Optional[PartialDate]) -> Optional[Dict[str, Any]]:
+    return value.to_dict() if value is not None else None
+
+
+def _date_tuple(value: Optional[PartialDate]) -> Optional[Tuple[int, Optional[int]]]:
+    return (value.year, value.month) if value is not None else None
+
+
+def _extra(data: Dict[str, Any], known) -> Optional[Dict[str, Any]]:
+    extra = {key: value for key, value in data.items() if key not in known}
+    return extra or None
+
+
+class ContactInfo:
+    """Contact details; a field is None when it was not found."""
+
+    __slots__ = CONTACT_FIELDS + ('extra',)
+
+    def __init__(
+        self,
+        email: Optional[str] = None,
+        phone: Optional[str] = None,
+        location: Optional[str] = None,
+        linkedin: Optional[str] = None,
+        website: Optional[str] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ):
+        self.email = email
+        self.phone = phone
+        self.location = location
+        self.linkedin = linkedin
+        self.website = website
+        self.extra = extra
+
+    def get(self, field: str, default: Any = None) -> Any:
+        """Look up a field by name, including fields only present in ``extra``."""
+        if field in CONTACT_FIELDS:
+            value = getattr(self, field)
+            return default if value is None else value
+        return (self.extra or {}).get(field, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            'email': self.email,
+            'phone': self.phone,
+            'location': self.location,
+            'linkedin': self.linkedin,
+            'website': self.website,
+        }
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict[str, Any]]) -> 'ContactInfo':
+        if not isinstance(data, dict):
+            data = {}
+        return cls(
+            data.get('email'),
+            data.get('phone'),
+            data.get('location'),
+            data.get('linkedin'),
+            data.get('website'),
+            _extra(data, CONTACT_FIELDS),
+        )
+
+    def _to_tuple(self) -> tuple:
+        return (self.email, self.phone, self.location, self.linkedin, self.website, self.extra)
+
+
+class ExperienceEntry:
+    """One role from the experience section."""
+
+    __slots__ = _EXPERIENCE_KEYS + ('extra',)
+
+    def __init__(
+        self,
+        title: str = '',
+        company: str = '',
+        date_range: str = '',
+        start: Optional[PartialDate] = None,
+        end: Optional[PartialDate] = None,
+        current: bool = False,
+        description: Optional[List[str]] = None,
+        duration_months: Optional[int] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ):
+        self.title = title
+        self.company = company
+        self.date_range = date_range
+        self.start = start
+        self.end = end
+        self.current = current
+        self.description = description if description is not None else []
+        self.duration_months = duration_months
+        self.extra = extra
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            'title': self.title,
+            'company': self.company,
+            'date_range': self.date_range,
+            'start': _date_dict(self.start),
+            'end': _date_dict(self.end),
+            'current': self.current,
+            'description': list(self.description),
+            'duration_months': self.duration_months,
+        }
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ExperienceEntry':
+        description = data.get('description')
+        if isinstance(description, str):
+            description = [description]
+        return cls(
+            data.get('title', ''),
+            data.get('company', ''),
+            data.get('date_range', ''),
+            _date(data.get('start')),
+            _date(data.get('end')),
+            data.get('current', False),
+            list(description or ()),
+            data.get('duration_months'),
+            _extra(data, _EXPERIENCE_KEYS),
+        )
+
+    def _to_tuple(self) -> tuple:
+        return (
+            self.title, self.company, self.date_range, _date_tuple(self.start), _date_tuple(self.end),
+            self.current, self.description, self.duration_months, self.extra,
+        )
+
+    @classmethod
+    def _from_tuple(cls, values: tuple) -> 'ExperienceEntry':
+        title, company, date_range, start, end, current, description, duration_months, extra = values
+        return cls(title, company, date_range, _date(start), _date(end), current, description, duration_months, extra)
+
+
+class EducationEntry:
+    """One qualification from the education section."""
+
+    __slots__ = _EDUCATION_KEYS + ('extra',)
+
+    def __init__(
+        self,
+        degree: str = '',
+        institution: str = '',
+        date_range: str = '',
+        start: Optional[PartialDate] = None,
+        end: Optional[PartialDate] = None,
+        current: bool = False,
+        details: Optional[List[str]] = None,
+        extra: Optional[Dict[str, Any]] = None,
+    ):
+        self.degree = degree
+        self.institution = institution
+        self.date_range = date_range
+        self.start = start
+        self.end = end
+        self.current = current
+        self.details = details if details is not None else []
+        self.extra = extra
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            'degree': self.degree,
+            'institution': self.institution,
+            'date_range': self.date_range,
+            'start': _date_dict(self.start),
+            'end': _date_dict(self.end),
+            'current': self.current,
+            'details': list(self.details),
+        }
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'EducationEntry':
+        return cls(
+            data.get('degree', ''),
+            data.get('institution', ''),
+            data.get('date_range', ''),
+            _date(data.get('start')),
+            _date(data.get('end')),
+            data.get('current', False),
+            list(data.get('details') or ()),
+            _extra(data, _EDUCATION_KEYS),
+        )
+
+    def _to_tuple(self) -> tuple:
+        return (
+            self.degree, self.institution, self.date_range, _date_tuple(self.start), _date_tuple(self.end),
+            self.current, self.details, self.extra,
+        )
+
+    @classmethod
+    def _from_tuple(cls, values: tuple) -> 'EducationEntry':
+        degree, institution, date_range, start, end, current, details, extra = values
+        return cls(degree, institution, date_range, _date(start), _date(end), current, details, extra)
+
+
+class ParsedResume:
+    """
+    A parsed resume: contact details, summary, experience, education, the
+    line-list sections and the experience timeline.
+    """
+
+    __slots__ = (
+        'raw_text', 'contact', 'summary', 'experience', 'education',
+        'skills', 'projects', 'certifications', 'languages', 'references',
+        'timeline', 'extra', 'section_extra',
+    )
+
+    def __init__(
+        self,
+        raw_text: str = '',
+        contact: Optional[ContactInfo] = None,
+        summary: str = '',
+        experience: Optional[List[ExperienceEntry]] = None,
+        education: Optional[List[EducationEntry]] = None,
+        skills: Optional[List[str]] = None,
+        projects: Optional[List[str]] = None,
+        certifications: Optional[List[str]] = None,
+        languages: Optional[List[str]] = None,
+        references: Optional[List[str]] = None,
+        timeline: Optional[Dict[str, Any]] = None,
+        extra: Optional[Dict[str, Any]] = None,
+        section_extra: Optional[Dict[str, Any]] = None,
+    ):
+        self.raw_text = raw_text
+        self.contact = contact if contact is not None else ContactInfo()
+        self.summary = summary
+        self.experience = experience if experience is not None else []
+        self.education = education if education is not None else []
+        self.skills = skills if skills is not None else []
+        self.projects = projects if projects is not None else []
+        self.certifications = certifications if certifications is not None else []
+        self.languages = languages if languages is not None else []
+        self.references = references if references is not None else []
+        self.timeline = timeline
+        self.extra = extra
+        self.section_extra = section_extra
+
+    @property
+    def most_recent(self) -> Optional[ExperienceEntry]:
+        """The most recent role according to the timeline, else the first listed."""
+        index = ((self.timeline or {}).get('most_recent') or {}).get('index')
+        if index is not None and index < len(self.experience):
+            return self.experience[index]
+        return self.experience[0] if self.experience else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The parser's dict form; every call returns fresh containers."""
+        sections = {
+            'summary': self.summary,
+            'experience': [entry.to_dict() for entry in self.experience],
+            'education': [entry.to_dict() for entry in self.education],
+            'skills': list(self.skills),
+            'projects': list(self.projects),
+            'certifications': list(self.certifications),
+            'languages': list(self.languages),
+            'references': list(self.references),
+        }
+        if self.section_extra:
+            sections.update(self.section_extra)
+        data = {
+            'raw_text': self.raw_text,
+            'contact_info': self.contact.to_dict(),
+            'sections': sections,
+        }
+        if self.timeline is not None:
+            data['timeline'] = marshal.loads(marshal.dumps(self.timeline, _MARSHAL_VERSION))
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'ParsedResume':
+        """
+        Build a ParsedResume from the parser's dict form, tolerating the
+        missing and extra keys of older or hand-edited resumes.
+        """
+        sections = data.get('sections')
+        if not isinstance(sections, dict):
+            sections = {}
+        summary = sections.get('summary') or ''
+        return cls(
+            data.get('raw_text') or '',
+            ContactInfo.from_dict(data.get('contact_info')),
+            summary if isinstance(summary, str) else '\n'.join(str(line) for line in summary),
+            [ExperienceEntry.from_dict(entry) for entry in sections.get('experience') or () if isinstance(entry, dict)],
+            [EducationEntry.from_dict(entry) for entry in sections.get('education') or () if isinstance(entry, dict)],
+            *(list(sections.get(key) or ()) for key in LINE_SECTIONS),
+            timeline=data.get('timeline'),
+            extra=_extra(data, _TOP_LEVEL_KEYS),
+            section_extra=_extra(sections, _SECTION_KEYS),
+        )
+
+    def copy(self) -> 'ParsedResume':
+        """A deep copy, made without going through the dict form."""
+        return ParsedResume._from_tuple(marshal.loads(marshal.dumps(self._to_tuple(), _MARSHAL_VERSION)))
+
+    def to_bytes(self) -> bytes:
+        """Serialize to the compact binary form."""
+        return _MAGIC + bytes((_FORMAT,)) + marshal.dumps(self._to_tuple(), _MARSHAL_VERSION)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'ParsedResume':
+        """
+        Load the binary form written by to_bytes.
+        
+        Raises:
+            ValueError: If ``data`` is not a ParsedResume of this format
+        """
+        if not is_serialized_resume(data):
+            raise ValueError("Not a serialized ParsedResume")
+        try:
+            return cls._from_tuple(marshal.loads(data[len(_MAGIC) + 1:]))
+        except (EOFError, TypeError) as e:
+            raise ValueError(f"Corrupt serialized ParsedResume: {str(e)}")
+
+    def _to_tuple(self) -> tuple:
+        return (
+            self.raw_text,
+            self.contact._to_tuple(),
+            self.summary,
+            [entry._to_tuple() for entry in self.experience],
+            [entry._to_tuple() for entry in self.education],
+            self.skills, self.projects, self.certifications, self.languages, self.references,
+            self.timeline,
+            self.extra,
+            self.section_extra,
+        )
+
+    @classmethod
+    def _from_tuple(cls, values: tuple) -> 'ParsedResume':
+        (
+            raw_text, contact, summary, experience, education,
+            skills, projects, certifications, languages, references,
+            timeline, extra, section_extra,
+        ) = values
+        return cls(
+            raw_text,
+            ContactInfo(*contact),
+            summary,
+            [ExperienceEntry._from_tuple(entry) for entry in experience],
+            [EducationEntry._from_tuple(entry) for entry in education],
+            skills, projects, certifications, languages, references,
+            timeline, extra, section_extra,
+        )
@@ -0,0 +1,127 @@
+"""
+PDF text extraction with optional page sharding for long documents.
+
+Short PDFs are extracted serially. PDFs with at least ``shard_threshold``
+pages are split into contiguous page ranges: the calling process extracts
+the first range while the others are extracted by a pool of shard
+processes, each opening its own copy of the same buffer; the page texts are
+then joined in page order, so the output is identical to the serial path.
+
+Each process has at most one shard pool, of ``max_workers - 1`` processes,
+started on the first long PDF and reused for every later one. A parse
+worker therefore adds a fixed number of processes rather than starting new
+ones per document, and under SupervisedExecutor they share the worker's
+process group and limits.
+"""
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
+from typing import List, Optional, Tuple
+
+from cvparser.buffers import Buffer, open_buffer
+from cvparser.errors import ParseLimitError
+
+_shard_pool: Optional[ProcessPoolExecutor] = None
+_shard_pool_lock = threading.Lock()
+
+
+def extract_page_texts(content: Buffer, start: int = 0, stop: Optional[int] = None) -> List[str]:
+    """
+    Extract the text of pages ``start`` to ``stop`` (exclusive).
+    
+    Args:
+        content: The PDF file content
+        start: Index of the first page to extract
+        stop: Index after the last page to extract, or None for the end
+        
+    Returns:
+        List with one string per page; pages without text give ""
+    """
+    import pdfplumber
+
+    with pdfplumber.open(open_buffer(content)) as pdf:
+        return [page.extract_text() or "" for page in pdf.pages[start:stop]]
+
+
+def page_ranges(page_count: int, shards: int) -> List[Tuple[int, int]]:
+    """
+    Split ``page_count`` pages into at most ``shards`` contiguous ranges of
+    near-equal size.
+    """
+    shards = max(1, min(shards, page_count))
+    size, extra = divmod(page_count, shards)
+    ranges = []
+    start = 0
+    for index in range(shards):
+        stop = start + size + (1 if index < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def get_shard_pool(workers: int) -> ProcessPoolExecutor:
+    """This process's shard pool of ``workers`` processes, created on first use."""
+    global _shard_pool
+    with _shard_pool_lock:
+        if _shard_pool is not None and _shard_pool._max_workers != workers:
+            _shard_pool.shutdown(wait=False)
+            _shard_pool = None
+        if _shard_pool is None:
+            _shard_pool = ProcessPoolExecutor(max_workers=workers)
+        return _shard_pool
+
+
+def shutdown_shard_pool() -> None:
+    """Stop this process's shard pool, if one was started."""
+    global _shard_pool
+    with _shard_pool_lock:
+        if _shard_pool is not None:
+            _shard_pool.shutdown(wait=False)
+            _shard_pool = None
+
+
+def extract_pdf_text(content: Buffer, shard_threshold: int = 0, max_workers: int = 1, max_pages: int = 0) -> str:
+    """
+    Extract the text of a PDF, sharding pages across processes when long.
+    
+    Args:
+        content: The PDF file content
+        shard_threshold: Minimum page count for sharded extraction; 0 disables it
+        max_workers: Maximum number of processes used for one document,
+            including the calling one
+        max_pages: Maximum page count; longer documents are rejected before
+            any text is extracted (0 disables)
+        
+    Returns:
+        Page texts joined with newlines, in page order
+        
+    Raises:
+        ParseLimitError: If the PDF has more than ``max_pages`` pages
+    """
+    import pdfplumber
+
+    with pdfplumber.open(open_buffer(content)) as pdf:
+        page_count = len(pdf.pages)
+        if max_pages and page_count > max_pages:
+            raise ParseLimitError(f"PDF has {page_count} pages; the limit is {max_pages}")
+        if not shard_threshold or page_count < shard_threshold or max_workers < 2:
+            return "\n".join(page.extract_text() or "" for page in pdf.pages)
+
+    # Shard workers need a picklable copy; memory-mapped uploads are not
+    payload = content if isinstance(content, bytes) else bytes(content)
+    (first_start, first_stop), *ranges = page_ranges(page_count, max_workers)
+    pool = get_shard_pool(max_workers - 1)
+    try:
+        shards = pool.map(
+            extract_page_texts,
+            repeat(payload),
+            [start for start, _ in ranges],
+            [stop for _, stop in ranges],
+        )
+        first = extract_page_texts(content, first_start, first_stop)
+        return "\n".join(first + [text for shard in shards for text in shard])
+    except BrokenProcessPool:
+        # A shard process died; start a new pool for the next document
+        shutdown_shard_pool()
+        raise
@@ -0,0 +1,358 @@
+"""
+Staged, format-agnostic resume parse pipeline.
+
+    bytes --extract--> text --normalize--> lines --segment--> sections --fields--> result
+
+Only the first stage knows about file formats. Its extractor is chosen by
+sniffing the leading bytes of the file; the file extension is consulted only
+when no signature matches, so a PDF uploaded as ``cv.docx`` is still parsed
+as a PDF. Extractors are plug-ins: registering an Extractor adds a format or
+replaces the engine of an existing one, and every later stage is shared.
+Installed packages can contribute extractors through the
+``cvparser.extractors`` entry point group (see plugin_extractors).
+
+Every stage is timed, and any stage can be cached in-process on its own. The
+extraction stage is keyed by the file bytes and the extractor; the later
+stages are pure functions of the extracted text and are keyed by it.
+"""
+import hashlib
+import importlib
+import importlib.util
+import json
+import logging
+import threading
+import time
+from functools import lru_cache, partial
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from cvparser.buffers import Buffer
+from cvparser.cache import MemoryTier
+from cvparser.errors import ParseLimitError, ResumeParseError, UnsupportedFormatError
+from cvparser.fields import parse_fields
+from cvparser.sections import SectionClassifier, default_classifier
+
+logger = logging.getLogger(__name__)
+
+STAGES = ('extract', 'normalize', 'segment', 'fields')
+
+# Longest signature any extractor may declare
+SNIFF_BYTES = 16
+
+# Entry point group through which installed packages add extractors
+PLUGIN_GROUP = 'cvparser.extractors'
+
+
+@lru_cache(maxsize=None)
+def _installed(module: str) -> bool:
+    return importlib.util.find_spec(module) is not None
+
+
+class Extractor(NamedTuple):
+    """
+    A text extractor for one file format.
+    
+    ``extract`` turns the file content into plain text with one paragraph
+    per line; ``signatures`` are the byte prefixes that identify the format
+    and ``extensions`` the file extensions used when no signature matches.
+    ``requires`` names the modules ``extract`` imports and ``extra`` the
+    package extra that installs them, so a missing optional dependency is
+    reported without importing anything.
+    """
+    name: str
+    extract: Callable[[Buffer], str]
+    signatures: Tuple[bytes, ...] = ()
+    extensions: Tuple[str, ...] = ()
+    requires: Tuple[str, ...] = ()
+    extra: Optional[str] = None
+
+    def missing(self) -> Tuple[str, ...]:
+        """Required modules that are not installed."""
+        return tuple(module for module in self.requires if not _installed(module))
+
+
+class PipelineResult(NamedTuple):
+    data: Dict[str, Any]
+    file_format: str
+    timings: Dict[str, float]
+    cache_hits: Tuple[str, ...]
+
+
+# Characters that only get in the way of line-based parsing
+_NORMALIZE = str.maketrans({
+    '\xa0': ' ',
+    '\u200b': None,
+    '\u200c': None,
+    '\u200d': None,
+    '\ufeff': None,
+    '\xad': None,
+})
+
+
+def normalize_lines(text: str) -> List[str]:
+    """
+    Split extracted text into stripped, non-empty lines.
+    
+    Non-breaking spaces become spaces, zero-width characters and soft
+    hyphens are removed and every line break convention (CRLF, form feed,
+    Unicode line separators) ends a line.
+    """
+    return [line for line in (raw.strip() for raw in text.translate(_NORMALIZE).splitlines()) if line]
+
+
+class StageMetrics:
+    """
+    Running per-stage timing totals, safe to update from several threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stages = {stage: {"count": 0, "cache_hits": 0, "total_seconds": 0.0, "max_seconds": 0.0} for stage in STAGES}
+
+    def record(self, timings: Dict[str, float], cache_hits: Iterable[str] = ()) -> None:
+        with self._lock:
+            for stage, seconds in timings.items():
+                totals = self._stages[stage]
+                totals["count"] += 1
+                totals["total_seconds"] += seconds
+                totals["max_seconds"] = max(totals["max_seconds"], seconds)
+            for stage in cache_hits:
+                self._stages[stage]["cache_hits"] += 1
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        with self._lock:
+            return {
+                stage: {
+                    **totals,
+                    "mean_ms": totals["total_seconds"] / totals["count"] * 1000 if totals["count"] else 0.0,
+                }
+                for stage, totals in self._stages.items()
+            }
+
+
+class ParsePipeline:
+    """
+    Run resume content through the extract, normalize, segment and fields
+    stages.
+    """
+
+    def __init__(
+        self,
+        extractors: Iterable[Extractor] = (),
+        classifier: SectionClassifier = default_classifier,
+        cache_items: int = 0,
+        cache_bytes: int = 16 * 1024 * 1024,
+        cached_stages: Iterable[str] = ('extract',),
+        max_text_chars: int = 0,
+    ):
+        self.extractors: Dict[str, Extractor] = {}
+        for extractor in extractors:
+            self.register(extractor)
+        self.classifier = classifier
+        self.cached_stages = frozenset(cached_stages) if cache_items else frozenset()
+        self.cache = MemoryTier(cache_items, cache_bytes) if cache_items else None
+        self.max_text_chars = max_text_chars
+        self.metrics = StageMetrics()
+
+    def register(self, extractor: Extractor) -> None:
+        """Add an extractor, replacing any registered under the same name."""
+        self.extractors[extractor.name] = extractor
+
+    def formats(self) -> Dict[str, Tuple[str, ...]]:
+        """Registered formats, each with the required modules it is missing."""
+        return {name: extractor.missing() for name, extractor in self.extractors.items()}
+
+    def sniff(self, content: Buffer) -> Optional[str]:
+        """Name of the extractor whose signature starts ``content``, if any."""
+        head = bytes(content[:SNIFF_BYTES])
+        for extractor in self.extractors.values():
+            if any(head.startswith(signature) for signature in extractor.signatures):
+                return extractor.name
+        return None
+
+    def resolve(self, content: Buffer, filename: Optional[str] = None, file_format: Optional[str] = None) -> Extractor:
+        """
+        Choose the extractor for a file.
+        
+        Args:
+            content: The file content
+            filename: Name of the file; its extension is only used when the
+                content has no known signature
+            file_format: Extractor name or extension to use regardless of
+                the content
+        
+        Returns:
+            The matching Extractor
+        
+        Raises:
+            UnsupportedFormatError: If no extractor matches
+        """
+        if file_format is None:
+            name = self.sniff(content)
+            if name is not None:
+                return self.extractors[name]
+            file_format = filename.rsplit('.', 1)[-1].lower() if filename and '.' in filename else ''
+        if file_format in self.extractors:
+            return self.extractors[file_format]
+        for extractor in self.extractors.values():
+            if file_format in extractor.extensions:
+                return extractor
+        raise UnsupportedFormatError(f"Unsupported file format: {file_format or 'unknown'}")
+
+    def run(
+        self,
+        content: Buffer,
+        filename: Optional[str] = None,
+        file_format: Optional[str] = None,
+        content_digest: Optional[str] = None,
+    ) -> PipelineResult:
+        """
+        Parse resume file content.
+        
+        Args:
+            content: The file content
+            filename: Name of the file, used only if sniffing fails
+            file_format: Extractor name or extension to force
+            content_digest: SHA-256 hex digest of ``content``, if already
+                known, for the extraction stage cache key
+        
+        Returns:
+            PipelineResult with the parsed resume dict, the format it was
+            parsed as and the time spent in each stage in seconds
+        
+        Raises:
+            UnsupportedFormatError: If no extractor matches, or the one that
+                does needs a dependency that is not installed
+            ParseLimitError: If the text is longer than ``max_text_chars``
+            ResumeParseError: If text extraction fails
+        """
+        extractor = self.resolve(content, filename, file_format)
+        missing = extractor.missing()
+        if missing:
+            hint = f"; install it with: pip install 'cvparser[{extractor.extra}]'" if extractor.extra else ""
+            raise UnsupportedFormatError(
+                f"{extractor.name.upper()} support needs {', '.join(missing)}, which is not installed{hint}"
+            )
+        timings: Dict[str, float] = {}
+        hits: List[str] = []
+
+        def stage(name: str, key: Optional[str], fn: Callable, *args):
+            started = time.perf_counter()
+            cache_key = f"{name}-{key}" if key is not None and name in self.cached_stages else None
+            cached = self.cache.get(cache_key) if cache_key is not None else None
+            if cached is not None:
+                value = json.loads(cached)
+                hits.append(name)
+            else:
+                value = fn(*args)
+                if cache_key is not None:
+                    self.cache.put(cache_key, json.dumps(value, separators=(",", ":")).encode("utf-8"))
+            timings[name] = time.perf_counter() - started
+            return value
+
+        def extract():
+            try:
+                return extractor.extract(content)
+            except ResumeParseError:
+                raise
+            except Exception as e:
+                raise ResumeParseError(f"Failed to parse {extractor.name.upper()} file: {str(e)}")
+
+        content_key = None
+        if 'extract' in self.cached_stages:
+            content_key = f"{extractor.name}-{content_digest or hashlib.sha256(content).hexdigest()}"
+        raw_text = stage('extract', content_key, extract)
+        if self.max_text_chars and len(raw_text) > self.max_text_chars:
+            raise ParseLimitError(
+                f"Resume text is {len(raw_text)} characters long; the limit is {self.max_text_chars}"
+            )
+
+        text_key = None
+        if self.cached_stages - {'extract'}:
+            text_key = hashlib.sha256(raw_text.encode('utf-8')).hexdigest()
+        lines = stage('normalize', text_key, normalize_lines, raw_text)
+        sections = stage('segment', text_key, self.classifier.split_lines, lines)
+        data = stage('fields', text_key, partial(parse_fields, raw_text, lines, sections))
+
+        self.metrics.record(timings, hits)
+        return PipelineResult(data, extractor.name, timings, tuple(hits))
+
+
+def lazy_extractor(module: str, function: str, **options: Any) -> Callable[[Buffer], str]:
+    """
+    Wrap an extraction function so its module, and the libraries it
+    imports, are only loaded when a file of that format is first parsed.
+    """
+    def extract(content: Buffer) -> str:
+        return getattr(importlib.import_module(module), function)(content, **options)
+    return extract
+
+
+def plugin_extractors() -> List[Extractor]:
+    """
+    Extractors contributed by installed packages.
+    
+    Each entry point in the ``cvparser.extractors`` group must refer to an
+    Extractor, or to a callable returning one or a list of them. Loading an
+    entry point imports only the module it names, so plugins should import
+    their extraction libraries inside ``extract``, as the built-in ones do.
+    Plugins that fail to load are logged and skipped.
+    """
+    from importlib.metadata import entry_points
+
+    extractors: List[Extractor] = []
+    for entry_point in entry_points(group=PLUGIN_GROUP):
+        try:
+            loaded = entry_point.load()
+            if not isinstance(loaded, Extractor):
+                loaded = loaded()
+            extractors.extend([loaded] if isinstance(loaded, Extractor) else loaded)
+        except Exception as e:
+            logger.warning(f"Skipping extractor plugin {entry_point.name}: {str(e)}")
+    return extractors
+
+
+def default_extractors(
+    pdf_shard_threshold: int = 0,
+    pdf_workers: int = 1,
+    pdf_max_pages: int = 0,
+    plugins: bool = True,
+) -> List[Extractor]:
+    """
+    The built-in extractors for PDF, DOCX/DOC (OOXML) and RTF, followed by
+    any installed plugins, which replace built-ins of the same name.
+    
+    Args:
+        pdf_shard_threshold: Page count from which PDFs are extracted in
+            parallel page ranges (0 disables)
+        pdf_workers: Processes used for a sharded PDF
+        pdf_max_pages: PDFs with more pages are rejected (0 disables)
+        plugins: Whether to add the extractors from plugin_extractors
+    """
+    builtin = [
+        Extractor(
+            'pdf',
+            lazy_extractor(
+                'cvparser.pdf', 'extract_pdf_text',
+                shard_threshold=pdf_shard_threshold, max_workers=pdf_workers, max_pages=pdf_max_pages,
+            ),
+            (b'%PDF-',),
+            ('pdf',),
+            ('pdfplumber',),
+            'pdf',
+        ),
+        Extractor(
+            'docx',
+            lazy_extractor('cvparser.ooxml', 'extract_docx_text'),
+            (b'PK\x03\x04',),
+            ('docx', 'doc'),
+        ),
+        Extractor(
+            'rtf',
+            lazy_extractor('cvparser.rtf', 'extract_rtf_text'),
+            (b'{\\rtf',),
+            ('rtf',),
+            ('striprtf',),
+            'rtf',
+        ),
+    ]
+    return builtin + plugin_extractors() if plugins else builtin
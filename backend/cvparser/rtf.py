@@ -0,0 +1,19 @@
+"""
+RTF text extraction.
+"""
+from striprtf.striprtf import rtf_to_text
+
+from cvparser.buffers import Buffer
+
+
+def extract_rtf_text(content: Buffer) -> str:
+    """
+    Convert RTF file content to plain text with striprtf.
+    
+    Args:
+        content: The RTF file content
+        
+    Returns:
+        The document text
+    """
+    return rtf_to_text(str(content, 'utf-8', errors='ignore'))
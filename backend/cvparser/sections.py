@@ -0,0 +1,165 @@
+"""
+Section header classification for resume text.
+
+Every known header alias is compiled into a single anchored, case-insensitive
+regular expression with one named group per section, so each line is tested
+once regardless of how many sections or aliases exist. Only header-shaped
+lines match: the alias must make up the whole line, optionally preceded by a
+bullet or number and followed by a colon (with inline content allowed after
+the colon, e.g. ``Skills: Python, SQL``) or a trailing dash. Body lines
+that merely mention a section word, such as "Talked about experience" or
+"Experience – 5 years in retail", are left alone.
+"""
+import re
+from typing import Dict, Iterable, List, Mapping, Optional, Pattern, Sequence, Tuple
+
+# Section key -> header aliases. Order of keys is the order of the parsed
+# sections dict; an alias may only belong to one section.
+SECTION_ALIASES: Dict[str, Tuple[str, ...]] = {
+    'summary': (
+        'summary', 'professional summary', 'career summary', 'executive summary',
+        'profile', 'professional profile', 'personal profile', 'personal statement',
+        'objective', 'career objective', 'about', 'about me',
+    ),
+    'experience': (
+        'experience', 'work experience', 'professional experience', 'relevant experience',
+        'employment', 'employment history', 'work history', 'career history',
+    ),
+    'education': (
+        'education', 'academic', 'academics', 'academic background', 'academic qualifications',
+        'education and training', 'qualification', 'qualifications',
+    ),
+    'skills': (
+        'skills', 'technical skills', 'key skills', 'core skills', 'skills summary',
+        'core competencies', 'competencies',
+    ),
+    'projects': (
+        'projects', 'key projects', 'personal projects', 'portfolio', 'work samples',
+    ),
+    'certifications': (
+        'certifications', 'certification', 'certificates',
+        'licenses and certifications', 'licenses & certifications',
+    ),
+    'languages': (
+        'languages', 'language skills', 'language proficiency',
+    ),
+    'references': (
+        'references', 'referees',
+    ),
+}
+
+# Longest plausible header line; anything longer is body text.
+MAX_HEADER_LENGTH = 60
+
+
+def _alias_pattern(alias: str) -> str:
+    return r'\s+'.join(re.escape(word) for word in alias.split())
+
+
+def compile_header_pattern(aliases: Mapping[str, Sequence[str]]) -> Pattern[str]:
+    """
+    Compile an alias table into one anchored header pattern.
+    
+    Args:
+        aliases: Mapping of section key to its header aliases
+        
+    Returns:
+        Compiled pattern whose ``lastgroup`` names the matched section and
+        whose ``rest`` group holds any inline content after a colon
+    """
+    seen = set()
+    groups = []
+    for section, names in aliases.items():
+        unique = []
+        for name in names:
+            key = name.lower()
+            if key in seen:
+                raise ValueError(f"Section alias '{name}' is assigned to more than one section")
+            seen.add(key)
+            unique.append(name)
+        alternatives = '|'.join(_alias_pattern(name) for name in sorted(unique, key=len, reverse=True))
+        groups.append(f'(?P<{section}>{alternatives})')
+    return re.compile(
+        r'(?:[\W\d_]{1,4}\s*)?(?:' + '|'.join(groups) + r')\s*(?::\s*(?P<rest>.*)|[\-–—])?',
+        re.IGNORECASE,
+    )
+
+
+class SectionClassifier:
+    """
+    Split resume text into sections in a single pass over its lines.
+    """
+
+    def __init__(self, aliases: Mapping[str, Sequence[str]] = SECTION_ALIASES):
+        self.sections = tuple(aliases.keys())
+        self.pattern = compile_header_pattern(aliases)
+
+    def classify(self, line: str) -> Optional[Tuple[str, str]]:
+        """
+        Classify a stripped line as a section header.
+        
+        Args:
+            line: A single line of resume text, already stripped
+            
+        Returns:
+            Tuple of (section key, inline content) if the line is a header,
+            otherwise None
+        """
+        if len(line) > MAX_HEADER_LENGTH:
+            return None
+        match = self.pattern.fullmatch(line)
+        if match is None:
+            return None
+        section = match.lastgroup
+        if section == 'rest':
+            # Inline content matched last; find which section group matched
+            section = next(key for key in self.sections if match.group(key) is not None)
+        return section, (match.group('rest') or '').strip()
+
+    def split(self, text: str) -> Dict[str, List[str]]:
+        """
+        Group the non-empty lines of ``text`` under the section headers that
+        precede them. Header lines themselves are not included; lines before
+        the first header are dropped.
+        
+        Args:
+            text: The raw text content of the resume
+            
+        Returns:
+            Dict mapping every section key to its list of lines
+        """
+        return self.split_lines(line.strip() for line in text.split('\n'))
+
+    def split_lines(self, lines: Iterable[str]) -> Dict[str, List[str]]:
+        """
+        Like split, for a stream of already stripped lines.
+        
+        Args:
+            lines: Stripped lines of resume text; empty lines are skipped
+            
+        Returns:
+            Dict mapping every section key to its list of lines
+        """
+        sections: Dict[str, List[str]] = {key: [] for key in self.sections}
+        current: Optional[List[str]] = None
+        classify = self.classify
+        for line in lines:
+            if not line:
+                continue
+            header = classify(line)
+            if header is not None:
+                section, rest = header
+                current = sections[section]
+                if rest:
+                    current.append(rest)
+            elif current is not None:
+                current.append(line)
+        return sections
+
+
+default_classifier = SectionClassifier()
+
+
+def split_sections(text: str) -> Dict[str, List[str]]:
+    """Split resume text into sections using the default alias table."""
+    return default_classifier.split(text)
@@ -0,0 +1,293 @@
+"""
+HTTP parse service.
+
+A small HTTP/1.1 server, built on the standard library only, that parses
+resume files posted to it. Files are parsed by a SupervisedExecutor: a
+fixed set of worker processes, started and loaded with the format libraries
+before the server accepts requests, with the same per-document time and
+memory limits as the backend. Endpoints:
+
+- ``POST /parse?filename=cv.pdf`` with the file as the body returns the
+  parse JSON, the detected format in ``X-Parse-Format`` and the stage
+  timings in ``Server-Timing``;
+- ``GET /metrics`` returns request, executor and stage figures as JSON;
+- ``GET /health`` returns ``{"status": "ok"}``.
+
+Connections are kept alive between requests. Bodies larger than the byte
+limit are refused with 413, and when every worker is busy and the queue is
+full the request is refused with 429 and a ``Retry-After`` header, both
+before the body is read.
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import signal
+import threading
+import time
+from functools import partial
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+from cvparser.api import get_pipeline, run_bytes
+from cvparser.errors import (
+    ParseLimitError,
+    ParseQueueFullError,
+    ParseTimeoutError,
+    ResumeParseError,
+    UnsupportedFormatError,
+)
+from cvparser.formats import ParseLimits
+from cvparser.pipeline import StageMetrics
+from cvparser.supervisor import SupervisedExecutor
+
+logger = logging.getLogger(__name__)
+
+# Modules imported by each worker before the server starts
+PRELOAD_MODULES = ('cvparser.pdf', 'pdfplumber', 'cvparser.ooxml', 'cvparser.rtf')
+
+
+def preload(limits: ParseLimits = ParseLimits()) -> None:
+    """Import the format libraries and build the pipeline in a worker."""
+    import importlib
+
+    for module in PRELOAD_MODULES:
+        try:
+            importlib.import_module(module)
+        except ImportError:
+            # The format's extra is not installed
+            pass
+    get_pipeline(limits)
+
+
+def parse_job(content: bytes, filename: Optional[str], limits: ParseLimits):
+    """Unit of work of the service's parse workers."""
+    return run_bytes(content, filename, limits)
+
+
+class ServiceMetrics:
+    """Request counters of the parse service, safe to update from several threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.started = time.time()
+        self.requests = 0
+        self.in_flight = 0
+        self.bytes_received = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+        self.statuses: Dict[int, int] = {}
+
+    def begin(self, size: int) -> None:
+        with self._lock:
+            self.in_flight += 1
+            self.bytes_received += size
+
+    def end(self, status: int, seconds: float, started: bool = True) -> None:
+        with self._lock:
+            if started:
+                self.in_flight -= 1
+            self.requests += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "uptime_seconds": round(time.time() - self.started, 3),
+                "requests": self.requests,
+                "in_flight": self.in_flight,
+                "bytes_received": self.bytes_received,
+                "mean_ms": self.total_seconds / self.requests * 1000 if self.requests else 0.0,
+                "max_ms": self.max_seconds * 1000,
+                "statuses": {str(status): count for status, count in sorted(self.statuses.items())},
+            }
+
+
+def error_response(error: Exception) -> Tuple[int, Dict[str, Any]]:
+    """HTTP status and JSON body for a parse error."""
+    if isinstance(error, ParseTimeoutError):
+        return 504, error.to_dict()
+    if isinstance(error, ParseQueueFullError):
+        return 429, {"error": "queue_full", "message": str(error)}
+    if isinstance(error, ParseLimitError):
+        return 413, {"error": "limit_exceeded", "message": str(error)}
+    if isinstance(error, UnsupportedFormatError):
+        return 415, {"error": "unsupported_format", "message": str(error)}
+    if isinstance(error, ResumeParseError):
+        return 422, {"error": "parse_failed", "message": str(error)}
+    return 500, {"error": "internal", "message": str(error)}
+
+
+class ParseRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "cvparser"
+    server: "ParseServer"
+
+    def setup(self) -> None:
+        # Idle keep-alive connections are closed after this many seconds
+        self.timeout = self.server.keep_alive
+        super().setup()
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug(f"{self.address_string()} {format % args}")
+
+    def send_json(self, status: int, body: Any, headers: Optional[Dict[str, str]] = None) -> None:
+        payload = json.dumps(body, separators=(",", ":")).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_GET(self) -> None:
+        path = urlsplit(self.path).path
+        if path == "/health":
+            self.send_json(200, {"status": "ok"})
+        elif path == "/metrics":
+            self.send_json(200, self.server.stats())
+        else:
+            self.send_json(404, {"error": "not_found", "message": f"No such endpoint: {path}"})
+
+    def do_POST(self) -> None:
+        url = urlsplit(self.path)
+        if url.path != "/parse":
+            self.close_connection = True
+            self.send_json(404, {"error": "not_found", "message": f"No such endpoint: {url.path}"})
+            return
+        length = self.headers.get("Content-Length")
+        if length is None or not length.isdigit():
+            # Without a length the body cannot be skipped to reuse the connection
+            self.close_connection = True
+            self.send_json(411, {"error": "length_required", "message": "Content-Length is required"})
+            return
+        size = int(length)
+        if size > self.server.limits.max_bytes:
+            self.close_connection = True
+            self.send_json(413, {
+                "error": "limit_exceeded",
+                "message": f"File is larger than the {self.server.limits.max_bytes} byte limit",
+            })
+            return
+
+        if self.server.executor.full:
+            # Refused before the body is read; the connection cannot be reused
+            self.close_connection = True
+            self.server.metrics.end(429, 0.0, started=False)
+            self.send_json(
+                429, {"error": "queue_full", "message": "Resume parser is busy, please retry shortly"},
+                {"Retry-After": str(self.server.retry_after)},
+            )
+            return
+
+        filename = parse_qs(url.query).get("filename", [None])[0]
+        metrics = self.server.metrics
+        metrics.begin(size)
+        started = time.perf_counter()
+        status = 500
+        try:
+            content = self.rfile.read(size)
+            try:
+                result = self.server.executor.run(
+                    parse_job, content, filename, self.server.limits,
+                    job={"filename": filename, "format": None, "sha256": hashlib.sha256(content).hexdigest()},
+                )
+            except Exception as e:
+                status, body = error_response(e)
+                headers = {"Retry-After": str(self.server.retry_after)} if status == 429 else None
+                if status == 500:
+                    logger.exception(f"Parse of {filename} failed")
+                self.send_json(status, body, headers)
+                return
+            self.server.stage_metrics.record(result.timings, result.cache_hits)
+            status = 200
+            self.send_json(200, result.data, {
+                "X-Parse-Format": result.file_format,
+                "Server-Timing": ", ".join(
+                    f"{stage};dur={seconds * 1000:.1f}" for stage, seconds in result.timings.items()
+                ),
+            })
+        finally:
+            metrics.end(status, time.perf_counter() - started)
+
+
+class ParseServer(ThreadingHTTPServer):
+    """
+    Threaded HTTP server in front of a SupervisedExecutor.
+
+    Each connection is served by a thread that blocks while its file is
+    parsed; the executor bounds how many are parsed or queued at once.
+    """
+    daemon_threads = True
+    request_queue_size = 128
+
+    def __init__(
+        self,
+        address: Tuple[str, int],
+        workers: int,
+        queue_depth: int,
+        timeout: float = 30,
+        limits: ParseLimits = ParseLimits(),
+        memory_limit_mb: int = 1024,
+        keep_alive: float = 15,
+        retry_after: int = 1,
+    ):
+        super().__init__(address, ParseRequestHandler)
+        self.limits = limits
+        self.keep_alive = keep_alive
+        self.retry_after = retry_after
+        self.executor = SupervisedExecutor(
+            max_workers=workers,
+            max_pending=queue_depth,
+            timeout=timeout,
+            memory_limit_mb=memory_limit_mb,
+            max_jobs_per_worker=1000,
+            poison_strikes=2,
+        )
+        self.metrics = ServiceMetrics()
+        self.stage_metrics = StageMetrics()
+
+    def preload(self) -> None:
+        """Start every worker process and load the format libraries in it."""
+        asyncio.run(self.executor.warm(partial(preload, self.limits)))
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "requests": self.metrics.stats(),
+            "executor": self.executor.stats(),
+            "incidents": self.executor.incidents(),
+            "stages": self.stage_metrics.stats(),
+        }
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.executor.shutdown()
+
+
+def serve(host: str, port: int, **options: Any) -> None:
+    """
+    Run the parse service until interrupted or sent SIGTERM.
+
+    Args:
+        host: Address to listen on
+        port: Port to listen on
+        **options: Passed to ParseServer
+    """
+    server = ParseServer((host, port), **options)
+    try:
+        started = time.perf_counter()
+        server.preload()
+        logger.info(
+            f"Parse service listening on {host}:{server.server_address[1]} with "
+            f"{server.executor.max_workers} workers (ready in {time.perf_counter() - started:.1f}s)"
+        )
+        signal.signal(signal.SIGTERM, lambda *_: threading.Thread(target=server.shutdown).start())
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
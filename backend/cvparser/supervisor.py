@@ -0,0 +1,368 @@
+"""
+Supervised parse execution: per-document time and memory limits.
+
+ParseExecutor runs jobs on a ProcessPoolExecutor, which cannot stop a job: a
+PDF that keeps pdfplumber busy for minutes holds its worker long after the
+caller got a timeout. SupervisedExecutor instead owns its worker processes
+and talks to each over a pipe, one job at a time, so it knows which worker
+runs which document:
+
+- a job that runs past ``timeout`` seconds has its worker, and any processes
+  the worker started for sharded PDF extraction, killed and replaced;
+- each worker runs under an address space limit of ``memory_limit_mb``, so
+  a document that needs more fails with ParseMemoryError in its own worker
+  instead of pushing the node into swap or the OOM killer;
+- workers are replaced after ``max_jobs_per_worker`` jobs, so memory
+  fragmentation from large documents does not accumulate;
+- every limit hit is logged and kept as an incident with the job's file
+  name, format and digest, and a file that has hit a limit
+  ``poison_strikes`` times is refused straight away when uploaded again.
+"""
+import asyncio
+import atexit
+import logging
+import multiprocessing
+import os
+import signal
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+from cvparser.errors import (
+    ParseLimitError,
+    ParseMemoryError,
+    ParseQueueFullError,
+    ParseTimeoutError,
+    ResumeParseError,
+)
+
+try:
+    import resource
+except ImportError:  # pragma: no cover - not available on Windows
+    resource = None
+
+logger = logging.getLogger(__name__)
+
+# Digests remembered for poison detection
+POISON_MEMORY = 1024
+
+
+def _worker_main(conn, memory_limit: int) -> None:
+    """Worker process loop: run jobs received on ``conn`` until told to stop."""
+    if hasattr(os, "setsid"):
+        # Lead a process group so that a kill also reaches any processes
+        # started for sharded PDF extraction
+        os.setsid()
+    if memory_limit and resource is not None:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_limit, memory_limit))
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            return
+        if job is None:
+            return
+        fn, args = job
+        try:
+            reply = ("ok", fn(*args))
+        except MemoryError:
+            reply = ("memory", None)
+        except Exception as e:
+            reply = ("error", e)
+        try:
+            conn.send(reply)
+        except Exception as e:
+            conn.send(("error", ResumeParseError(f"Parse result could not be returned: {str(e)}")))
+        if reply[0] == "memory":
+            # The heap may be left fragmented or in a bad state; let the
+            # supervisor start a fresh worker
+            return
+
+
+class _Worker:
+    def __init__(self, context, memory_limit: int):
+        self.conn, child_conn = context.Pipe()
+        # Not a daemon, so that it may start processes for sharded PDF
+        # extraction; the supervisor stops it at exit instead
+        self.process = context.Process(target=_worker_main, args=(child_conn, memory_limit))
+        self.process.start()
+        child_conn.close()
+        self.jobs = 0
+
+    def stop(self) -> None:
+        """Ask the worker to exit, killing it if it does not."""
+        try:
+            self.conn.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=1)
+        if self.process.is_alive():
+            self.kill()
+        self.conn.close()
+
+    def kill(self) -> None:
+        """Kill the worker and every process in its group."""
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(self.process.pid, signal.SIGKILL)
+            else:
+                self.process.kill()
+        except (ProcessLookupError, PermissionError):
+            pass
+        self.process.join(timeout=5)
+        self.conn.close()
+
+
+class SupervisedExecutor:
+    """
+    Run parse jobs in supervised worker processes with per-document
+    wall-clock and memory limits.
+
+    Has the same interface as ParseExecutor: at most ``max_workers`` jobs
+    run at once, at most ``max_pending`` more wait for a worker, and
+    anything beyond that is rejected with ParseQueueFullError. ``timeout``
+    runs from submission, so it bounds the time spent waiting for a worker
+    and parsing together.
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_pending: int,
+        timeout: float,
+        memory_limit_mb: int = 0,
+        max_jobs_per_worker: int = 0,
+        poison_strikes: int = 0,
+        incident_history: int = 100,
+    ):
+        self.max_workers = max(1, max_workers)
+        self.max_pending = max(0, max_pending)
+        self.timeout = timeout
+        self.memory_limit = memory_limit_mb * 1024 * 1024
+        self.max_jobs_per_worker = max_jobs_per_worker
+        self.poison_strikes = poison_strikes
+        self._context = multiprocessing.get_context("spawn")
+        self._lock = threading.Lock()
+        # Notified when a worker becomes idle or is retired
+        self._available = threading.Condition(self._lock)
+        self._in_flight = 0
+        self._workers: List[_Worker] = []
+        self._starting = 0
+        self._idle: List[_Worker] = []
+        self._threads: Optional[ThreadPoolExecutor] = None
+        self._incidents: Deque[Dict[str, Any]] = deque(maxlen=incident_history)
+        self._strikes: "OrderedDict[str, int]" = OrderedDict()
+        self._counts = {"timeouts": 0, "memory_limit": 0, "crashes": 0, "replaced": 0, "refused": 0}
+        atexit.register(self.shutdown, False)
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of jobs that can be running or queued."""
+        return self.max_workers + self.max_pending
+
+    @property
+    def full(self) -> bool:
+        """Whether a job submitted now would be rejected with ParseQueueFullError."""
+        with self._lock:
+            return self._in_flight >= self.capacity
+
+    def _get_threads(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._threads is None:
+                self._threads = ThreadPoolExecutor(max_workers=self.capacity, thread_name_prefix="parse-supervisor")
+            return self._threads
+
+    def _acquire(self, deadline: float) -> _Worker:
+        """Take an idle worker, or start one if below ``max_workers``."""
+        with self._available:
+            while True:
+                if self._idle:
+                    return self._idle.pop()
+                if len(self._workers) + self._starting < self.max_workers:
+                    self._starting += 1
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise ParseTimeoutError(
+                        f"No resume parser became free within {self.timeout:g} seconds", timeout=self.timeout
+                    )
+                self._available.wait(remaining)
+        try:
+            worker = _Worker(self._context, self.memory_limit)
+        except BaseException:
+            with self._available:
+                self._starting -= 1
+                self._available.notify()
+            raise
+        with self._lock:
+            self._starting -= 1
+            self._workers.append(worker)
+        return worker
+
+    def _release(self, worker: _Worker) -> None:
+        if self.max_jobs_per_worker and worker.jobs >= self.max_jobs_per_worker:
+            self._retire(worker, worker.stop)
+        else:
+            with self._available:
+                self._idle.append(worker)
+                self._available.notify()
+
+    def _retire(self, worker: _Worker, stop: Callable[[], None]) -> None:
+        """Stop a worker; a waiting job, or the next one, starts a replacement."""
+        with self._available:
+            if worker in self._workers:
+                self._workers.remove(worker)
+            self._counts["replaced"] += 1
+            self._available.notify()
+        stop()
+
+    def _record(self, kind: str, job: Dict[str, Any], elapsed: float, strike: bool = True) -> None:
+        incident = {"kind": kind, "at": time.time(), "elapsed": round(elapsed, 3), **job}
+        key = job.get("sha256")
+        with self._lock:
+            self._incidents.append(incident)
+            self._counts[kind] += 1
+            if key and strike:
+                self._strikes[key] = self._strikes.get(key, 0) + 1
+                self._strikes.move_to_end(key)
+                while len(self._strikes) > POISON_MEMORY:
+                    self._strikes.popitem(last=False)
+        logger.warning(
+            f"Parse job hit {kind.replace('_', ' ')} after {elapsed:.1f}s: "
+            f"{job.get('filename', '?')} ({job.get('format', '?')}, sha256 {key or '?'})"
+        )
+
+    def _run(self, fn: Callable[..., Any], args: tuple, job: Dict[str, Any], deadline: float) -> Any:
+        worker = self._acquire(deadline)
+        started = time.monotonic()
+        try:
+            worker.conn.send((fn, args))
+        except (OSError, ValueError):
+            self._retire(worker, worker.kill)
+            raise ResumeParseError("Resume parsing failed: worker process terminated unexpectedly")
+        worker.jobs += 1
+
+        if not worker.conn.poll(max(0.0, deadline - started)):
+            now = time.monotonic()
+            elapsed = now - (deadline - self.timeout)
+            self._retire(worker, worker.kill)
+            # A job mostly cut short by waiting for a worker is not held
+            # against its file
+            self._record("timeouts", job, now - started, strike=now - started >= self.timeout / 2)
+            raise ParseTimeoutError(
+                f"Resume parsing timed out after {self.timeout:g} seconds",
+                timeout=self.timeout, elapsed=elapsed, job=job,
+            )
+        try:
+            status, value = worker.conn.recv()
+        except (EOFError, OSError):
+            elapsed = time.monotonic() - started
+            self._retire(worker, worker.kill)
+            self._record("crashes", job, elapsed)
+            raise ResumeParseError("Resume parsing failed: worker process terminated unexpectedly")
+
+        if status == "memory":
+            self._retire(worker, worker.kill)
+            self._record("memory_limit", job, time.monotonic() - started)
+            raise ParseMemoryError(
+                f"Resume needs more than the {self.memory_limit // (1024 * 1024)} MB parse memory limit"
+            )
+        self._release(worker)
+        if status == "error":
+            raise value
+        return value
+
+    def _admit(self, job: Dict[str, Any]) -> None:
+        key = job.get("sha256")
+        with self._lock:
+            if self.poison_strikes and key and self._strikes.get(key, 0) >= self.poison_strikes:
+                self._counts["refused"] += 1
+                refused = True
+            else:
+                refused = False
+                if self._in_flight >= self.capacity:
+                    raise ParseQueueFullError(
+                        f"Resume parser is busy ({self._in_flight} jobs queued), please retry shortly"
+                    )
+                self._in_flight += 1
+        if refused:
+            raise ParseLimitError("This file repeatedly exceeded the parser's time or memory limits")
+
+    def _finish(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+
+    async def submit(self, fn: Callable[..., Any], *args: Any, job: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Run ``fn(*args)`` in a worker process and wait for its result.
+
+        ``fn`` and its arguments must be picklable, so pass module-level
+        functions and plain data. ``job`` describes the document (filename,
+        format, sha256) for incident records and timeout errors.
+
+        Raises:
+            ParseQueueFullError: If the executor is already at capacity
+            ParseTimeoutError: If the job has not finished ``timeout``
+                seconds after submission; a worker running it is replaced
+            ParseMemoryError: If the job exceeds the memory limit
+            ParseLimitError: If the file already hit a limit
+                ``poison_strikes`` times
+            ResumeParseError: If the worker process dies
+        """
+        job = job or {}
+        self._admit(job)
+        deadline = time.monotonic() + self.timeout
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_threads(), self._run, fn, args, job, deadline)
+        finally:
+            self._finish()
+
+    def run(self, fn: Callable[..., Any], *args: Any, job: Optional[Dict[str, Any]] = None) -> Any:
+        """
+        Blocking form of submit for callers that use a thread per request
+        rather than an event loop; raises the same errors.
+        """
+        job = job or {}
+        self._admit(job)
+        try:
+            return self._run(fn, args, job, time.monotonic() + self.timeout)
+        finally:
+            self._finish()
+
+    async def warm(self, fn: Callable[[], Any]) -> None:
+        """Start every worker process by running ``fn`` once per worker."""
+        await asyncio.gather(*(self.submit(fn) for _ in range(self.max_workers)))
+
+    def incidents(self) -> List[Dict[str, Any]]:
+        """The most recent limit hits, oldest first."""
+        with self._lock:
+            return list(self._incidents)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return current load and limit figures for logging and health checks."""
+        with self._lock:
+            return {
+                "workers": self.max_workers,
+                "capacity": self.capacity,
+                "in_flight": self._in_flight,
+                "alive": len(self._workers),
+                **self._counts,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker processes."""
+        atexit.unregister(self.shutdown)
+        with self._lock:
+            workers, self._workers = self._workers, []
+            threads, self._threads = self._threads, None
+            self._idle.clear()
+        for worker in workers:
+            if wait:
+                worker.stop()
+            else:
+                worker.kill()
+        if threads is not None:
+            threads.shutdown(wait=wait, cancel_futures=True)
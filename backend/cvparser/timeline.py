@@ -0,0 +1,156 @@
+"""
+Experience timeline derived from dated experience entries.
+
+Computed once at parse time and stored with the parsed resume, so that the
+optimizer and analyzers can read total tenure, career gaps and the most
+recent role instead of re-parsing date strings.
+
+A current role runs until the month the timeline was built in, its
+``as_of``. Parse results are cached and stored without expiry, so whoever
+reads one passes it through refresh_timeline(), which recomputes the
+durations of current entries and the timeline once that month has passed.
+
+Tenure and gaps are worked out on whole months. Overlapping roles are merged
+first, so concurrent jobs are not counted twice. A year-only date covers the
+whole year, so ``2018 - 2019`` counts as 24 months and imprecise dates make
+gaps shorter rather than inventing them.
+"""
+import datetime
+from typing import Any, Dict, List, Optional, Tuple
+
+from cvparser.dates import PartialDate
+
+# Shorter breaks between roles are not reported as gaps
+MIN_GAP_MONTHS = 3
+
+
+def _month_to_dict(month: int) -> Dict[str, Any]:
+    return PartialDate(month // 12, month % 12 + 1).to_dict()
+
+
+def _interval(entry: Dict[str, Any], now: int) -> Optional[Tuple[int, int]]:
+    start = PartialDate.from_dict(entry.get('start'))
+    if start is None:
+        return None
+    end = PartialDate.from_dict(entry.get('end'))
+    if entry.get('current'):
+        last = now
+    elif end is not None:
+        last = end.last_month()
+    else:
+        return None
+    first = start.first_month()
+    return (first, last) if last >= first else None
+
+
+def month_of(as_of: Optional[datetime.date] = None) -> str:
+    """The ``YYYY-MM`` month of ``as_of``, by default today."""
+    today = as_of or datetime.date.today()
+    return f"{today.year:04d}-{today.month:02d}"
+
+
+def entry_months(entry: Dict[str, Any], as_of: Optional[datetime.date] = None) -> Optional[int]:
+    """Months covered by one entry, or None if it has no complete date range."""
+    today = as_of or datetime.date.today()
+    interval = _interval(entry, today.year * 12 + today.month - 1)
+    return interval[1] - interval[0] + 1 if interval else None
+
+
+def build_timeline(experience: List[Dict[str, Any]], as_of: Optional[datetime.date] = None) -> Dict[str, Any]:
+    """
+    Summarise dated experience entries.
+    
+    Args:
+        experience: Entries from parse_experience
+        as_of: Date open-ended roles run until; defaults to today
+    
+    Returns:
+        Dict with total_months and total_years of experience (overlaps
+        merged), the gaps of at least MIN_GAP_MONTHS between roles, the
+        index and details of the most recent role, whether a role is
+        current, the earliest start, and ``order``: entry indices from the
+        most recent role to the oldest
+    """
+    today = as_of or datetime.date.today()
+    now = today.year * 12 + today.month - 1
+    dated = [(index, interval) for index, interval in (
+        (index, _interval(entry, now)) for index, entry in enumerate(experience)
+    ) if interval is not None]
+
+    merged: List[List[int]] = []
+    for _, (first, last) in sorted(dated, key=lambda item: item[1]):
+        if merged and first <= merged[-1][1] + 1:
+            merged[-1][1] = max(merged[-1][1], last)
+        else:
+            merged.append([first, last])
+    total = sum(last - first + 1 for first, last in merged)
+
+    gaps = []
+    for (_, previous_end), (next_start, _) in zip(merged, merged[1:]):
+        months = next_start - previous_end - 1
+        if months >= MIN_GAP_MONTHS:
+            gaps.append({
+                'start': _month_to_dict(previous_end + 1),
+                'end': _month_to_dict(next_start - 1),
+                'months': months,
+            })
+
+    # Most recent first: latest end, then latest start
+    order = [index for index, _ in sorted(dated, key=lambda item: (item[1][1], item[1][0]), reverse=True)]
+    most_recent = None
+    if order:
+        entry = experience[order[0]]
+        most_recent = {
+            'index': order[0],
+            'title': entry.get('title', ''),
+            'company': entry.get('company', ''),
+            'start': entry.get('start'),
+            'end': entry.get('end'),
+            'current': entry.get('current', False),
+        }
+
+    return {
+        'as_of': month_of(today),
+        'total_months': total,
+        'total_years': round(total / 12, 1),
+        'gaps': gaps,
+        'most_recent': most_recent,
+        'current': any(experience[index].get('current') for index, _ in dated),
+        'earliest_start': experience[min(dated, key=lambda item: item[1][0])[0]]['start'] if dated else None,
+        'order': order,
+    }
+
+
+def is_stale(dated: Optional[Dict[str, Any]], as_of: Optional[datetime.date] = None) -> bool:
+    """
+    Whether a timeline, or the derived data of cvparser.derived, has a
+    current role and was computed in an earlier month.
+    """
+    return bool(dated and dated.get('current') and dated.get('as_of') != month_of(as_of))
+
+
+def refresh_timeline(data: Dict[str, Any], as_of: Optional[datetime.date] = None) -> Dict[str, Any]:
+    """
+    Bring the date-dependent fields of a parsed resume up to ``as_of``.
+
+    Args:
+        data: Parsed resume in the parser's dict form
+        as_of: Date open-ended roles run until; defaults to today
+
+    Returns:
+        ``data`` itself if its timeline is up to date, otherwise a copy
+        with the ``duration_months`` of current experience and education
+        entries and the timeline computed again
+    """
+    if not is_stale(data.get('timeline'), as_of):
+        return data
+    sections = dict(data.get('sections') or {})
+    for name in ('experience', 'education'):
+        if isinstance(sections.get(name), list):
+            sections[name] = [
+                {**entry, 'duration_months': entry_months(entry, as_of)}
+                if isinstance(entry, dict) and entry.get('current') else entry
+                for entry in sections[name]
+            ]
+    experience = [entry for entry in sections.get('experience') or () if isinstance(entry, dict)]
+    return {**data, 'sections': sections, 'timeline': build_timeline(experience, as_of)}
@@ -0,0 +1,20 @@
+from app.api.v1.endpoints import career_tools
+from app.services.openai.client import OpenAIRateLimitError
+
+
+def test_rate_limited_cover_letter_upload_is_503(authorized_client, monkeypatch):
+    async def parse(upload):
+        return {"sections": {"summary": "Backend engineer"}}
+
+    async def rate_limited(**kwargs):
+        raise OpenAIRateLimitError("OpenAI is busy, try again later", retry_after=7.2)
+
+    monkeypatch.setattr(career_tools, "parse_resume_upload", parse)
+    monkeypatch.setattr(career_tools, "generate_cover_letter_with_openai", rate_limited)
+    response = authorized_client.post(
+        "/api/v1/career-tools/generate-cover-letter-upload",
+        files={"resume_file": ("resume.txt", b"Backend engineer", "text/plain")},
+        data={"job_description_text": "Python developer"},
+    )
+    assert response.status_code == 503
+    assert response.headers["retry-after"] == "8"
@@ -58,7 +58,8 @@ def test_user(db):
         is_superuser=False,
         credits=10
     )
-    user = crud_user.create(db, obj_in=user_in)
+    # The database is shared by the whole session; reuse the user of an earlier module
+    user = crud_user.get_by_email(db, email=user_in.email) or crud_user.create(db, obj_in=user_in)
     return user
 
 @pytest.fixture(scope="module")
@@ -0,0 +1,78 @@
+import importlib.metadata
+import subprocess
+import sys
+
+import docx
+import pytest
+
+from cvparser.api import build_pipeline, parse_bytes, parse_file, supported_formats
+from cvparser.errors import UnsupportedFormatError
+from cvparser.pipeline import Extractor, ParsePipeline, default_extractors
+
+TEXT_RESUME = b"Jane Doe\njane@example.com\nExperience\nEngineer - Acme\nJan 2020 - Present\n"
+
+
+def text_extractor(name="txt"):
+    return Extractor(name, lambda content: bytes(content).decode("utf-8"), (), ("txt",))
+
+
+class FakeEntryPoint:
+    def __init__(self, name, value):
+        self.name = name
+        self.value = value
+
+    def load(self):
+        if isinstance(self.value, Exception):
+            raise self.value
+        return self.value
+
+
+def test_import_is_lazy():
+    code = "import sys, cvparser; print(sorted(m for m in sys.modules if m.startswith('cvparser')))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "['cvparser']"
+
+
+def test_parse_file_docx(tmp_path):
+    document = docx.Document()
+    for line in TEXT_RESUME.decode().splitlines():
+        document.add_paragraph(line)
+    path = tmp_path / "resume.docx"
+    document.save(str(path))
+
+    result = parse_file(str(path))
+    assert result["contact_info"]["email"] == "jane@example.com"
+    assert result["sections"]["experience"][0]["current"] is True
+
+
+def test_missing_extra_names_the_extra():
+    pipeline = ParsePipeline([
+        Extractor("pdf", lambda content: "", (b"%PDF-",), ("pdf",), ("no_such_pdf_library",), "pdf"),
+    ])
+    assert supported_formats(pipeline) == {"pdf": False}
+    with pytest.raises(UnsupportedFormatError, match=r"cvparser\[pdf\]"):
+        pipeline.run(b"%PDF-1.4\n", "resume.pdf")
+
+
+def test_plugin_formats_are_parsed_by_extension():
+    pipeline = ParsePipeline(default_extractors(plugins=False) + [text_extractor()])
+    result = parse_bytes(TEXT_RESUME, "resume.txt", pipeline=pipeline)
+    assert result["contact_info"]["email"] == "jane@example.com"
+
+    # Built-in formats are still only accepted with matching content
+    with pytest.raises(UnsupportedFormatError):
+        parse_bytes(b"\xff\xd8\xff\xe0 jpeg", "resume.pdf", pipeline=pipeline)
+
+
+def test_entry_point_plugins(monkeypatch):
+    plugins = [
+        FakeEntryPoint("txt", text_extractor),
+        FakeEntryPoint("rtf", text_extractor("rtf")),
+        FakeEntryPoint("broken", ImportError("missing dependency")),
+    ]
+    monkeypatch.setattr(importlib.metadata, "entry_points", lambda group: plugins)
+
+    pipeline = build_pipeline()
+    assert set(pipeline.extractors) == {"pdf", "docx", "rtf", "txt"}
+    # A plugin replaces the built-in extractor of the same name
+    assert pipeline.extractors["rtf"].requires == ()
@@ -0,0 +1,65 @@
+import io
+import zipfile
+
+import pytest
+
+from cvparser.errors import ParseLimitError, UnsupportedFormatError
+from cvparser.formats import ParseLimits, detect_format, estimate_pdf_pages
+from cvparser.pipeline import ParsePipeline, default_extractors
+from benchmarks.corpus import make_resume_docx, make_resume_pdf, make_resume_rtf
+
+pytestmark = pytest.mark.resumes
+
+
+def make_zip(files):
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for name, data in files.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def test_formats_are_detected_from_content_not_extension():
+    assert detect_format(make_resume_pdf(1), "resume.docx") == "pdf"
+    assert detect_format(make_resume_docx(), "resume.doc") == "docx"
+    assert detect_format(make_resume_rtf(), "resume.txt") == "rtf"
+    assert detect_format(b"junk\n%PDF-1.4\n", "resume.pdf") == "pdf"
+
+
+@pytest.mark.parametrize("content, message", [
+    (b"\xff\xd8\xff\xe0" + b"\0" * 64, "JPEG image"),
+    (b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\0" * 64, "legacy binary Word document"),
+    (b"plain text resume", "Unsupported file format: pdf"),
+    (b"", "empty"),
+])
+def test_foreign_content_is_rejected(content, message):
+    with pytest.raises(UnsupportedFormatError, match=message):
+        detect_format(content, "resume.pdf")
+
+
+def test_zip_must_be_a_word_document():
+    with pytest.raises(UnsupportedFormatError, match="not a Word document"):
+        detect_format(make_zip({"photo.jpg": b"\xff\xd8\xff"}), "resume.docx")
+    with pytest.raises(UnsupportedFormatError, match="damaged"):
+        detect_format(make_resume_docx()[:-30], "resume.docx")
+
+
+def test_ceilings_are_enforced_before_extraction():
+    with pytest.raises(ParseLimitError, match="byte limit"):
+        detect_format(b"%PDF-1.4" + b"\0" * 2048, "resume.pdf", ParseLimits(max_bytes=1024))
+
+    bomb = make_zip({"word/document.xml": b"<w:document/>", "filler.bin": b"\0" * 200_000})
+    with pytest.raises(ParseLimitError, match="expands to"):
+        detect_format(bomb, "resume.docx", ParseLimits(max_uncompressed_bytes=100_000))
+
+    pdf = make_resume_pdf(5)
+    assert estimate_pdf_pages(pdf) == 5
+    with pytest.raises(ParseLimitError, match="5 pages"):
+        detect_format(pdf, "resume.pdf", ParseLimits(max_pages=3))
+
+
+def test_extractors_enforce_page_and_text_ceilings():
+    with pytest.raises(ParseLimitError, match="3 pages"):
+        ParsePipeline(default_extractors(pdf_max_pages=2)).run(make_resume_pdf(3), file_format="pdf")
+    with pytest.raises(ParseLimitError, match="characters long"):
+        ParsePipeline(default_extractors(), max_text_chars=100).run(make_resume_docx(), file_format="docx")
@@ -0,0 +1,74 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.services.openai import client as openai_client
+from app.services.openai.client import OpenAIRateLimitError
+from app.services.openai.traffic import RateLimitExceeded
+from app.services.jd_analyzer import JDAnalysisError, analyze_job_description
+from benchmarks.bench_jd_analyzer import JD_TEXT, FakeLLM, timed
+
+
+def analyze(llm, monkeypatch, mode="parallel"):
+    monkeypatch.setattr(openai_client, "get_openai_client", lambda: llm)
+    monkeypatch.setattr(settings, "LLM_CACHE_ENABLED", False)
+    monkeypatch.setattr(openai_client, "_response_cache", None)
+    return asyncio.run(analyze_job_description(JD_TEXT, mode=mode))
+
+
+def test_parallel_is_faster_than_sequential():
+    sequential = asyncio.run(timed("sequential", FakeLLM(0.2)))
+    parallel = asyncio.run(timed("parallel", FakeLLM(0.2)))
+    assert sequential >= 0.8
+    assert parallel < 0.5
+
+
+def test_failed_and_slow_fields_are_left_empty(monkeypatch):
+    monkeypatch.setattr(settings, "JD_ANALYSIS_TIMEOUT", 0.3)
+    result = analyze(FakeLLM(0.01, fail=["summaries"], slow=["responsibilities"]), monkeypatch)
+    assert result["entities"]["skills"] == ["Python", "AWS", "Kubernetes"]
+    assert result["requirements"] == ["5+ years of Python", "Kubernetes"]
+    assert result["summary"] == ""
+    assert result["responsibilities"] == []
+    assert result["errors"] == {
+        "summary": "Failed to create chat completion: fake LLM error",
+        "responsibilities": "Timed out after 0.3s",
+    }
+
+    with pytest.raises(JDAnalysisError):
+        analyze(FakeLLM(0.01, fail=["analyzer"]), monkeypatch)
+
+
+def test_single_call_mode(monkeypatch):
+    llm = FakeLLM(0.01)
+    result = analyze(llm, monkeypatch, mode="single")
+    assert llm.calls == 1
+    assert result["summary"] == "Senior backend engineer on Python services."
+    assert "errors" not in result
+
+    # A failed single call falls back to one call per field
+    llm = FakeLLM(0.01, fail=["json"])
+    result = analyze(llm, monkeypatch, mode="single")
+    assert llm.calls == 5
+    assert result["requirements"] == ["5+ years of Python", "Kubernetes"]
+
+
+def test_rate_limits_are_not_retried_as_failures(monkeypatch):
+    calls = []
+
+    async def throttled(model, tokens, call):
+        calls.append(model)
+        raise RateLimitExceeded("gpt-4 is rate limited", 7.0)
+
+    monkeypatch.setattr(openai_client, "_traffic", SimpleNamespace(run=throttled))
+    # The single call is not followed by one call per field
+    with pytest.raises(OpenAIRateLimitError) as info:
+        analyze(FakeLLM(0.01), monkeypatch, mode="single")
+    assert info.value.retry_after == 7.0
+    assert len(calls) == 1
+
+    with pytest.raises(OpenAIRateLimitError) as info:
+        analyze(FakeLLM(0.01), monkeypatch)
+    assert info.value.retry_after == 7.0
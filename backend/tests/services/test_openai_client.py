@@ -0,0 +1,104 @@
+import asyncio
+import http.server
+import threading
+import time
+
+import httpx
+import pytest
+
+from app.services.openai import client as openai_client
+from app.services.openai.client import close_openai_client, create_chat_completion, get_openai_client
+
+
+def completion(content):
+    return {
+        "id": "chatcmpl-test",
+        "object": "chat.completion",
+        "created": 0,
+        "model": "gpt-3.5-turbo",
+        "choices": [{"index": 0, "finish_reason": "stop", "message": {"role": "assistant", "content": content}}],
+    }
+
+
+@pytest.fixture
+def reset_client(monkeypatch):
+    monkeypatch.setattr(openai_client, "_client", None)
+    monkeypatch.setattr(openai_client, "_client_loop", None)
+
+
+def test_calls_share_one_client_and_run_concurrently(reset_client):
+    async def handler(request):
+        await asyncio.sleep(0.2)
+        return httpx.Response(200, json=completion("ok"))
+
+    async def run():
+        client = get_openai_client()
+        client._client._transport = httpx.MockTransport(handler)
+        started = time.perf_counter()
+        replies = await asyncio.gather(*(create_chat_completion(f"prompt {n}") for n in range(20)))
+        elapsed = time.perf_counter() - started
+        assert get_openai_client() is client
+        await close_openai_client()
+        return replies, elapsed
+
+    replies, elapsed = asyncio.run(run())
+    assert replies == ["ok"] * 20
+    # Twenty calls in flight at once take about as long as one
+    assert elapsed < 2
+
+
+def test_new_event_loop_gets_new_client(reset_client):
+    async def current():
+        return get_openai_client()
+
+    first = asyncio.run(current())
+    assert asyncio.run(current()) is not first
+
+
+@pytest.fixture
+def server():
+    closed = threading.Semaphore(0)
+
+    class Handler(http.server.BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self.send_response(200)
+            self.send_header("Content-Length", "2")
+            self.end_headers()
+            self.wfile.write(b"ok")
+
+        def finish(self):
+            super().finish()
+            closed.release()
+
+        def log_message(self, *args):
+            pass
+
+    httpd = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}/", closed
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_replaced_client_is_closed_on_its_loop(reset_client, server):
+    url, closed = server
+
+    async def connect():
+        response = await get_openai_client()._client.get(url)
+        return response.text
+
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, daemon=True)
+    thread.start()
+    assert asyncio.run_coroutine_threadsafe(connect(), loop).result(2) == "ok"
+    # A call on another loop closes the first client on the loop it was opened on
+    assert asyncio.run(connect()) == "ok"
+    assert closed.acquire(timeout=2)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
+
+    # A client whose loop has closed is dropped
+    assert asyncio.run(connect()) == "ok"
@@ -0,0 +1,115 @@
+import asyncio
+import os
+import threading
+
+import pytest
+
+from cvparser.cache import DiskTier, MemoryTier, ParseCache
+from cvparser.model import ParsedResume, is_serialized_resume
+from app.services.resume_parser import parse_resume_content
+from benchmarks.corpus import make_resume_docx
+
+pytestmark = pytest.mark.resumes
+
+RESULT = {"raw_text": "Jane Doe", "contact_info": {"email": None}, "sections": {"skills": ["Python"]}}
+
+
+def test_memory_tier_evicts_least_recently_used():
+    tier = MemoryTier(max_items=2, max_bytes=1024)
+    tier.put("a", b"1")
+    tier.put("b", b"2")
+    assert tier.get("a") == b"1"
+    tier.put("c", b"3")
+    assert tier.get("b") is None
+    assert tier.get("a") == b"1"
+    assert tier.stats()["evictions"] == 1
+
+
+def test_disk_tier_is_bounded_by_size(tmp_path):
+    tier = DiskTier(str(tmp_path), max_bytes=10)
+    tier.put("a", b"12345")
+    tier.put("b", b"12345")
+    tier.put("c", b"12345")
+    assert tier.stats()["bytes"] <= 10
+    assert tier.get("c") == b"12345"
+
+
+def test_disk_tier_evicts_below_its_limit(tmp_path):
+    tier = DiskTier(str(tmp_path), max_bytes=100)
+    for key in "abcdefghij":
+        tier.put(key, b"x" * 10)
+    assert tier.stats()["evictions"] == 0
+    # Going over the limit evicts down to the low-water mark, leaving room
+    tier.put("k", b"x" * 10)
+    assert tier.stats() == {"bytes": 90, "hits": 0, "misses": 0, "evictions": 2}
+    tier.put("l", b"x" * 10)
+    assert tier.stats()["evictions"] == 2
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_parse_cache_round_trip_and_counters(tmp_path):
+    cache = ParseCache("1", max_items=8, max_memory_bytes=4096, directory=str(tmp_path), max_disk_bytes=4096)
+    key = cache.key_for(b"file bytes", "docx")
+    assert cache.get(key) is None
+    cache.put(key, RESULT)
+
+    hit = cache.get(key)
+    assert hit == RESULT
+    hit["sections"]["skills"].append("mutated")
+    assert cache.get(key) == RESULT
+    assert cache.stats()["memory"]["hits"] == 2
+
+    # A new process sees the entry through the persistent tier
+    restarted = ParseCache("1", max_items=8, max_memory_bytes=4096, directory=str(tmp_path), max_disk_bytes=4096)
+    assert restarted.get(key) == RESULT
+    assert restarted.stats()["disk"]["hits"] == 1
+
+
+def test_async_access_does_disk_io_in_a_thread(tmp_path, monkeypatch):
+    cache = ParseCache("1", max_items=8, max_memory_bytes=4096, directory=str(tmp_path), max_disk_bytes=4096)
+    key = cache.key_for(b"file bytes", "docx")
+    threads = []
+    for name in ("get", "put"):
+        method = getattr(DiskTier, name)
+
+        def record(self, *args, method=method):
+            threads.append(threading.current_thread())
+            return method(self, *args)
+
+        monkeypatch.setattr(DiskTier, name, record)
+
+    async def run():
+        await cache.aput(key, RESULT)
+        restarted = ParseCache("1", max_items=8, max_memory_bytes=4096, directory=str(tmp_path), max_disk_bytes=4096)
+        return await restarted.aget(key)
+
+    assert asyncio.run(run()) == RESULT
+    assert len(threads) == 2
+    assert threading.main_thread() not in threads
+
+
+def test_disk_tier_needs_a_private_directory(tmp_path):
+    directory = tmp_path / "cache"
+    DiskTier(str(directory), max_bytes=10)
+    assert directory.stat().st_mode & 0o777 == 0o700
+
+    os.chmod(directory, 0o777)
+    with pytest.raises(OSError):
+        DiskTier(str(directory), max_bytes=10)
+    # The cache then keeps to memory
+    assert ParseCache("1", max_items=1, max_memory_bytes=1024, directory=str(directory)).disk is None
+
+
+def test_parse_cache_key_includes_version():
+    old = ParseCache("1", max_items=1, max_memory_bytes=1024)
+    new = ParseCache("2", max_items=1, max_memory_bytes=1024)
+    assert old.key_for(b"same", "pdf") != new.key_for(b"same", "pdf")
+
+
+def test_parser_results_are_cached_as_parsed_resumes(tmp_path):
+    result = parse_resume_content(make_resume_docx(jobs=4), "resume.docx")
+    cache = ParseCache("1", max_items=8, max_memory_bytes=1 << 20, directory=str(tmp_path), max_disk_bytes=1 << 20)
+    cache.put("key", ParsedResume.from_dict(result))
+    assert is_serialized_resume(cache.memory.get("key"))
+    assert cache.get("key") == result
+    assert cache.get("key") is not cache.get("key")
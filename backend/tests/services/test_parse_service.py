@@ -0,0 +1,104 @@
+import asyncio
+import io
+import socket
+import threading
+import time
+
+import docx
+import pytest
+
+from app.core.config import settings
+from app.services import resume_parser
+from cvparser.client import ParserClient
+from cvparser.errors import (
+    ParseLimitError,
+    ParseQueueFullError,
+    ParseServiceUnavailableError,
+    UnsupportedFormatError,
+)
+from cvparser.formats import ParseLimits
+from cvparser.server import ParseServer
+
+
+def make_docx(lines):
+    document = docx.Document()
+    for line in lines:
+        document.add_paragraph(line)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+RESUME = make_docx(["Sam Lee", "sam.lee@example.com", "Experience", "Analyst - Globex", "Mar 2019 - Present"])
+
+
+@pytest.fixture(scope="module")
+def service():
+    server = ParseServer(("127.0.0.1", 0), workers=1, queue_depth=0, limits=ParseLimits(max_bytes=64 * 1024))
+    server.preload()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    client = ParserClient(f"http://127.0.0.1:{server.server_address[1]}", pool_size=2)
+    yield server, client
+    client.close()
+    server.shutdown()
+    server.server_close()
+
+
+def test_parse_over_http(service):
+    server, client = service
+    for _ in range(2):
+        result = client.parse(RESUME, "resume.docx")
+        assert result["contact_info"]["email"] == "sam.lee@example.com"
+        assert result["sections"]["experience"][0]["current"] is True
+
+    metrics = client.metrics()
+    assert metrics["requests"]["statuses"]["200"] >= 2
+    assert metrics["stages"]["extract"]["count"] >= 2
+
+
+def test_errors_map_to_parser_exceptions(service):
+    _, client = service
+    with pytest.raises(UnsupportedFormatError):
+        client.parse(b"\xff\xd8\xff\xe0 not a resume", "resume.pdf")
+    with pytest.raises(ParseLimitError):
+        client.parse(b"%PDF-" + b"0" * 128 * 1024, "resume.pdf")
+    # The connection pool recovers from the connection closed after a 413
+    assert client.parse(RESUME, "resume.docx")["contact_info"]["email"] == "sam.lee@example.com"
+
+
+def test_busy_service_answers_429(service):
+    server, client = service
+    busy = threading.Thread(target=server.executor.run, args=(time.sleep, 1))
+    busy.start()
+    try:
+        time.sleep(0.2)
+        with pytest.raises(ParseQueueFullError):
+            client.parse(RESUME, "resume.docx")
+    finally:
+        busy.join()
+    assert client.metrics()["requests"]["statuses"]["429"] == 1
+
+
+def test_unreachable_service_is_reported_as_unavailable():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    client = ParserClient(f"http://127.0.0.1:{port}", pool_size=1)
+    with pytest.raises(ParseServiceUnavailableError):
+        client.parse(RESUME, "resume.docx")
+
+
+def test_backend_uses_configured_service(service, monkeypatch):
+    server, _ = service
+    monkeypatch.setattr(settings, "PARSE_SERVICE_URL", f"http://127.0.0.1:{server.server_address[1]}")
+    monkeypatch.setattr(settings, "PARSE_CACHE_ENABLED", False)
+    monkeypatch.setattr(resume_parser, "_parse_cache", None)
+    monkeypatch.setattr(resume_parser, "_parse_service", None)
+    before = server.metrics.stats()["requests"]
+    try:
+        result = asyncio.run(resume_parser.parse_resume_file(RESUME, "resume.docx"))
+    finally:
+        resume_parser.shutdown_parse_executor()
+    assert result["contact_info"]["email"] == "sam.lee@example.com"
+    assert server.metrics.stats()["requests"] == before + 1
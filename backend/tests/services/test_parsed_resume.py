@@ -0,0 +1,68 @@
+import pytest
+
+from cvparser.dates import PartialDate
+from cvparser.model import ExperienceEntry, ParsedResume
+from app.services.resume_parser import parse_resume_content
+from benchmarks.corpus import make_resume_docx
+
+pytestmark = pytest.mark.resumes
+
+
+@pytest.fixture(scope="module")
+def parsed():
+    return parse_resume_content(make_resume_docx(jobs=5), "resume.docx")
+
+
+def test_round_trips_parser_output(parsed):
+    resume = ParsedResume.from_dict(parsed)
+    assert resume.to_dict() == parsed
+    assert ParsedResume.from_bytes(resume.to_bytes()).to_dict() == parsed
+    assert isinstance(resume.experience[0], ExperienceEntry)
+    assert isinstance(resume.experience[0].start, PartialDate)
+    assert not hasattr(resume.experience[0], "__dict__")
+
+
+def test_keeps_unknown_keys_of_edited_resumes():
+    data = {
+        "contact_info": {"email": "jane@example.com", "name": "Jane Doe"},
+        "sections": {
+            "summary": "Engineer",
+            "experience": [{"title": "Engineer", "company": "Acme", "highlights": ["Python"]}],
+            "skills_summary": "Python and SQL",
+        },
+        "notes": "rewritten",
+    }
+    resume = ParsedResume.from_dict(data)
+    assert resume.contact.get("name") == "Jane Doe"
+    assert resume.most_recent.title == "Engineer"
+    result = ParsedResume.from_bytes(resume.to_bytes()).to_dict()
+    assert result["notes"] == "rewritten"
+    assert result["sections"]["skills_summary"] == "Python and SQL"
+    assert result["sections"]["experience"][0]["highlights"] == ["Python"]
+    assert result["contact_info"]["name"] == "Jane Doe"
+
+
+def test_accepts_a_missing_summary():
+    resume = ParsedResume.from_dict({"raw_text": None, "sections": {"summary": None, "skills": ["Python"]}})
+    assert resume.summary == ""
+    assert resume.raw_text == ""
+    assert resume.skills == ["Python"]
+
+
+def test_accepts_contact_info_that_is_not_a_dict():
+    for contact_info in (None, "jane@example.com", ["jane@example.com"]):
+        resume = ParsedResume.from_dict({"contact_info": contact_info, "sections": {}})
+        assert resume.contact.email is None
+
+
+def test_copy_is_independent(parsed):
+    resume = ParsedResume.from_dict(parsed)
+    duplicate = resume.copy()
+    duplicate.experience[0].description.append("changed")
+    duplicate.skills.append("changed")
+    assert resume.to_dict() == parsed
+
+
+def test_rejects_foreign_bytes():
+    with pytest.raises(ValueError):
+        ParsedResume.from_bytes(b'{"raw_text": ""}')
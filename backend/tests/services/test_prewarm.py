@@ -0,0 +1,34 @@
+import os
+import subprocess
+import sys
+
+from app.services.openai import client as openai_client
+from app.services.prewarm import warm_api
+from benchmarks.bench_startup import LAZY_MODULES, check_budgets, measure
+
+
+def test_app_import_leaves_heavy_dependencies_unloaded():
+    code = (
+        "import sys, app.main\n"
+        f"print('loaded:', *(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    completed = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True, text=True, check=True,
+        env={**os.environ, "ENV_FILE": "tests/.env.test"},
+    )
+    assert completed.stdout.splitlines()[-1] == "loaded:"
+
+
+def test_startup_benchmark_flags_eager_imports():
+    records = measure("cvparser.pdf", 1)
+    assert "cvparser.pdf" in records
+    assert check_budgets(records, "cvparser.pdf", 0, {}, ["pdfplumber"]) == []
+    assert check_budgets(records, "cvparser.pdf", 0, {}, ["re"])
+
+
+def test_warm_api_creates_clients():
+    timings = warm_api()
+    assert "openai" in timings
+    assert "openai" in sys.modules
+    assert openai_client._client is not None
@@ -0,0 +1,113 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+from app.core.config import settings
+from app.services.openai import client as openai_client
+from app.services.openai.client import create_chat_completion, create_json_chat_completion, get_response_cache_stats
+from app.services.openai.response_cache import ResponseCache, completion_key
+from benchmarks.bench_jd_analyzer import FakeLLM
+
+
+@pytest.fixture
+def cached_llm(monkeypatch, tmp_path):
+    llm = FakeLLM(0)
+    monkeypatch.setattr(openai_client, "get_openai_client", lambda: llm)
+    monkeypatch.setattr(settings, "LLM_CACHE_ENABLED", True)
+    monkeypatch.setattr(settings, "LLM_CACHE_PATH", str(tmp_path / "llm.sqlite3"))
+    monkeypatch.setattr(openai_client, "_response_cache", None)
+    yield llm
+    openai_client._response_cache.close()
+
+
+def test_identical_calls_hit_the_cache(cached_llm):
+    async def run():
+        first = await create_chat_completion("Skills of this JD?", "You extract skills.", temperature=0.2)
+        second = await create_chat_completion("Skills of this JD?", "You extract skills.", temperature=0.2)
+        await create_chat_completion("Skills of this JD?", "You extract skills.", temperature=0.2, max_tokens=50)
+        # Creative calls are never cached
+        await create_chat_completion("Write a cover letter", temperature=0.7)
+        await create_chat_completion("Write a cover letter", temperature=0.7)
+        return first, second
+
+    first, second = asyncio.run(run())
+    assert first == second
+    assert cached_llm.calls == 4
+    stats = get_response_cache_stats()
+    assert (stats["hits"], stats["lookups"], stats["bypassed"]) == (1, 3, 2)
+    assert stats["hit_rate"] == pytest.approx(1 / 3)
+
+
+class ScriptedLLM:
+    """Answers chat completions with the given (content, finish_reason) replies in turn."""
+
+    def __init__(self, replies):
+        self.replies = list(replies)
+        self.calls = 0
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self.create))
+
+    async def create(self, **kwargs):
+        content, finish_reason = self.replies[self.calls]
+        self.calls += 1
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=content), finish_reason=finish_reason)]
+        )
+
+
+def test_only_usable_responses_are_cached(cached_llm, monkeypatch):
+    llm = ScriptedLLM([
+        ("Sure, here it is", "stop"),
+        ('{"skills": []}', "stop"),
+        ('{"skills": ["Go"]}', "stop"),
+        ('{"skills": ["Go", "Py', "length"),
+        ('{"skills": ["Go", "Python"]}', "stop"),
+    ])
+    monkeypatch.setattr(openai_client, "get_openai_client", lambda: llm)
+
+    async def run():
+        # Neither the malformed reply nor the retry's prompt is served again
+        assert await create_json_chat_completion("Skills?") == '{"skills": []}'
+        assert await create_json_chat_completion("Skills?") == '{"skills": ["Go"]}'
+        assert await create_json_chat_completion("Skills?") == '{"skills": ["Go"]}'
+        assert llm.calls == 3
+        # A reply cut off at max_tokens is not cached
+        assert await create_chat_completion("List skills", max_tokens=5) == '{"skills": ["Go", "Py'
+        assert await create_chat_completion("List skills", max_tokens=5) == '{"skills": ["Go", "Python"]}'
+        assert llm.calls == 5
+
+    asyncio.run(run())
+
+
+def test_persistent_tier_survives_restart_and_expires(tmp_path, monkeypatch):
+    path = str(tmp_path / "llm.sqlite3")
+    key = completion_key("gpt-4", "system", "prompt", 0.2, 1000)
+    cache = ResponseCache(ttl=60, max_items=8, max_memory_chars=1000, path=path, max_disk_bytes=1000)
+    asyncio.run(cache.put(key, "gpt-4", "answer"))
+    cache.close()
+
+    cache = ResponseCache(ttl=60, max_items=8, max_memory_chars=1000, path=path, max_disk_bytes=1000)
+    assert asyncio.run(cache.get(key)) == "answer"
+    assert cache.stats()["disk"]["hits"] == 1
+
+    clock = [0.0]
+    monkeypatch.setattr("app.services.openai.response_cache.time.time", lambda: clock[0])
+    asyncio.run(cache.put(key, "gpt-4", "answer"))
+    clock[0] = 61.0
+    assert asyncio.run(cache.get(key)) is None
+    assert cache.stats()["memory"]["expired"] == 1
+    assert cache.stats()["disk"]["expired"] == 1
+    cache.close()
+
+
+def test_disk_tier_evicts_least_recently_used(tmp_path):
+    cache = ResponseCache(ttl=60, max_items=1, max_memory_chars=1000, path=str(tmp_path / "llm.sqlite3"), max_disk_bytes=250)
+
+    async def run():
+        for n in range(5):
+            await cache.put(f"key{n}", "gpt-4", str(n) * 100)
+        return [await cache.get(f"key{n}") is not None for n in range(5)]
+
+    assert asyncio.run(run()) == [False, False, False, True, True]
+    assert cache.stats()["disk"]["evictions"] == 3
+    cache.close()
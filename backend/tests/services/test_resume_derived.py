@@ -0,0 +1,114 @@
+import copy
+import datetime
+
+from app.services.resume_parser import refresh_current_dates, refresh_derived
+from cvparser.derived import derive_sections, extract_skills, match_keywords
+from cvparser.fields import parse_education, parse_experience
+from cvparser.timeline import is_stale, refresh_timeline
+
+SECTIONS = {
+    "summary": "Backend engineer",
+    "experience": parse_experience([
+        "Jan 2020 - Present",
+        "Engineer - Acme",
+        "Built Node.js services with PostgreSQL",
+        "Mar 2016 - Dec 2019",
+        "Developer - Initech",
+        "Maintained C++ trading systems",
+    ]),
+    "education": parse_education(["BSc Computer Science", "State University, 2015"]),
+    "skills": ["Languages: Python, Go, C++", "Docker | Kubernetes; python"],
+    "projects": [],
+}
+
+
+def test_unchanged_sections_reuse_artifacts():
+    derived, recomputed = derive_sections(SECTIONS)
+    assert set(recomputed) == set(SECTIONS)
+
+    edited = copy.deepcopy(SECTIONS)
+    edited["experience"][1]["date_range"] = "Mar 2017 - Dec 2019"
+    edited["summary"] = "Senior backend engineer"
+    again, recomputed = derive_sections(edited, derived)
+    assert sorted(recomputed) == ["experience", "summary"]
+    assert again["sections"]["skills"] is derived["sections"]["skills"]
+    assert again["sections"]["experience"]["dates"][1]["start"]["year"] == 2017
+    assert again["sections"]["experience"]["hash"] != derived["sections"]["experience"]["hash"]
+
+
+def test_derived_artifacts():
+    derived, _ = derive_sections(SECTIONS)
+    sections = derived["sections"]
+    assert sections["skills"]["skills"] == ["Python", "Go", "C++", "Docker", "Kubernetes"]
+    assert sections["education"]["dates"][0]["end"]["year"] == 2015
+    assert sections["experience"]["timeline"]["most_recent"]["company"] == "Acme"
+    assert match_keywords(derived, ["node.js", "C++", "trading systems", "Rust"]) == {
+        "experience": ["node.js", "C++", "trading systems"],
+        "skills": ["C++"],
+    }
+    assert extract_skills(["- Git, git, SQL"]) == ["Git", "SQL"]
+
+
+def test_refresh_derived_writes_dates_back():
+    content = {"sections": copy.deepcopy(SECTIONS)}
+    content, derived = refresh_derived(content)
+
+    edited = copy.deepcopy(content)
+    edited["sections"]["experience"][0]["date_range"] = "Jun 2021 - Present"
+    updated, again = refresh_derived(edited, derived)
+    assert updated["sections"]["experience"][0]["start"] == {"year": 2021, "month": 6, "precision": "month"}
+    assert updated["timeline"]["most_recent"]["start"]["year"] == 2021
+    # Writing derived dates back does not make the section look edited
+    assert derive_sections(updated["sections"], again)[1] == []
+
+    assert refresh_derived({"text": "no sections"}) == ({"text": "no sections"}, None)
+
+
+def test_user_set_dates_are_kept():
+    content, derived = refresh_derived({"sections": copy.deepcopy(SECTIONS)})
+
+    # The user corrects a start date without touching the date range text
+    edited = copy.deepcopy(content)
+    edited["sections"]["experience"][1]["start"] = {"year": 2015, "month": 9, "precision": "month"}
+    updated, again = refresh_derived(edited, derived)
+    assert again["sections"]["experience"]["hash"] != derived["sections"]["experience"]["hash"]
+    assert updated["sections"]["experience"][1]["start"]["year"] == 2015
+    assert updated["sections"]["experience"][1]["duration_months"] == 52
+    assert derive_sections(updated["sections"], again)[1] == []
+
+    # A new date range text is derived from again
+    edited = copy.deepcopy(updated)
+    edited["sections"]["experience"][1]["date_range"] = "Mar 2017 - Dec 2019"
+    updated, _ = refresh_derived(edited, again)
+    assert updated["sections"]["experience"][1]["start"]["year"] == 2017
+
+
+def test_current_roles_are_brought_up_to_date():
+    content, derived = refresh_derived({"sections": copy.deepcopy(SECTIONS)})
+    months = content["timeline"]["total_months"]
+
+    # Stored a year ago: the current role has grown since
+    old = dict(derived, as_of="2000-01")
+    assert is_stale(old)
+    again, recomputed = derive_sections(SECTIONS, old)
+    assert recomputed == ["experience"]
+    assert again["as_of"] == content["timeline"]["as_of"]
+
+    a_year_later = datetime.date.today() + datetime.timedelta(days=366)
+    refreshed = refresh_timeline(content, as_of=a_year_later)
+    assert refreshed["timeline"]["total_months"] == months + 12
+    assert refreshed["sections"]["experience"][0]["duration_months"] == (
+        content["sections"]["experience"][0]["duration_months"] + 12
+    )
+    assert refresh_timeline(content) is content
+
+
+def test_stored_resumes_are_refreshed_once_stale():
+    content, derived = refresh_derived({"sections": copy.deepcopy(SECTIONS)})
+    assert refresh_current_dates(content, derived) is None
+
+    stored = dict(content, timeline=dict(content["timeline"], as_of="2000-01"))
+    refreshed, again = refresh_current_dates(stored, dict(derived, as_of="2000-01"))
+    assert again["as_of"] == content["timeline"]["as_of"]
+    assert refreshed["timeline"] == content["timeline"]
+    assert refresh_current_dates(refreshed, again) is None
@@ -0,0 +1,346 @@
+import asyncio
+import datetime
+import io
+import time
+import zipfile
+
+import docx
+import pytest
+
+from cvparser.contact import ContactExtractor, find_contact_candidates
+from cvparser.dates import find_date_range
+from cvparser.executor import ParseExecutor
+from cvparser.fields import parse_education, parse_experience
+from cvparser.pipeline import STAGES, Extractor, ParsePipeline, default_extractors
+from cvparser.ooxml import extract_docx_text, iter_paragraphs
+from cvparser import pdf
+from cvparser.pdf import extract_pdf_text
+from cvparser.timeline import build_timeline
+from app.services.resume_parser import (
+    extract_contact_info,
+    extract_sections,
+    parse_resume,
+    parse_resume_content,
+    parse_resume_file,
+    shutdown_parse_executor,
+    ResumeParseError,
+    ParseQueueFullError,
+    ParseTimeoutError,
+)
+from benchmarks.corpus import make_resume_pdf
+
+pytestmark = pytest.mark.resumes
+
+
+def make_docx(paragraphs):
+    document = docx.Document()
+    for text in paragraphs:
+        document.add_paragraph(text)
+    buffer = io.BytesIO()
+    document.save(buffer)
+    return buffer.getvalue()
+
+
+SAMPLE_RESUME = [
+    "Jane Doe",
+    "jane.doe@example.com",
+    "(555) 123-4567",
+    "Experience",
+    "Jan 2020 - Present",
+    "Senior Engineer - Acme Corp",
+    "Built the billing platform",
+    "Education",
+    "BSc Computer Science",
+    "State University, 2015",
+    "Skills",
+    "Python, SQL",
+]
+
+
+@pytest.fixture(scope="module", autouse=True)
+def parse_workers():
+    yield
+    shutdown_parse_executor()
+
+
+def test_parse_resume_file_docx():
+    result = asyncio.run(parse_resume_file(make_docx(SAMPLE_RESUME), "resume.docx"))
+    assert result["contact_info"]["email"] == "jane.doe@example.com"
+    assert result["sections"]["experience"][0]["title"] == "Senior Engineer"
+    assert result["sections"]["experience"][0]["company"] == "Acme Corp"
+    assert result["sections"]["experience"][0]["current"] is True
+    assert result["timeline"]["most_recent"]["title"] == "Senior Engineer"
+
+
+def test_parse_resume_file_unsupported_format():
+    with pytest.raises(ResumeParseError):
+        asyncio.run(parse_resume_file(b"plain text", "resume.txt"))
+
+
+def test_executor_rejects_when_full():
+    executor = ParseExecutor(max_workers=1, max_pending=0, timeout=10)
+
+    async def run():
+        slow = asyncio.ensure_future(executor.submit(time.sleep, 0.5))
+        await asyncio.sleep(0)
+        with pytest.raises(ParseQueueFullError):
+            await executor.submit(time.sleep, 0)
+        await slow
+
+    try:
+        asyncio.run(run())
+    finally:
+        executor.shutdown()
+
+
+def test_executor_times_out():
+    executor = ParseExecutor(max_workers=1, max_pending=0, timeout=0.2)
+    try:
+        with pytest.raises(ParseTimeoutError):
+            asyncio.run(executor.submit(time.sleep, 1))
+    finally:
+        executor.shutdown()
+
+
+def test_extract_sections_only_matches_header_lines():
+    text = "\n".join([
+        "Summary",
+        "Talked about experience with customers",
+        "Experience – 5 years in retail",
+        "Work Experience:",
+        "Jan 2020 - Present",
+        "Education —",
+        "BSc Physics",
+        "Skills: Python, SQL",
+    ])
+    sections = extract_sections(text)
+    assert sections["summary"] == ["Talked about experience with customers", "Experience – 5 years in retail"]
+    assert sections["experience"] == ["Jan 2020 - Present"]
+    assert sections["education"] == ["BSc Physics"]
+    assert sections["skills"] == ["Python, SQL"]
+
+
+def test_extract_contact_info_avoids_false_websites():
+    text = "\n".join([
+        "Jane Doe",
+        "jane.doe@example.com | (555) 010-1234 | London, UK",
+        "linkedin.com/in/Jane-Doe",
+        "Summary",
+        "Built services in Node.js between 2019 - 2021, e.g. the billing API.",
+    ])
+    assert extract_contact_info(text) == {
+        "email": "jane.doe@example.com",
+        "phone": "(555) 010-1234",
+        "location": "London, UK",
+        "linkedin": "linkedin.com/in/jane-doe",
+        "website": None,
+    }
+
+
+def test_extract_contact_info_keeps_phone_and_linkedin_on_their_line():
+    assert extract_contact_info("Jane Doe\n(555) 123-4567\n2015\nBSc")["phone"] == "(555) 123-4567"
+    assert extract_contact_info("Jane Doe\n+44 7700 900123\n2015 - 2019 BSc")["phone"] == "+44 7700 900123"
+    contact = extract_contact_info("John Doe\nLinkedIn: linkedin.com/in/johndoe\nSummary")
+    assert contact["linkedin"] == "linkedin.com/in/johndoe"
+    assert extract_contact_info("LinkedIn: johndoe")["linkedin"] == "linkedin: johndoe"
+
+
+def test_contact_scan_falls_back_to_full_text_only_when_needed():
+    extractor = ContactExtractor(header_lines=2)
+    body = "\n".join(["Experience"] * 10 + ["Portfolio: https://janedoe.dev"])
+
+    scan = extractor.scan("Jane Doe\njane@example.com | +44 7700 900123 | linkedin: janedoe\n" + body)
+    assert not scan.full_scan
+    assert scan.fields["website"] is None
+
+    scan = extractor.scan("Jane Doe\nLocation: Leeds\n" + body + "\njane@example.com")
+    assert scan.full_scan
+    assert scan.fields["email"] == "jane@example.com"
+    assert scan.fields["website"] == "https://janedoe.dev"
+    assert scan.fields["location"] == "Leeds"
+
+
+def test_find_contact_candidates_reports_positions():
+    text = "Jane Doe\nj@example.com, www.janedoe.com\nRef: ref@example.org"
+    candidates = find_contact_candidates(text)
+    assert [(c.field, c.value) for c in candidates] == [
+        ("email", "j@example.com"),
+        ("website", "www.janedoe.com"),
+        ("email", "ref@example.org"),
+    ]
+    for candidate in candidates:
+        assert text[candidate.start:candidate.end] == candidate.value
+
+
+@pytest.mark.parametrize("line, start, end, current", [
+    ("Jan 2019 - Present", (2019, 1), None, True),
+    ("Acme | 03/2015 – 12/2018", (2015, 3), (2018, 12), False),
+    ("Sept. 2010 to June 2011", (2010, 9), (2011, 6), False),
+    ("2019-03 — 2020-01", (2019, 3), (2020, 1), False),
+    ("Beta Ltd (2012 - 2014)", (2012, None), (2014, None), False),
+    ("Currently 2021 – now", (2021, None), None, True),
+])
+def test_date_ranges_are_normalized(line, start, end, current):
+    date = find_date_range(line)
+    assert tuple(date.start) == start
+    assert (tuple(date.end) if date.end else None) == end
+    assert date.current is current
+
+
+def test_year_ranges_inside_sentences_do_not_start_roles():
+    assert find_date_range("Grew revenue 2019-2021 across three regions") is None
+    experience = parse_experience([
+        "Jan 2020 - Present", "Engineer - Acme", "Grew revenue 2019-2021 across three regions",
+    ])
+    assert len(experience) == 1
+    assert experience[0]["description"] == ["Grew revenue 2019-2021 across three regions"]
+
+
+def test_timeline_merges_overlaps_and_reports_gaps():
+    experience = parse_experience([
+        "Jun 2022 - Present", "Lead - Acme",
+        "Jan 2018 - Dec 2020", "Engineer - Beta",
+        "2019 - 2020", "Mentor - Gamma",
+    ])
+    assert [entry["duration_months"] for entry in experience][1:] == [36, 24]
+    timeline = build_timeline(experience, as_of=datetime.date(2024, 5, 1))
+    assert timeline["total_months"] == 36 + 24
+    assert timeline["gaps"] == [{
+        "start": {"year": 2021, "month": 1, "precision": "month"},
+        "end": {"year": 2022, "month": 5, "precision": "month"},
+        "months": 17,
+    }]
+    assert timeline["most_recent"]["title"] == "Lead"
+    assert timeline["current"] is True
+    assert timeline["earliest_start"] == {"year": 2018, "month": 1, "precision": "month"}
+    assert timeline["order"] == [0, 2, 1]
+
+
+def test_education_dates_are_normalized():
+    education = parse_education(["BSc Computer Science", "State University, 2015", "MSc AI", "Sep 2015 - Sep 2016"])
+    assert education[0]["end"] == {"year": 2015, "month": None, "precision": "year"}
+    assert education[0]["start"] is None
+    assert education[1]["start"]["month"] == 9
+
+
+def test_pipeline_sniffs_format_from_content():
+    pdf = make_resume_pdf(1)
+    result = ParsePipeline(default_extractors()).run(pdf, "resume.docx")
+    assert result.file_format == "pdf"
+    assert parse_resume_content(pdf, "resume.docx") == parse_resume_content(pdf, "resume.pdf")
+
+
+def test_pipeline_accepts_extractor_plugins():
+    pipeline = ParsePipeline(default_extractors())
+    with pytest.raises(ResumeParseError):
+        pipeline.run(b"Jane Doe", "resume.txt")
+
+    pipeline.register(Extractor("txt", lambda content: bytes(content).decode("utf-8"), extensions=("txt",)))
+    result = pipeline.run("\n".join(SAMPLE_RESUME).encode("utf-8"), "resume.txt")
+    assert result.file_format == "txt"
+    assert result.data["contact_info"]["email"] == "jane.doe@example.com"
+    assert result.data["sections"]["experience"][0]["company"] == "Acme Corp"
+
+
+def test_pipeline_times_and_caches_stages():
+    pipeline = ParsePipeline(default_extractors(), cache_items=8, cached_stages=["extract", "segment"])
+    content = make_docx(SAMPLE_RESUME)
+
+    first = pipeline.run(content, "resume.docx")
+    second = pipeline.run(content, "resume.docx")
+    assert set(first.timings) == set(STAGES)
+    assert first.cache_hits == ()
+    assert second.cache_hits == ("extract", "segment")
+    assert second.data == first.data
+    assert pipeline.metrics.stats()["extract"]["count"] == 2
+
+
+def test_sharded_pdf_extraction_matches_serial():
+    content = make_resume_pdf(pages=3)
+    serial = extract_pdf_text(content)
+    assert "Experience" in serial
+    assert extract_pdf_text(content, shard_threshold=2, max_workers=3) == serial
+
+    # Later documents reuse the same bounded pool
+    pool = pdf.get_shard_pool(2)
+    assert extract_pdf_text(content, shard_threshold=2, max_workers=3) == serial
+    assert pdf.get_shard_pool(2) is pool
+    assert len(pool._processes) <= 2
+    pdf.shutdown_shard_pool()
+
+
+def test_docx_text_extracted_in_memory():
+    content = make_docx(SAMPLE_RESUME)
+    expected = "\n".join(SAMPLE_RESUME)
+    assert extract_docx_text(content) == expected
+    assert extract_docx_text(memoryview(bytearray(content))) == expected
+
+
+def test_doc_named_ooxml_file_parses():
+    result = asyncio.run(parse_resume_file(make_docx(SAMPLE_RESUME), "resume.doc"))
+    assert result["sections"]["skills"] == ["Python, SQL"]
+
+
+def test_binary_doc_is_rejected():
+    with pytest.raises(ResumeParseError):
+        extract_docx_text(b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + b"\0" * 512)
+
+
+def test_docx_extraction_covers_headers_tables_and_text_boxes():
+    body = (
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main" '
+        'xmlns:mc="http://schemas.openxmlformats.org/markup-compatibility/2006"><w:body>'
+        '<w:p><w:r><w:t>Jane Doe</w:t></w:r>'
+        '<w:r><mc:AlternateContent><mc:Choice><w:txbxContent><w:p><w:r><w:t>jane@example.com</w:t></w:r></w:p>'
+        '</w:txbxContent></mc:Choice><mc:Fallback><w:txbxContent><w:p><w:r><w:t>jane@example.com</w:t></w:r></w:p>'
+        '</w:txbxContent></mc:Fallback></mc:AlternateContent></w:r></w:p>'
+        '<w:tbl><w:tr><w:tc><w:p><w:r><w:t>Skills</w:t></w:r></w:p></w:tc>'
+        '<w:tc><w:p><w:r><w:t>Python</w:t><w:tab/><w:t>SQL</w:t></w:r></w:p></w:tc></w:tr></w:tbl>'
+        '</w:body></w:document>'
+    )
+    header = (
+        '<w:hdr xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main">'
+        '<w:p><w:r><w:t>(555) 123-4567</w:t></w:r></w:p></w:hdr>'
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as package:
+        package.writestr("word/document.xml", body)
+        package.writestr("word/header1.xml", header)
+        package.writestr("word/header2.xml", header)
+
+    assert list(iter_paragraphs(buffer.getvalue())) == [
+        "(555) 123-4567",
+        "jane@example.com",
+        "Jane Doe",
+        "Skills",
+        "Python\tSQL",
+    ]
+
+
+def test_docx_tab_stops_are_not_tabs():
+    body = (
+        '<w:document xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"><w:body>'
+        '<w:p><w:pPr><w:tabs><w:tab w:val="right" w:pos="9000"/><w:tab w:val="left" w:pos="4500"/></w:tabs></w:pPr>'
+        '<w:r><w:t>Experience</w:t></w:r></w:p>'
+        '<w:p><w:pPr><w:tabs><w:tab w:val="right" w:pos="9000"/></w:tabs></w:pPr>'
+        '<w:r><w:t>Engineer - Acme</w:t><w:tab/><w:t>2020 - Present</w:t></w:r></w:p>'
+        '</w:body></w:document>'
+    )
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w") as package:
+        package.writestr("word/document.xml", body)
+
+    assert list(iter_paragraphs(buffer.getvalue())) == ["Experience", "Engineer - Acme\t2020 - Present"]
+
+
+def test_parse_resume_runs_without_an_event_loop(tmp_path, monkeypatch):
+    def no_new_loop():
+        raise AssertionError("parse_resume must not create an event loop")
+
+    monkeypatch.setattr(asyncio, "new_event_loop", no_new_loop)
+    path = tmp_path / "resume.docx"
+    path.write_bytes(make_docx(SAMPLE_RESUME + ["Certifications", "Sync path"]))
+
+    result = parse_resume(str(path))
+
+    assert result["sections"]["certifications"] == ["Sync path"]
@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from app.core.config import settings
+from app.services.openai import client as openai_client
+from app.services.openai.client import create_chat_completion
+from app.services.openai.singleflight import SingleFlight
+from benchmarks.bench_jd_analyzer import FakeLLM
+
+
+def test_identical_concurrent_completions_share_one_call(monkeypatch):
+    llm = FakeLLM(0.1)
+    monkeypatch.setattr(openai_client, "get_openai_client", lambda: llm)
+    monkeypatch.setattr(settings, "LLM_CACHE_ENABLED", False)
+    monkeypatch.setattr(openai_client, "_response_cache", None)
+    monkeypatch.setattr(openai_client, "_in_flight", SingleFlight())
+
+    async def run():
+        same = [create_chat_completion("Extract skills", "You extract skills.") for _ in range(10)]
+        other = create_chat_completion("Extract skills", "You extract skills.", max_tokens=10)
+        return await asyncio.gather(*same, other)
+
+    replies = asyncio.run(run())
+    assert len(set(replies)) == 1
+    assert llm.calls == 2
+    assert openai_client.get_coalescing_stats() == {"in_flight": 0, "calls": 2, "coalesced": 9, "abandoned": 0}
+
+
+def test_cancelled_caller_does_not_cancel_the_shared_call():
+    flight = SingleFlight()
+    started = []
+
+    async def work():
+        started.append(1)
+        await asyncio.sleep(0.1)
+        return "done"
+
+    async def run():
+        first = asyncio.create_task(flight.do("key", work))
+        second = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0.01)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        assert await second == "done"
+
+        # Once every caller is gone the call itself is cancelled
+        third = asyncio.create_task(flight.do("key", work))
+        await asyncio.sleep(0.01)
+        third.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await third
+        await asyncio.sleep(0)
+
+    asyncio.run(run())
+    assert started == [1, 1]
+    assert flight.stats() == {"in_flight": 0, "calls": 2, "coalesced": 1, "abandoned": 1}
+
+
+def test_errors_reach_every_caller():
+    flight = SingleFlight()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise ValueError("upstream failed")
+
+    async def run():
+        return await asyncio.gather(*(flight.do("key", fail) for _ in range(3)), return_exceptions=True)
+
+    results = asyncio.run(run())
+    assert all(isinstance(result, ValueError) for result in results)
+    assert flight.stats()["calls"] == 1
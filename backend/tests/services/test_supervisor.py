@@ -0,0 +1,102 @@
+import asyncio
+import time
+
+import pytest
+
+from cvparser.errors import (
+    ParseLimitError,
+    ParseMemoryError,
+    ParseQueueFullError,
+    ParseTimeoutError,
+)
+from cvparser.supervisor import SupervisedExecutor
+
+JOB = {"filename": "slow.pdf", "format": "pdf", "sha256": "ab" * 32}
+
+
+@pytest.fixture
+def executor():
+    executor = SupervisedExecutor(max_workers=1, max_pending=0, timeout=1, memory_limit_mb=512, poison_strikes=2)
+    yield executor
+    executor.shutdown()
+
+
+def test_stuck_worker_is_replaced(executor):
+    async def run():
+        with pytest.raises(ParseTimeoutError) as info:
+            await executor.submit(time.sleep, 30, job=JOB)
+        # The replacement worker takes the next job
+        assert await executor.submit(abs, -3) == 3
+        return info.value
+
+    started = time.monotonic()
+    error = asyncio.run(run())
+    assert time.monotonic() - started < 15
+    details = error.to_dict()
+    assert details["error"] == "parse_timeout"
+    assert details["filename"] == "slow.pdf"
+    assert details["elapsed"] >= 1
+    stats = executor.stats()
+    assert stats["timeouts"] == 1
+    assert stats["replaced"] == 1
+    assert executor.incidents()[0]["sha256"] == JOB["sha256"]
+
+
+def test_memory_limit_fails_only_the_job(executor):
+    async def run():
+        with pytest.raises(ParseMemoryError):
+            await executor.submit(bytearray, 2 * 1024 ** 3)
+        return await executor.submit(len, "four")
+
+    assert asyncio.run(run()) == 4
+    assert executor.stats()["memory_limit"] == 1
+
+
+def test_job_errors_are_raised_in_the_caller(executor):
+    with pytest.raises(ValueError):
+        asyncio.run(executor.submit(int, "not a number"))
+    assert executor.stats()["replaced"] == 0
+
+
+def test_repeat_offenders_are_refused(executor):
+    executor.timeout = 0.2
+
+    async def run():
+        for _ in range(2):
+            with pytest.raises(ParseTimeoutError):
+                await executor.submit(time.sleep, 5, job=JOB)
+        with pytest.raises(ParseLimitError):
+            await executor.submit(time.sleep, 0, job=JOB)
+
+    asyncio.run(run())
+    assert executor.stats()["refused"] == 1
+
+
+def test_rejects_when_full(executor):
+    async def run():
+        slow = asyncio.ensure_future(executor.submit(time.sleep, 0.3))
+        await asyncio.sleep(0)
+        with pytest.raises(ParseQueueFullError):
+            await executor.submit(time.sleep, 0)
+        await slow
+
+    asyncio.run(run())
+
+
+def test_queued_job_starts_a_replacement_when_a_worker_is_retired():
+    executor = SupervisedExecutor(max_workers=1, max_pending=1, timeout=10, memory_limit_mb=512)
+
+    async def run():
+        failing = asyncio.ensure_future(executor.submit(bytearray, 2 * 1024 ** 3))
+        await asyncio.sleep(0)
+        started = time.monotonic()
+        assert await executor.submit(len, "four") == 4
+        with pytest.raises(ParseMemoryError):
+            await failing
+        return time.monotonic() - started
+
+    try:
+        # Woken by the retirement instead of waiting out its deadline
+        assert asyncio.run(run()) < 5
+    finally:
+        executor.shutdown()
@@ -0,0 +1,160 @@
+import asyncio
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+from app.services.openai.traffic import (
+    AIMDLimit,
+    ConcurrencyGate,
+    ModelBudget,
+    RateLimitExceeded,
+    TrafficController,
+    parse_rate_limits,
+    retry_after,
+)
+
+
+class Throttled(Exception):
+    """Stand-in for openai.RateLimitError."""
+
+    status_code = 429
+
+    def __init__(self, after: str):
+        super().__init__("rate limited")
+        self.response = httpx.Response(429, headers={"retry-after": after})
+
+
+def controller(**kwargs):
+    options = dict(
+        rate_limits={}, default_limits=(6000, 1000000), concurrency=4, min_concurrency=1,
+        max_concurrency=8, latency_target=10.0, max_retries=2, backoff_base=0.01, backoff_max=0.02,
+    )
+    options.update(kwargs)
+    return TrafficController(**options)
+
+
+def test_parse_rate_limits_and_retry_after():
+    assert parse_rate_limits("gpt-4=500:30000, gpt-3.5-turbo=3500:160000,") == {
+        "gpt-4": (500, 30000),
+        "gpt-3.5-turbo": (3500, 160000),
+    }
+    assert retry_after(Throttled("0.05")) == 0.05
+    assert retry_after(RuntimeError()) is None
+
+
+def test_throttled_request_is_retried_after_retry_after():
+    traffic = controller()
+    attempts = []
+
+    async def call():
+        attempts.append(asyncio.get_running_loop().time())
+        if len(attempts) == 1:
+            raise Throttled("0.1")
+        return "ok"
+
+    assert asyncio.run(traffic.run("gpt-4", 10, call)) == "ok"
+    assert attempts[1] - attempts[0] >= 0.1
+    stats = traffic.stats()
+    assert stats["throttled"] == 1 and stats["retries"] == 1 and stats["succeeded"] == 1
+    # The limit was halved by the 429
+    assert stats["concurrency_limit"] == 2
+
+
+def test_retries_are_bounded():
+    traffic = controller(max_retries=1)
+    calls = []
+
+    async def throttled():
+        calls.append(1)
+        raise Throttled("0")
+
+    with pytest.raises(RateLimitExceeded):
+        asyncio.run(traffic.run("gpt-4", 10, throttled))
+    assert len(calls) == 2
+
+    async def broken():
+        calls.append(1)
+        raise ValueError("bad request")
+
+    # Errors that are not transient are not retried
+    with pytest.raises(ValueError):
+        asyncio.run(traffic.run("gpt-4", 10, broken))
+    assert len(calls) == 3
+
+
+def test_aimd_limit():
+    limit = AIMDLimit(4, 1, 5, cooldown=0)
+    # One more per window of `limit` successes, up to the maximum
+    for _ in range(5):
+        limit.on_success()
+    assert limit.value == 5
+    limit.on_congestion()
+    assert limit.value == 2
+    limit.on_congestion()
+    limit.on_congestion()
+    assert limit.value == 1
+
+
+def test_waiters_are_admitted_in_order_of_arrival():
+    async def scenario():
+        gate = ConcurrencyGate(AIMDLimit(1, 1, 1))
+        admitted = []
+
+        async def waiter(name):
+            await gate.acquire()
+            admitted.append(name)
+            gate.release()
+
+        await gate.acquire()
+        waiters = []
+        for name in ("first", "cancelled", "last"):
+            waiters.append(asyncio.create_task(waiter(name)))
+            await asyncio.sleep(0)
+        waiters[1].cancel()
+        await asyncio.sleep(0)
+        gate.release()
+        await asyncio.gather(*waiters, return_exceptions=True)
+        return admitted, gate.active
+
+    assert asyncio.run(scenario()) == (["first", "last"], 0)
+
+
+def test_token_budget_delays_requests():
+    budget = ModelBudget(6000, 600)
+    assert budget.reserve(600) == 0
+    # The next 60 tokens take 6 seconds to refill at 10 per second
+    assert budget.reserve(60) == pytest.approx(6, abs=0.1)
+
+    # The estimate is corrected from the usage reported
+    traffic = controller(default_limits=(6000, 1000))
+
+    async def call():
+        return SimpleNamespace(usage=SimpleNamespace(total_tokens=100))
+
+    asyncio.run(traffic.run("gpt-4", 900, call))
+    assert traffic.budget("gpt-4").tokens.tokens == pytest.approx(900, abs=1)
+
+
+def test_budget_waits_do_not_hold_slots():
+    traffic = controller(rate_limits={"gpt-4": (6000, 600)}, concurrency=1, min_concurrency=1)
+
+    async def call():
+        return "ok"
+
+    async def scenario():
+        assert await traffic.run("gpt-4", 600, call) == "ok"
+        # Waits about 6 seconds for the gpt-4 token budget to refill
+        waiting = asyncio.create_task(traffic.run("gpt-4", 60, call))
+        await asyncio.sleep(0.01)
+        assert traffic.stats()["in_flight"] == 0
+        # The only slot is free for other models meanwhile
+        result = await asyncio.wait_for(traffic.run("gpt-3.5-turbo", 10, call), 1)
+        waiting.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await waiting
+        return result
+
+    assert asyncio.run(scenario()) == "ok"
+    # The cancelled request's tokens were given back
+    assert traffic.budget("gpt-4").tokens.tokens == pytest.approx(0, abs=1)
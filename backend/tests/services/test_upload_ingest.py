@@ -0,0 +1,87 @@
+import asyncio
+import hashlib
+import io
+import os
+import tempfile
+
+import pytest
+from starlette.datastructures import UploadFile
+
+from cvparser.errors import ParseLimitError
+from app.services.resume_parser import parse_resume_content, parse_resume_upload
+from app.services.upload_ingest import ingest_upload
+from benchmarks.corpus import make_resume_docx
+
+pytestmark = pytest.mark.resumes
+
+
+class FakeUpload:
+    def __init__(self, content, filename="resume.docx"):
+        self.filename = filename
+        self._stream = io.BytesIO(content)
+        self.reads = 0
+
+    async def read(self, size=-1):
+        self.reads += 1
+        return self._stream.read(size)
+
+
+def test_small_upload_stays_in_memory():
+    content = b"x" * 1000
+    upload = asyncio.run(ingest_upload(FakeUpload(content), max_bytes=4096, spool_threshold=2048, chunk_size=256))
+    assert not upload.spooled
+    assert upload.size == len(content)
+    assert upload.sha256 == hashlib.sha256(content).hexdigest()
+    assert bytes(upload.source()) == content
+
+
+def test_large_upload_is_spooled_and_removed(tmp_path):
+    content = os.urandom(10_000)
+    with asyncio.run(ingest_upload(
+        FakeUpload(content), max_bytes=20_000, spool_threshold=2048, directory=str(tmp_path), chunk_size=1024
+    )) as upload:
+        assert upload.spooled
+        assert upload.path.endswith(".docx")
+        assert upload.sha256 == hashlib.sha256(content).hexdigest()
+        with upload.buffer() as view:
+            assert bytes(view) == content
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_oversized_upload_stops_reading_and_cleans_up(tmp_path):
+    reader = FakeUpload(b"x" * 100_000)
+    with pytest.raises(ParseLimitError):
+        asyncio.run(ingest_upload(reader, max_bytes=8192, spool_threshold=1024, directory=str(tmp_path), chunk_size=1024))
+    assert reader.reads == 9
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_spooled_upload_parses_like_bytes(tmp_path):
+    content = make_resume_docx()
+
+    async def run():
+        with await ingest_upload(FakeUpload(content), spool_threshold=1024, directory=str(tmp_path)) as upload:
+            assert upload.spooled
+            return await parse_resume_upload(upload)
+
+    assert asyncio.run(run()) == parse_resume_content(content, "resume.docx")
+
+
+def test_starlette_upload_is_read_from_its_file(tmp_path):
+    content = os.urandom(10_000)
+    received = tempfile.SpooledTemporaryFile(max_size=1024)
+    received.write(content)
+    received.seek(0)
+
+    with asyncio.run(ingest_upload(
+        UploadFile(received, size=len(content), filename="resume.pdf"),
+        max_bytes=20_000, spool_threshold=2048, directory=str(tmp_path), chunk_size=1024,
+    )) as upload:
+        assert upload.spooled
+        assert upload.sha256 == hashlib.sha256(content).hexdigest()
+
+    # An upload of known size over the limit is rejected without reading it
+    received.seek(0)
+    with pytest.raises(ParseLimitError):
+        asyncio.run(ingest_upload(UploadFile(received, size=len(content), filename="resume.pdf"), max_bytes=8192))
+    assert received.tell() == 0
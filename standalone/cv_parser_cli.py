@@ -1,24 +1,284 @@
 #!/usr/bin/env python3
 """
 CV Parser CLI - A standalone command-line tool for parsing resumes in multiple formats.
-This tool supports PDF, DOCX, DOC, and RTF formats.
+This tool supports PDF, DOCX, DOC, and RTF formats, using the cvparser
+library shared with the backend.
+
+A single file is parsed and printed as JSON or text. Several files,
+directories, glob patterns or ``-`` (read paths from stdin, one per line)
+switch to batch mode: files are parsed by a pool of ``--jobs`` worker
+processes and each result is written as one JSON line. ``--serve`` runs the
+parser as an HTTP service instead (see cvparser.server).
 """
 
 import os
 import sys
+import glob
 import json
+import time
+import logging
 import argparse
+from collections import deque, defaultdict
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set
+
+from cvparser import ParseLimits, build_pipeline
+
 from resume_parser import ResumeParser
 
+SUPPORTED_FORMATS = ['pdf', 'docx', 'doc', 'rtf']
+
+# Parser instance of a batch worker process, created once per process
+_worker_parser: Optional[ResumeParser] = None
+
+def _init_worker() -> None:
+    global _worker_parser
+    # Files are already parsed in parallel, so large PDFs are not sharded
+    _worker_parser = ResumeParser(pipeline=build_pipeline(pdf_workers=1))
+
+def parse_path(path: str) -> Dict[str, Any]:
+    """
+    Parse one file for batch mode, capturing failures instead of raising.
+
+    Returns:
+        Record with the path, format, size, timing and either the parse
+        result or the error message
+    """
+    global _worker_parser
+    if _worker_parser is None:
+        _init_worker()
+    file_format = path.split('.')[-1].lower() if '.' in os.path.basename(path) else ''
+    record: Dict[str, Any] = {'path': path, 'format': file_format}
+    started = time.perf_counter()
+    try:
+        record['bytes'] = os.path.getsize(path)
+        record['result'] = _worker_parser.parse_file(path)
+        record['ok'] = True
+    except Exception as e:
+        record['ok'] = False
+        record['error'] = str(e)
+    record['elapsed_ms'] = round((time.perf_counter() - started) * 1000, 3)
+    return record
+
+def _expand(item: str) -> Iterator[str]:
+    if os.path.isdir(item):
+        for root, dirs, files in os.walk(item):
+            dirs.sort()
+            for name in sorted(files):
+                if name.split('.')[-1].lower() in SUPPORTED_FORMATS:
+                    yield os.path.join(root, name)
+    elif glob.has_magic(item):
+        for path in sorted(glob.glob(item, recursive=True)):
+            if os.path.isfile(path):
+                yield path
+    else:
+        yield item
+
+def expand_inputs(inputs: Iterable[str]) -> Iterator[str]:
+    """
+    Turn command-line inputs into file paths, without duplicates.
+
+    Directories are walked recursively for supported formats, glob patterns
+    are expanded and ``-`` reads further inputs from stdin.
+    """
+    seen: Set[str] = set()
+    for item in inputs:
+        items = (line.strip() for line in sys.stdin) if item == '-' else [item]
+        for entry in items:
+            if not entry:
+                continue
+            for path in _expand(entry):
+                if path not in seen:
+                    seen.add(path)
+                    yield path
+
+def run_batch(paths: Iterable[str], jobs: int, ordered: bool) -> Iterator[Dict[str, Any]]:
+    """
+    Parse files in a process pool and yield their records.
+
+    At most ``jobs * 4`` files are in flight at once, so arbitrarily long
+    inputs are streamed rather than submitted up front.
+
+    Args:
+        paths: Files to parse
+        jobs: Number of worker processes; 1 parses in this process
+        ordered: Yield records in input order instead of completion order
+    """
+    if jobs <= 1:
+        for path in paths:
+            yield parse_path(path)
+        return
+
+    window = jobs * 4
+    paths = iter(paths)
+    with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as pool:
+        if ordered:
+            pending = deque(pool.submit(parse_path, path) for _, path in zip(range(window), paths))
+            while pending:
+                record = pending.popleft().result()
+                for path in paths:
+                    pending.append(pool.submit(parse_path, path))
+                    break
+                yield record
+        else:
+            running = {pool.submit(parse_path, path) for _, path in zip(range(window), paths)}
+            while running:
+                done, running = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    for path in paths:
+                        running.add(pool.submit(parse_path, path))
+                        break
+                    yield future.result()
+
+def load_checkpoint(path: Optional[str]) -> Set[str]:
+    """Read the set of files already parsed successfully from a checkpoint file."""
+    if not path or not os.path.exists(path):
+        return set()
+    with open(path) as f:
+        return {line.rstrip('\n') for line in f if line.strip()}
+
+def format_summary(records: List[Dict[str, Any]], wall_seconds: float, skipped: int) -> str:
+    """Build the per-format throughput and failure summary for batch mode."""
+    by_format: Dict[str, Dict[str, float]] = defaultdict(lambda: defaultdict(float))
+    failures = []
+    for record in records:
+        stats = by_format[record['format'] or '(none)']
+        stats['files'] += 1
+        stats['bytes'] += record.get('bytes', 0)
+        stats['seconds'] += record['elapsed_ms'] / 1000
+        if not record['ok']:
+            stats['failed'] += 1
+            failures.append(record)
+
+    total = len(records)
+    lines = [
+        f"Parsed {total} files ({total - len(failures)} ok, {len(failures)} failed, {skipped} skipped from checkpoint) "
+        f"in {wall_seconds:.2f}s: {total / wall_seconds if wall_seconds else 0:.1f} files/s",
+        f"{'format':<8} {'files':>7} {'failed':>7} {'MiB':>9} {'ms/file':>9} {'files/s/worker':>15}",
+    ]
+    for file_format, stats in sorted(by_format.items()):
+        per_file = stats['seconds'] / stats['files'] * 1000
+        rate = stats['files'] / stats['seconds'] if stats['seconds'] else 0
+        lines.append(
+            f"{file_format:<8} {int(stats['files']):>7} {int(stats['failed']):>7} "
+            f"{stats['bytes'] / 2**20:>9.2f} {per_file:>9.1f} {rate:>15.1f}"
+        )
+    for record in failures[:20]:
+        lines.append(f"FAILED {record['path']}: {record['error']}")
+    if len(failures) > 20:
+        lines.append(f"... and {len(failures) - 20} more failures")
+    return "\n".join(lines)
+
+def describe(item: Any) -> str:
+    """One-line text form of a section entry."""
+    if isinstance(item, dict):
+        keys = ('title', 'company', 'degree', 'institution', 'date_range')
+        return ', '.join(str(item[key]) for key in keys if item.get(key))
+    return str(item)
+
+def batch_main(args: argparse.Namespace) -> int:
+    if args.format != 'json':
+        print("Error: batch mode only writes JSON Lines", file=sys.stderr)
+        return 1
+
+    done = load_checkpoint(args.checkpoint)
+    skipped = 0
+
+    def pending_paths() -> Iterator[str]:
+        nonlocal skipped
+        for path in expand_inputs(args.inputs):
+            if path in done:
+                skipped += 1
+            else:
+                yield path
+
+    # Resumed runs append so earlier results are kept
+    mode = 'a' if args.checkpoint else 'w'
+    output = open(args.output, mode) if args.output else sys.stdout
+    checkpoint = open(args.checkpoint, 'a') if args.checkpoint else None
+    records = []
+    started = time.perf_counter()
+    try:
+        for record in run_batch(pending_paths(), args.jobs, args.order == 'input'):
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+            # Failed files are left out so a resumed run retries them
+            if checkpoint and record['ok']:
+                checkpoint.write(record['path'] + "\n")
+                checkpoint.flush()
+            records.append({key: value for key, value in record.items() if key != 'result'})
+    finally:
+        if args.output:
+            output.close()
+        if checkpoint:
+            checkpoint.close()
+
+    print(format_summary(records, time.perf_counter() - started, skipped), file=sys.stderr)
+    return 0 if all(record['ok'] for record in records) else 2
+
+def is_batch(inputs: List[str]) -> bool:
+    return (
+        len(inputs) != 1
+        or inputs[0] == '-'
+        or os.path.isdir(inputs[0])
+        or glob.has_magic(inputs[0])
+    )
+
+def serve_main(args: argparse.Namespace) -> int:
+    from cvparser.server import serve
+
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s %(levelname)s %(name)s: %(message)s')
+    limits = ParseLimits(max_bytes=args.max_bytes)
+    serve(
+        args.host,
+        args.port,
+        workers=args.jobs,
+        queue_depth=args.queue_depth if args.queue_depth is not None else args.jobs * 2,
+        timeout=args.timeout,
+        limits=limits,
+        memory_limit_mb=args.memory_mb,
+    )
+    return 0
+
 def main():
     parser = argparse.ArgumentParser(description='Parse resume files in various formats')
-    parser.add_argument('file', help='Path to the resume file (PDF, DOCX, DOC, or RTF)')
+    parser.add_argument('inputs', nargs='*', metavar='file',
+                        help='Resume file(s) (PDF, DOCX, DOC, or RTF), directories, glob patterns, '
+                             'or - to read paths from stdin')
     parser.add_argument('--output', '-o', help='Output file path (default: stdout)')
     parser.add_argument('--format', '-f', choices=['json', 'text'], default='json',
                         help='Output format (default: json)')
+    parser.add_argument('--jobs', '-j', type=int, default=os.cpu_count() or 1,
+                        help='Worker processes for batch mode (default: CPU count)')
+    parser.add_argument('--order', choices=['completion', 'input'], default='completion',
+                        help='Order of batch results (default: completion)')
+    parser.add_argument('--checkpoint',
+                        help='Batch checkpoint file; files listed in it are skipped and files parsed '
+                             'successfully are appended')
+    serving = parser.add_argument_group('serve mode')
+    serving.add_argument('--serve', action='store_true',
+                         help='Run as an HTTP parse service with --jobs worker processes')
+    serving.add_argument('--host', default='127.0.0.1', help='Address to listen on (default: 127.0.0.1)')
+    serving.add_argument('--port', type=int, default=8080, help='Port to listen on (default: 8080)')
+    serving.add_argument('--queue-depth', type=int,
+                         help='Requests that may wait for a worker before new ones get 429 (default: 2 x jobs)')
+    serving.add_argument('--max-bytes', type=int, default=ParseLimits().max_bytes,
+                         help='Largest accepted file in bytes (default: %(default)s)')
+    serving.add_argument('--timeout', type=float, default=30,
+                         help='Seconds a file may take to parse before its worker is replaced (default: 30)')
+    serving.add_argument('--memory-mb', type=int, default=1024,
+                         help='Memory limit of each worker process in MB, 0 for none (default: 1024)')
     
     args = parser.parse_args()
     
+    if args.serve:
+        return serve_main(args)
+    if not args.inputs:
+        parser.error('at least one file is required unless --serve is given')
+    if is_batch(args.inputs) or args.checkpoint:
+        return batch_main(args)
+    args.file = args.inputs[0]
+    
     # Check if file exists
     if not os.path.exists(args.file):
         print(f"Error: File not found: {args.file}", file=sys.stderr)
@@ -26,7 +286,7 @@ def main():
     
     # Check file extension
     file_extension = args.file.split('.')[-1].lower()
-    supported_formats = ['pdf', 'docx', 'doc', 'rtf']
+    supported_formats = SUPPORTED_FORMATS
     
     if file_extension not in supported_formats:
         print(f"Error: Unsupported file format: {file_extension}", file=sys.stderr)
@@ -53,7 +313,7 @@ def main():
                 if content:
                     output += f"\n{section.upper()}:\n"
                     if isinstance(content, list):
-                        output += "\n".join(f"  - {item}" for item in content)
+                        output += "\n".join(f"  - {describe(item)}" for item in content)
                     else:
                         output += f"  {content}"
                     output += "\n"
@@ -43,7 +43,7 @@ print('Test DOCX file created successfully!')
 "
 
 echo "Installing dependencies..."
-pip install python-docx PyPDF2 striprtf
+(cd .. && pip install -r standalone/requirements.txt)
 
 echo "Testing the parser with the test DOCX file..."
 python3 cv_parser_cli.py test_files/test_resume.docx